@@ -3,6 +3,9 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from Sources.Source import Source
 
+from collections import deque
+from typing import Any
+
 from Components.Component import Component
 
 
@@ -14,10 +17,20 @@ class BinaryInput(Component):
 
     def __init__(self, source: Source, component_id: str, component_address: str):
         self.state = False
+        self.changes = deque()  # Input changes published by the Source that have yet to be checked
+        self.change_time = 0  # Time the most recently checked change arrived at the Source
         super().__init__(source, component_id, component_address)
 
+    def receive(self, value: Any, timestamp: float) -> None:
+        self.changes.append((value, timestamp))
+
     def check(self) -> int:
-        value = self.source.read_component(self.id)
+        if self.source.pushes_inputs():  # Handle the next published change rather than polling the Source
+            if len(self.changes) == 0:
+                return self.NO_CHANGE
+            value, self.change_time = self.changes.popleft()
+        else:
+            value = self.source.read_component(self.id)
         if value == self.state:
             repeat = True
         else:
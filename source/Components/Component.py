@@ -8,6 +8,8 @@ from enum import Enum
 from Sources.Source import Source
 from typing import Any
 
+from Utilities.Clock import Clock
+
 
 class Component:
     __metaclass__ = ABCMeta
@@ -33,6 +35,8 @@ class Component:
             The location of this Component for its Source
         source : Source
             The Source related to this Component
+        clock : Clock
+            The Clock used for timed outputs. Replaced with the Clock of the Task the Component belongs to.
         
         Methods
         -------
@@ -40,6 +44,8 @@ class Component:
             Returns the current state the component is in (no type restrictions)
         get_type()
             Returns the Type of this Component
+        receive(value, timestamp)
+            Handles an input value published by a push-based Source
     """
 
     class Type(Enum):
@@ -55,6 +61,7 @@ class Component:
         self.id = component_id  # The unique identifier for the component or set of related components
         self.address = component_address  # The platform-specific address for the component
         self.source = source  # The source that is used to identify the component
+        self.clock = Clock()  # The source of time for timed outputs
 
     def write(self, msg: Any):
         self.source.write_component(self.id, msg)
@@ -62,6 +69,9 @@ class Component:
     def read(self) -> Any:
         return self.source.read_component(self.id)
 
+    def receive(self, value: Any, timestamp: float) -> None:
+        pass
+
     def initialize(self, metadata: dict) -> None:
         for key in metadata:
             setattr(self, key, metadata[key])
@@ -14,21 +14,32 @@ class OEBinaryInput(BinaryInput):
         self.falling = False
 
     def check(self) -> int:
+        if self.source.pushes_inputs():  # Handle the next published message in the order they arrived
+            if len(self.changes) == 0:
+                return self.NO_CHANGE
+            json_str, self.change_time = self.changes.popleft()
+            return self.transition(json_str)
         json_strs = self.source.read_component(self.id)
-        if len(json_strs) > 0:
-            for json_str in reversed(json_strs):
-                if self.rising and self.falling:
-                    if not self.state and json_str['metaData']['Direction'] == '1' and json_str['data']:
-                        self.state = True
-                        return self.ENTERED
-                    elif self.state and json_str['metaData']['Direction'] == '0' and not json_str['data']:
-                        self.state = False
-                        return self.EXIT
-                else:
-                    if not self.state and json_str['data']:
-                        self.state = True
-                        return self.ENTERED
-                    elif self.state and not json_str['data']:
-                        self.state = False
-                        return self.EXIT
+        for json_str in reversed(json_strs):
+            change = self.transition(json_str)
+            if change != self.NO_CHANGE:
+                return change
+        return self.NO_CHANGE
+
+    def transition(self, json_str: dict) -> int:
+        # Updates the state if the TTL message changes it and returns the corresponding change
+        if self.rising and self.falling:
+            if not self.state and json_str['metaData']['Direction'] == '1' and json_str['data']:
+                self.state = True
+                return self.ENTERED
+            elif self.state and json_str['metaData']['Direction'] == '0' and not json_str['data']:
+                self.state = False
+                return self.EXIT
+        else:
+            if not self.state and json_str['data']:
+                self.state = True
+                return self.ENTERED
+            elif self.state and not json_str['data']:
+                self.state = False
+                return self.EXIT
         return self.NO_CHANGE
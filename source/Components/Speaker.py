@@ -2,7 +2,6 @@ import pygame
 import math
 import numpy
 import threading
-import time
 
 from Components.Component import Component
 
@@ -38,9 +37,9 @@ class Speaker(Component):  # Not implemented
             get_type()
                 Returns Component.Type.DIGITAL_OUTPUT
         """
-    def __init__(self, source, component_id, component_address, metadata=""):
+    def __init__(self, source, component_id, component_address):
         self.state = False
-        super().__init__(source, component_id, component_address, metadata)
+        super().__init__(source, component_id, component_address)
 
     def play_sound(self, frequency, volume, duration):
         th = threading.Thread(target=self._play_sound, args=(frequency, volume, duration))
@@ -70,7 +69,9 @@ class Speaker(Component):  # Not implemented
         play_time = int(duration * 1000)  # Duration in sec, need ms
         self.state = True
         sound.play(loops=-1, maxtime=play_time)  # - 1 = loops forever, max time in ms
-        time.sleep(duration)
+        self.clock.call_later(duration, self.end_sound)
+
+    def end_sound(self):
         self.state = False
 
     def play_sound_file(self, music_file, volume=0.8):
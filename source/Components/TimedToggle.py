@@ -2,7 +2,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from Sources.Source import Source
-import threading
 from typing import Union
 
 from Components.Toggle import Toggle
@@ -29,34 +28,39 @@ class TimedToggle(Toggle):
             Boolean indicating if the toggle is active
         count : int
             Count of the number of times the toggle has been activated
+        timer : Timer
+            Timer that will deactivate the toggle if it was activated for a duration
 
         Methods
         -------
         toggle(dur)
             Activates the toggle for dur seconds
+        end_toggle()
+            Deactivates the toggle
     """
     def __init__(self, source: Source, component_id: str, component_address: str):
         super().__init__(source, component_id, component_address)
         self.count = 0
-        self.event = threading.Event()
+        self.timer = None
 
     def toggle(self, dur: Union[float, bool]) -> None:
         if isinstance(dur, float):
             if not self.state:
-                toggle_thread = threading.Thread(target=lambda: self.toggle_(dur), args=())
-                toggle_thread.start()
+                self.source.write_component(self.id, True)
+                self.state = True
+                self.count += 1
+                self.timer = self.clock.call_later(dur, self.end_toggle)  # Deactivate once the duration has passed
         elif isinstance(dur, bool):
             if not dur:
-                self.event.set()
-                self.event.clear()
+                timer = self.timer
+                if timer is not None:  # End the timed activation early
+                    timer.cancel()
+                    self.end_toggle()
             elif not self.state:
                 self.source.write_component(self.id, True)
                 self.state = True
 
-    def toggle_(self, dur: float) -> None:
-        self.source.write_component(self.id, True)
-        self.state = True
-        self.count += 1
-        self.event.wait(dur)
+    def end_toggle(self) -> None:
+        self.timer = None
         self.source.write_component(self.id, False)
         self.state = False
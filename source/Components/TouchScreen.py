@@ -1,3 +1,5 @@
+from collections import deque
+
 from Components.Component import Component
 
 
@@ -37,6 +39,8 @@ class TouchScreen(Component):
             Indicates to the Source that the display should be refreshed
         get_touches()
             Query the source for recent touches
+        receive(value, timestamp)
+            Stores a touch published by the source
         handle()
             Moves all tuples in touches to handled_touches (handle the touches)
         get_state()
@@ -50,6 +54,7 @@ class TouchScreen(Component):
         self.image_containers = {}
         self.touches = []
         self.handled_touches = []
+        self.changes = deque()
         super().__init__(source, component_id, component_address)
         self.display_size = source.display_size
         self.refresh()
@@ -64,9 +69,16 @@ class TouchScreen(Component):
         self.source.write_component(self.id, self.image_containers)
 
     def get_touches(self):
-        tl = self.source.read_component(self.id)
-        if len(tl) > 0:
-            self.touches.append(*tl)
+        if self.source.pushes_inputs():
+            while len(self.changes) > 0:
+                self.touches.append(self.changes.popleft()[0])
+        else:
+            tl = self.source.read_component(self.id)
+            if len(tl) > 0:
+                self.touches.append(*tl)
+
+    def receive(self, value, timestamp):
+        self.changes.append((value, timestamp))
 
     def handle(self):
         handled = self.touches
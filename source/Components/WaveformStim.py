@@ -10,6 +10,25 @@ from Components.Component import Component
 
 
 class WaveformStim(Stimmer):
+    """
+        Class defining a Stimmer that outputs sampled waveforms through an analog output Source. Each waveform is sent to
+        the Source when it is parametrized so starting a stimulus only requires the parameter set number. Waveforms made
+        of identical periods are sent as a single period to be repeated by the Source.
+
+        Attributes
+        ----------
+        sr : int
+            The sample rate of the waveforms in samples per second
+        configs : dict
+            Links each parameter set number to its complete waveform
+
+        Methods
+        -------
+        parametrize(pnum, _, per, dur, amps, durs)
+            Builds the waveform for parameter set pnum and sends it to the Source
+        start(pnum, stype)
+            Starts the waveform for parameter set pnum
+    """
 
     def __init__(self, source: Source, component_id: str, component_address: str):
         self.state = False
@@ -32,10 +51,20 @@ class WaveformStim(Stimmer):
         for i in range(amps.shape[0]):
             waveforms[i, -1] = 0
         self.configs[pnum] = waveforms
+        # If the waveform repeats every period and ends with its lines off only a single period needs to be uploaded
+        period = math.ceil(per / 1000000 * self.sr)
+        body = waveforms[:, :-1]
+        n = body.shape[1]
+        if 0 < period < n and not np.any(body[:, (n - 1) % period]) and \
+                np.array_equal(body, np.tile(body[:, :period], math.ceil(n / period))[:, :n]):
+            self.source.write_component(self.id, {"pnum": pnum, "waveform": body[:, :period], "samples": n})
+        else:
+            self.source.write_component(self.id, {"pnum": pnum, "waveform": waveforms,
+                                                  "samples": waveforms.shape[1]})
 
     def start(self, pnum: int, stype: str = None) -> None:
         self.state = True  # Ideally make this false when stim is done
-        self.source.write_component(self.id, self.configs[pnum])
+        self.source.write_component(self.id, {"pnum": pnum})
 
     def get_state(self) -> bool:
         return self.state
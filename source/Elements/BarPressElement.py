@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from GUIs.GUI import GUI
     from Components.BinaryInput import BinaryInput
@@ -42,6 +42,9 @@ class BarPressElement(Element):
             pygame.draw.rect(self.screen, Colors.gray,
                              pygame.Rect(self.x + 2, self.y + 2 + 4 * self.h / 6, self.w - 4, self.h / 6), 0)
 
+    def visual_state(self) -> Any:
+        return self.comp.get_state()
+
     def mouse_up(self, event: pygame.event.Event) -> None:
         self.pressed = False
         self.comp.toggle(self.pressed)
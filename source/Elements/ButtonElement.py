@@ -1,10 +1,11 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from GUIs.GUI import GUI
 
 import pygame
 from Elements.Element import Element
+from Elements.render_text import render_text
 from GUIs import Colors
 
 
@@ -37,14 +38,16 @@ class ButtonElement(Element):
         pygame.draw.line(self.screen, (100, 100, 100), self.pt1, self.pt2)
         pygame.draw.line(self.screen, (100, 100, 100), self.pt2, self.pt3)
         # WRITE LABEL
-        my_font = pygame.font.SysFont('arial', self.f_size)
-        msg_in_font = my_font.render(self.text, True, Colors.white)
+        msg_in_font = render_text(self.text, 'arial', self.f_size, Colors.white)
         msg_ht = msg_in_font.get_height()
         msg_wd = msg_in_font.get_width()
         msg_x = (self.rect.width - msg_wd) / 2
         msg_y = (self.rect.height - msg_ht) / 2
         self.screen.blit(msg_in_font, self.rect.move(msg_x, msg_y))
 
+    def visual_state(self) -> Any:
+        return self.text, self.clicked
+
     def mouse_up(self, event: pygame.event.Event) -> None:
         self.clicked = False
 
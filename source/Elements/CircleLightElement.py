@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from GUIs.GUI import GUI
     from Components.Toggle import Toggle
@@ -32,6 +32,9 @@ class CircleLightElement(Element):
         else:
             draw_light(self.screen, self.off_color, (0, 0, 0), self.rect, cx, cy, self.radius)
 
+    def visual_state(self) -> Any:
+        return self.comp.get_state()
+
     def mouse_up(self, event: pygame.event.Event) -> None:
         self.on = not self.on
         self.comp.toggle(self.on)
@@ -4,6 +4,7 @@ if TYPE_CHECKING:
     from GUIs.GUI import GUI
 
 from abc import ABCMeta, abstractmethod
+from typing import Any
 
 import pygame
 
@@ -47,6 +48,8 @@ class Element:
         Calls the relevant Element method if the event is within the bounds of the Element
     draw():
         Draws the Element on screen
+    visual_state():
+        Returns a value that changes whenever the appearance of the Element changes
     """
 
     def __init__(self, tg: GUI, x: int, y: int, rect: pygame.Rect, SF: float = None):
@@ -88,3 +91,8 @@ class Element:
     @abstractmethod
     def draw(self) -> None:
         raise NotImplementedError
+
+    # noinspection PyMethodMayBeStatic
+    def visual_state(self) -> Any:
+        # Elements that return None are treated as changing every frame
+        return None
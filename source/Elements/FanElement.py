@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from GUIs.GUI import GUI
     from Components.Toggle import Toggle
@@ -39,6 +39,9 @@ class FanElement(Element):
         draw_filled_arc(self.screen, (cx - (5 + 35 * sf / 2) / math.sqrt(2), cy + (5 + 35 * sf / 2) / math.sqrt(2)),
                         math.pi, 35 * sf / 2, 5 * math.pi / 4, col)
 
+    def visual_state(self) -> Any:
+        return self.comp.get_state()
+
     def mouse_up(self, event: pygame.event.Event) -> None:
         self.on = not self.on
         self.comp.toggle(self.on)
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from GUIs.GUI import GUI
     from Components.Toggle import Toggle
@@ -41,6 +41,9 @@ class FoodLightElement(Element):
                        pygame.Rect(self.x - self.h / 8, self.y + self.h / 2 - self.h / 8, self.h / 8 * 2,
                                    self.h / 8 * 2), self.x, self.y + self.h / 2, self.h / 8)
 
+    def visual_state(self) -> Any:
+        return self.comp.get_state()
+
     def mouse_up(self, event: pygame.event.Event) -> None:
         self.on = not self.on
         self.comp.toggle(self.on)
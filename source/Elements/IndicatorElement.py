@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from GUIs.GUI import GUI
 
@@ -29,3 +29,6 @@ class IndicatorElement(Element):
             draw_light(self.screen, self.on_color, (0, 0, 0), self.rect, cx, cy, self.radius)
         else:
             draw_light(self.screen, self.off_color, (0, 0, 0), self.rect, cx, cy, self.radius)
+
+    def visual_state(self) -> Any:
+        return self.on()
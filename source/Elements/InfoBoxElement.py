@@ -1,11 +1,12 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from GUIs.GUI import GUI
 
 import pygame
 
 from Elements.Element import Element
+from Elements.render_text import render_text
 
 
 class InfoBoxElement(Element):
@@ -29,6 +30,9 @@ class InfoBoxElement(Element):
     def get_text(self) -> str:
         return self.text
 
+    def visual_state(self) -> Any:
+        return self.label, tuple(self.get_text())
+
     def draw(self) -> None:
         self.text = self.get_text()
         # Draw Box
@@ -37,8 +41,7 @@ class InfoBoxElement(Element):
         txt_color = (0, 0, 0)
 
         # WRITE LABEL
-        my_font = pygame.font.SysFont('arial', self.f_size, bold=True)
-        lbl_in_font = my_font.render(self.label, True, (0, 0, 0))
+        lbl_in_font = render_text(self.label, 'arial', self.f_size, (0, 0, 0), True)
         lbl_ht = lbl_in_font.get_height()
         lbl_wd = lbl_in_font.get_width()
         if self.label_pos == 'BOTTOM':
@@ -59,8 +62,7 @@ class InfoBoxElement(Element):
         # WRITE TEXT
         lines_in_txt = len(self.text)
         if lines_in_txt > 0:  # NOT EMPTY BOX, No info_boxes
-            my_font = pygame.font.SysFont('arial', self.f_size)
-            msg_in_font = my_font.render(self.text[0], True, (0, 0, 0))
+            msg_in_font = render_text(self.text[0], 'arial', self.f_size, (0, 0, 0))
             msg_ht = msg_in_font.get_height()
             msg_wd = msg_in_font.get_width()
 
@@ -71,7 +73,7 @@ class InfoBoxElement(Element):
 
             ln_count = 0
             for line in self.text:
-                msg_in_font = my_font.render(line, True, txt_color)
+                msg_in_font = render_text(line, 'arial', self.f_size, txt_color)
                 msg_y = ln_count * msg_ht - 2 * self.SF
                 self.screen.blit(msg_in_font, self.rect.move(msg_x,  msg_y+1))
                 ln_count += 1
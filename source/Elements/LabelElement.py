@@ -1,11 +1,12 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from GUIs.GUI import GUI
 
 import pygame
 
 from Elements.Element import Element
+from Elements.render_text import render_text
 
 
 class LabelElement(Element):
@@ -40,6 +41,8 @@ class LabelElement(Element):
     -------
     draw():
         Draws the label on screen
+    visual_state():
+        Returns the text of the label
      """
 
     def __init__(self, tg: GUI, x: int, y: int, w: int, h: int, text: str, f_size: int = 20, SF: float = None):
@@ -49,9 +52,11 @@ class LabelElement(Element):
 
     def draw(self) -> None:
         txt_color = (255, 255, 255)  # Font color, could be made a parameter in the future
-        msg_font = pygame.font.SysFont('arial', self.f_size)
-        msg_in_font = msg_font.render(self.text, True, txt_color)  # Create the font object
+        msg_in_font = render_text(self.text, 'arial', self.f_size, txt_color)  # Rendered text is cached until it changes
         msg_ht = msg_in_font.get_height()  # Position the label to the left of its containing rectangle
         msg_x = 0
         msg_y = (self.rect.height - msg_ht)/2
         self.screen.blit(msg_in_font, self.rect.move(msg_x,  msg_y+1))  # Draw the label
+
+    def visual_state(self) -> Any:
+        return self.text
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from GUIs.GUI import GUI
     from Components.BinaryInput import BinaryInput
@@ -16,6 +16,7 @@ class NosePokeElement(Element):
         self.radius = int(self.SF * radius)
         self.entered = comp.get_state()
         self.comp = comp
+        self.highlight = None
 
     def draw(self) -> None:
         cx = self.x + self.radius  # center x
@@ -23,17 +24,23 @@ class NosePokeElement(Element):
         self.entered = self.comp.get_state()
 
         pygame.draw.circle(self.screen, Colors.lightgray, (cx, cy), self.radius, 0)  # MAIN BULB
-        surf1 = pygame.Surface((500, 990), pygame.SRCALPHA)
-        surf2 = pygame.Surface((500, 990), pygame.SRCALPHA)
-        pygame.draw.circle(surf1, Colors.darkgray, (cx, cy), self.radius)
-        pygame.draw.circle(surf2, Colors.darkgray, (cx + self.radius / 2, cy - self.radius / 2), self.radius)
-        surf1.blit(surf2, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
-        self.screen.blit(surf1, (0, 0))
+        if self.highlight is None:  # The highlight only depends on the size of the nose poke so render it once
+            d = 2 * self.radius + 2
+            surf1 = pygame.Surface((d, d), pygame.SRCALPHA)
+            surf2 = pygame.Surface((d, d), pygame.SRCALPHA)
+            pygame.draw.circle(surf1, Colors.darkgray, (self.radius + 1, self.radius + 1), self.radius)
+            pygame.draw.circle(surf2, Colors.darkgray, (self.radius + 1 + self.radius / 2, self.radius + 1 - self.radius / 2), self.radius)
+            surf1.blit(surf2, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
+            self.highlight = surf1
+        self.screen.blit(self.highlight, (cx - self.radius - 1, cy - self.radius - 1))
         pygame.draw.circle(self.screen, Colors.black, (cx, cy), self.radius + 2, 3)  # Black circle
 
         if self.entered:
             pygame.draw.polygon(self.screen, Colors.black, [(cx, cy), (cx - self.radius / 2, cy + self.radius), (cx + self.radius / 2, cy + self.radius)])
 
+    def visual_state(self) -> Any:
+        return self.comp.get_state()
+
     def mouse_up(self, event: pygame.event.Event) -> None:
         self.entered = False
         self.comp.toggle(self.entered)
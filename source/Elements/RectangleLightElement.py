@@ -36,6 +36,9 @@ class RectangleLightElement(Element):  # Not implemented
             pygame.draw.rect(self.screen, shadow_color, [self.x, self.y + self.h - shadow_h, self.w, shadow_h], 0)
             pygame.draw.rect(self.screen, shadow_color, [self.x, self.y, shadow_w, self.h], 0)
 
+    def visual_state(self):
+        return self.lc.get_state()
+
     def mouse_up(self, event):
         self.on = not self.on
         self.lc.toggle(self.on)
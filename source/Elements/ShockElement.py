@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from GUIs.GUI import GUI
     from Components.Toggle import Toggle
@@ -44,6 +44,9 @@ class ShockElement(Element):
         pygame.draw.polygon(self.screen, (0, 0, 0), ptlist, 1)  # top white line
         pygame.draw.circle(self.screen, col, (cx, cy), self.radius, 2)
 
+    def visual_state(self) -> Any:
+        return self.comp.get_state()
+
     def mouse_up(self, event: pygame.event.Event) -> None:
         self.on = not self.on
         self.comp.toggle(self.on)
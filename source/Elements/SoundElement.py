@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from GUIs.GUI import GUI
     from Components.Toggle import Toggle
@@ -39,3 +39,6 @@ class SoundElement(Element):
         for c in range(4):
             pygame.draw.circle(self.screen, col, (cx - 23 * sf + incr, cy + 15 * sf), 5 * sf, 1)
             incr += 15 * sf
+
+    def visual_state(self) -> Any:
+        return self.comp.get_state()
@@ -1,6 +1,9 @@
+import os
+
 import pygame as pygame
 
 from Elements.Element import Element
+from Elements.load_image import load_image
 from GUIs import Colors
 
 
@@ -13,19 +16,38 @@ class TouchScreenElement(Element):  # Not implemented
         self.active_rect = active_rect
         self.sf = w / tsc.display_size[0]
         self.tsc = tsc
+        self.loaded = set()  # Paths of the images that were on the screen when it was last checked
+        self.load_images()
+
+    def preload(self, paths, dim):
+        # Decode and scale images the Task may show later so they are not read from disk when they are added
+        for path in paths:
+            if os.path.isfile(path):
+                load_image(path, (dim[0] * self.sf, dim[1] * self.sf), True)
+
+    def load_images(self):
+        # Load images as they are added to the screen, reloading them if their files have changed
+        if self.tsc.image_containers.keys() != self.loaded:
+            for ic in self.tsc.image_containers.keys() - self.loaded:
+                load_image(ic, (self.tsc.image_containers[ic]["dim"][0] * self.sf, self.tsc.image_containers[ic]["dim"][1] * self.sf), True)
+            self.loaded = set(self.tsc.image_containers)
 
     def draw(self):
         pygame.draw.rect(self.screen, Colors.darkgray, self.rect, 0)
         pygame.draw.rect(self.screen, Colors.black, self.active_rect, 0)
+        self.load_images()
         for ic in self.tsc.image_containers.keys():
-            img = pygame.image.load(ic)
-            img = pygame.transform.scale(img, (self.tsc.image_containers[ic]["dim"][0] * self.sf, self.tsc.image_containers[ic]["dim"][1] * self.sf))
+            img = load_image(ic, (self.tsc.image_containers[ic]["dim"][0] * self.sf, self.tsc.image_containers[ic]["dim"][1] * self.sf))
             img_rect = img.get_rect()
             coords = self.tsc.image_containers[ic]["coords"]
             img_rect = img_rect.move((coords[0] * self.sf, coords[1] * self.sf))
             self.screen.blit(img, img_rect)
         pygame.draw.rect(self.screen, Colors.black, self.rect, 3)
 
+    def visual_state(self):
+        self.load_images()
+        return tuple((ic, tuple(c["coords"]), tuple(c["dim"])) for ic, c in self.tsc.image_containers.items())
+
     def draw_plus_sign(self, coords, w, color):
         x = coords[0]
         y = coords[1]
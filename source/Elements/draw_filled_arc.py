@@ -1,7 +1,22 @@
-import math
+from functools import lru_cache
+
+import numpy as np
 import pygame
 
 
+@lru_cache(maxsize=256)
+def arc_points(center: tuple[float, float], arc_angle: float, r: float, init_angle: float, ns: int = 100) -> tuple[tuple[float, float], ...]:
+    """
+    Returns the vertices of the polygon for a filled circular segment. Points are cached as Elements draw the same
+    segments every frame.
+    """
+    angles = init_angle + arc_angle / ns * np.arange(ns)
+    # Offsets are truncated to integers before being added to the center
+    x = center[0] + np.trunc(r * np.cos(angles))
+    y = center[1] - np.trunc(r * np.sin(angles))
+    return (center, *zip(x.tolist(), y.tolist()), center)
+
+
 def draw_filled_arc(screen: pygame.Surface, center: tuple[int, int], arc_angle: float, r: float, init_angle: float, col: tuple[int, int, int], ns: int = 100) -> None:
     """
     Draws an object on the screen corresponding to a filled circular segment
@@ -23,11 +38,4 @@ def draw_filled_arc(screen: pygame.Surface, center: tuple[int, int], arc_angle:
     ns : int
         Number of points used to draw arc
     """
-    p = [center]
-    # Get points on arc
-    for n in range(ns):
-        x = center[0] + int(r * math.cos(init_angle + arc_angle / ns * n))
-        y = center[1] - int(r * math.sin(init_angle + arc_angle / ns * n))
-        p.append((x, y))
-    p.append(center)
-    pygame.draw.polygon(screen, col, p)
+    pygame.draw.polygon(screen, col, arc_points(tuple(center), arc_angle, r, init_angle, ns))
@@ -1,10 +1,40 @@
+from functools import lru_cache
 import math
 import pygame
 
 
+@lru_cache(maxsize=256)
+def light_sprite(color: tuple[int, int, int], line_color: tuple[int, int, int], rect: tuple[int, int, int, int], cx: float, cy: float, radius: float) -> tuple[pygame.Surface, tuple[int, int]]:
+    """
+    Renders a light onto a transparent Surface. Returns the Surface and the position it should be drawn at.
+    """
+    # The sprite covers the light, its border, and the shadow rect
+    left = math.floor(min(cx - radius - 1, rect[0]))
+    top = math.floor(min(cy - radius - 1, rect[1]))
+    right = math.ceil(max(cx + radius + 1, rect[0] + rect[2]))
+    bottom = math.ceil(max(cy + radius + 1, rect[1] + rect[3]))
+    sprite = pygame.Surface((right - left + 1, bottom - top + 1), pygame.SRCALPHA)
+    # Shift all coordinates by whole pixels so the light is drawn exactly as it would be on screen
+    cx -= left
+    cy -= top
+    pygame.draw.circle(sprite, color, (cx, cy), radius, 0)  # The main bulb
+    pygame.draw.circle(sprite, (200, 200, 200), (cx + int(.5 * radius), cy - int(.5 * radius)),
+                       int(.1 * radius), 0)  # Sparkle
+    shadow_color = (int(color[0] * .8), int(color[1] * .8), int(color[2] * .8))  # Color of light's shadow
+    shadow_w = int(0.5 * radius)  # The radius of the shadow arc
+    if shadow_w > 15:
+        shadow_w = 15
+    shadow_rect = pygame.Rect(rect[0] - left, rect[1] - top, rect[2], rect[3])
+    pygame.draw.arc(sprite, shadow_color, shadow_rect, 190 * math.pi / 180, 270 * math.pi / 180,
+                    shadow_w)  # Light shadow
+    pygame.draw.circle(sprite, line_color, (cx, cy), radius, 2)  # Light border
+    return sprite, (left, top)
+
+
 def draw_light(screen: pygame.Surface, color: tuple[int, int, int], line_color: tuple[int, int, int], rect: pygame.Rect, cx: int, cy: int, radius: float) -> None:
     """
-    Draws an object on the screen corresponding to a light
+    Draws an object on the screen corresponding to a light. Lights are rendered once for each color, position, and size
+    and then copied to the screen.
 
     Parameters
     ----------
@@ -23,14 +53,5 @@ def draw_light(screen: pygame.Surface, color: tuple[int, int, int], line_color:
     radius : int
         Integer indicating the radius of the light
     """
-    pygame.draw.circle(screen, color, (cx, cy), radius, 0)  # The main bulb
-    pygame.draw.circle(screen, (200, 200, 200), (cx + int(.5 * radius), cy - int(.5 * radius)),
-                       int(.1 * radius), 0)  # Sparkle
-    shadow_color = (int(color[0] * .8), int(color[1] * .8), int(color[2] * .8))  # Color of light's shadow
-    shadow_w = int(0.5 * radius)  # The radius of the shadow arc
-    if shadow_w > 15:
-        shadow_w = 15
-    shadow_rect = rect
-    pygame.draw.arc(screen, shadow_color, shadow_rect, 190 * math.pi / 180, 270 * math.pi / 180,
-                    shadow_w)  # Light shadow
-    pygame.draw.circle(screen, line_color, (cx, cy), radius, 2)  # Light border
+    sprite, position = light_sprite(tuple(color), tuple(line_color), tuple(rect), cx, cy, radius)
+    screen.blit(sprite, position)
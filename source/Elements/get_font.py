@@ -0,0 +1,20 @@
+from functools import lru_cache
+
+import pygame
+
+
+@lru_cache(maxsize=None)
+def get_font(family: str, size: int, bold: bool = False) -> pygame.font.Font:
+    """
+    Returns a shared pygame Font so system fonts are only looked up once for each family, size, and weight
+
+    Parameters
+    ----------
+    family : str
+        The name of the system font
+    size : int
+        The font size
+    bold : bool
+        Boolean indicating if the font should be bold
+    """
+    return pygame.font.SysFont(family, size, bold=bold)
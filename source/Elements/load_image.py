@@ -0,0 +1,69 @@
+import os
+import threading
+from collections import OrderedDict
+
+import pygame
+
+MAX_IMAGES = 128  # Maximum number of decoded and scaled images kept in memory
+_images = OrderedDict()
+_lock = threading.Lock()
+
+
+def load_image(path: str, size: tuple[int, int] = None, check: bool = False) -> pygame.Surface:
+    """
+    Returns the image at path scaled to size. Decoded and scaled images are cached using the path and size so images are
+    only read from disk the first time they are loaded. The least recently used images are evicted once more than
+    MAX_IMAGES are cached. Returned Surfaces are shared and should not be modified by the caller.
+
+    Parameters
+    ----------
+    path : str
+        The path to the image file
+    size : tuple
+        The width and height the image should be scaled to. The image is returned at its original size if None.
+    check : bool
+        Indicates if the cached images should be reloaded when the file has been modified since it was loaded. Should be
+        used when an image is added to a display rather than on every draw.
+    """
+    key = (path, None if size is None else (int(size[0]), int(size[1])))
+    if check:
+        with _lock:
+            mtime = _images[key][1] if key in _images else _images[(path, None)][1] if (path, None) in _images else None
+        if mtime is not None and os.path.getmtime(path) != mtime:
+            invalidate_image(path)
+    with _lock:
+        if key in _images:
+            _images.move_to_end(key)
+            return _images[key][0]
+    if size is None:
+        mtime = os.path.getmtime(path)
+        img = pygame.image.load(path)
+        if pygame.display.get_surface() is not None:  # Converting requires a display mode to be set
+            img = img.convert_alpha() if img.get_alpha() is not None else img.convert()
+    else:
+        img = pygame.transform.scale(load_image(path), key[1])
+        with _lock:
+            mtime = _images[(path, None)][1] if (path, None) in _images else os.path.getmtime(path)
+    with _lock:
+        _images[key] = (img, mtime)
+        while len(_images) > MAX_IMAGES:
+            _images.popitem(last=False)
+    return img
+
+
+def invalidate_image(path: str = None) -> None:
+    """
+    Removes cached images so they are read from disk the next time they are drawn.
+
+    Parameters
+    ----------
+    path : str
+        The path to the image file whose cached images should be removed. If None, every cached image whose file has
+        been modified since it was loaded is removed.
+    """
+    with _lock:
+        for key in list(_images):
+            if path is not None and key[0] == path:
+                del _images[key]
+            elif path is None and (not os.path.exists(key[0]) or os.path.getmtime(key[0]) != _images[key][1]):
+                del _images[key]
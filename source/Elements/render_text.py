@@ -0,0 +1,27 @@
+from functools import lru_cache
+
+import pygame
+
+from Elements.get_font import get_font
+
+
+@lru_cache(maxsize=1024)
+def render_text(text: str, family: str, size: int, color: tuple[int, int, int], bold: bool = False) -> pygame.Surface:
+    """
+    Returns an antialiased Surface containing the text. Surfaces are cached so unchanged text is only rendered once and
+    should not be modified by the caller.
+
+    Parameters
+    ----------
+    text : str
+        The text to render
+    family : str
+        The name of the system font
+    size : int
+        The font size
+    color : tuple
+        Three element tuple corresponding to the color of the text
+    bold : bool
+        Boolean indicating if the font should be bold
+    """
+    return get_font(family, size, bold).render(text, True, color)
@@ -22,28 +22,28 @@ class CSVEventLogger(FileEventLogger):
     def start(self) -> None:
         super(CSVEventLogger, self).start()
         # self.log_file.write("Subject,{}".format(self.task.))
-        self.log_file.write("Trial,Time,Type,Code,State,Metadata\n")
+        self.write("Trial,Time,Type,Code,State,Metadata\n")
 
     def log_events(self, events: list[Event]) -> None:
+        # Format all rows before buffering them with a single write
+        rows = []
         for e in events:
             self.event_count += 1
             if isinstance(e, InitialStateEvent):
-                self.log_file.write("{},{},Entry,{},{},{}\n".format(self.event_count, e.entry_time,
-                                                                    e.initial_state.value, e.initial_state.name,
-                                                                    str(e.metadata)))
+                rows.append("{},{},Entry,{},{},{}\n".format(self.event_count, e.entry_time, e.initial_state.value,
+                                                            e.initial_state.name, str(e.metadata)))
             elif isinstance(e, FinalStateEvent):
-                self.log_file.write("{},{},Exit,{},{},{}\n".format(self.event_count, e.entry_time,
-                                                                   e.final_state.value, e.final_state.name,
-                                                                   str(e.metadata)))
+                rows.append("{},{},Exit,{},{},{}\n".format(self.event_count, e.entry_time, e.final_state.value,
+                                                           e.final_state.name, str(e.metadata)))
             elif isinstance(e, StateChangeEvent):
-                self.log_file.write("{},{},Exit,{},{},{}\n".format(self.event_count, e.entry_time,
-                                                                   e.initial_state.value, e.initial_state.name,
-                                                                   dictionary_to_save_string(e.metadata)))
+                rows.append("{},{},Exit,{},{},{}\n{},{},Entry,{},{},{}\n".format(
+                    self.event_count, e.entry_time, e.initial_state.value, e.initial_state.name,
+                    dictionary_to_save_string(e.metadata), self.event_count + 1, e.entry_time, e.new_state.value,
+                    e.new_state.name, None))
                 self.event_count += 1
-                self.log_file.write("{},{},Entry,{},{},{}\n".format(self.event_count, e.entry_time,
-                                                                    e.new_state.value, e.new_state.name, None))
             elif isinstance(e, InputEvent):
-                self.log_file.write("{},{},Input,{},{},{}\n".format(self.event_count, e.entry_time,
-                                                                    e.input_event.value, e.input_event.name,
-                                                                    dictionary_to_save_string(e.metadata)))
+                rows.append("{},{},Input,{},{},{}\n".format(self.event_count, e.entry_time, e.input_event.value,
+                                                            e.input_event.name, dictionary_to_save_string(e.metadata)))
+        if len(rows) > 0:
+            self.write("".join(rows))
         super().log_events(events)
@@ -8,17 +8,19 @@ from typing import Any
 
 class Event:
     """
-        Simple class defining the base requirements for a Task Event.
+        Simple class defining the base requirements for a Task Event. Events only store the time they occurred relative
+        to the start of the Task rather than a reference to the Task so they remain small and can be sent between
+        processes.
 
         Attributes
         ----------
-        task : Task
-            Task the event corresponds to
+        entry_time : float
+            The time in seconds since the Task started when the Event occurred
         metadata : Object
             Any metadata related to the Event
     """
+    __slots__ = ("entry_time", "metadata")
 
     def __init__(self, task: Task, metadata: Any = None):
-        self.task = task
         self.entry_time = task.cur_time - task.start_time
         self.metadata = metadata
@@ -20,6 +20,8 @@ class EventLogger:
         Closes the event logger
     log_events(events)
         Handle each event in the input Event list
+    flush()
+        Writes out any events the logger has buffered
     """
 
     def __init__(self):
@@ -32,6 +34,9 @@ class EventLogger:
     def close(self) -> None:
         pass
 
+    def flush(self) -> None:
+        pass
+
     def log_event(self, events: list[Event]) -> None:
         pass
 
@@ -7,29 +7,58 @@ from abc import ABCMeta, abstractmethod
 
 from Events.EventLogger import EventLogger
 import os
+import time
+from typing import Any
 
 
 class FileEventLogger(EventLogger):
     __metaclass__ = ABCMeta
     """
-    Abstract class defining the base requirements for an EventLogger that logs Event objects to a file on disk.
+    Abstract class defining the base requirements for an EventLogger that logs Event objects to a file on disk. Text is
+    buffered in memory and only written to the file once enough time has passed or enough text has accumulated.
+
+    Parameters
+    ----------
+    output_folder : str
+        The folder the file will be saved in
+    flush_interval : float
+        The maximum time in seconds text is buffered before it is written to the file
+    flush_size : int
+        The maximum number of characters buffered before they are written to the file
+    fsync_interval : float
+        The time in seconds between requests for the operating system to commit the file to disk. Disabled if 0.
 
     Methods
     -------
     start()
         Opens the file
     close()
-        Closes the file
+        Writes any buffered text and closes the file
     log_events(events)
         Handle saving of each Event in the input list to the file
     get_file_path()
-        Returns the 
+        Returns the path of the file
+    open_file(path)
+        Opens the file at path and returns it
+    write(text)
+        Buffers text to be written to the file
+    flush(sync)
+        Writes any buffered text to the file and optionally commits the file to disk
     """
 
-    def __init__(self, output_folder: str = None):
+    def __init__(self, output_folder: str = None, flush_interval: float = 0.25, flush_size: int = 65536,
+                 fsync_interval: float = 0):
         super().__init__()
         self.output_folder = output_folder
+        # Parameters may be provided as strings from a configuration
+        self.flush_interval = float(flush_interval)
+        self.flush_size = int(flush_size)
+        self.fsync_interval = float(fsync_interval)
         self.log_file = None
+        self.buffer = []
+        self.buffered = 0
+        self.last_flush = 0
+        self.last_fsync = 0
 
     @abstractmethod
     def get_file_path(self) -> str:
@@ -37,14 +66,41 @@ class FileEventLogger(EventLogger):
 
     @abstractmethod
     def log_events(self, events: list[Event]) -> None:
+        if self.buffered >= self.flush_size or \
+                (self.buffered > 0 and time.perf_counter() - self.last_flush >= self.flush_interval):
+            self.flush()
+
+    def open_file(self, path: str) -> Any:
+        return open(path, "w")
+
+    def write(self, text: str) -> None:
+        self.buffer.append(text)
+        self.buffered += len(text)
+
+    def flush(self, sync: bool = False) -> None:
+        if self.log_file is None or self.log_file.closed:
+            return
+        if self.buffered > 0:
+            self.log_file.write("".join(self.buffer))
+            self.buffer.clear()
+            self.buffered = 0
         self.log_file.flush()
+        now = time.perf_counter()
+        self.last_flush = now
+        if sync or (self.fsync_interval > 0 and now - self.last_fsync >= self.fsync_interval):
+            os.fsync(self.log_file.fileno())
+            self.last_fsync = now
 
     def start(self) -> None:
         super(FileEventLogger, self).start()
         if not os.path.exists(self.output_folder):
             os.makedirs(self.output_folder)
-        self.log_file = open(self.get_file_path(), "w")
+        self.buffer.clear()
+        self.buffered = 0
+        self.last_flush = self.last_fsync = time.perf_counter()
+        self.log_file = self.open_file(self.get_file_path())
 
     def close(self) -> None:
         if self.log_file is not None:
+            self.flush(self.fsync_interval > 0)
             self.log_file.close()
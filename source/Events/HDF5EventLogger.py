@@ -0,0 +1,132 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from Events.Event import Event
+
+import math
+import os
+import time
+from typing import Any
+
+import h5py
+
+from Events.FileEventLogger import FileEventLogger
+from Events.InitialStateEvent import InitialStateEvent
+from Events.InputEvent import InputEvent
+from Events.StateChangeEvent import StateChangeEvent
+from Events.FinalStateEvent import FinalStateEvent
+from Utilities.dictionary_to_save_string import dictionary_to_save_string
+
+# Values of the type column
+EVENT_TYPES = ("Entry", "Exit", "Input")
+ENTRY, EXIT, INPUT = range(len(EVENT_TYPES))
+
+# Data type of each column in the events table
+COLUMNS = {"trial": "int64", "time": "float64", "type": "uint8", "code": "int32"}
+
+
+class HDF5EventLogger(FileEventLogger):
+    """
+    FileEventLogger that saves Events to an HDF5 file as typed columns rather than text so sessions can be loaded
+    without parsing. Rows have the same meaning as those saved by CSVEventLogger. The events group holds the trial,
+    time, type, and code columns in chunked datasets that grow as Events are logged. The names group maps each type
+    and code to the name of the state or input and the metadata group holds the metadata of any row that has it as
+    text alongside its trial. Files can be loaded with read_hdf5_events.
+
+    Parameters
+    ----------
+    output_folder : str
+        The folder the file will be saved in
+    flush_interval : float
+        The maximum time in seconds rows are buffered before they are written to the file
+    flush_size : int
+        The maximum number of rows buffered before they are written to the file
+    fsync_interval : float
+        The time in seconds between requests for the operating system to commit the file to disk. Disabled if 0.
+    chunk_size : int
+        The number of rows in each chunk of the datasets
+    """
+
+    def __init__(self, output_folder: str = None, flush_interval: float = 0.25, flush_size: int = 65536,
+                 fsync_interval: float = 0, chunk_size: int = 4096):
+        super().__init__(output_folder, flush_interval, flush_size, fsync_interval)
+        self.chunk_size = int(chunk_size)
+        self.columns = {name: [] for name in COLUMNS}
+        self.metadata = {"trial": [], "value": []}
+        self.names = {"type": [], "code": [], "name": []}
+        self.named = set()
+
+    def get_file_path(self) -> str:
+        return "{}{}.h5".format(self.output_folder, math.floor(time.time() * 1000))
+
+    def open_file(self, path: str) -> Any:
+        log_file = h5py.File(path, "w")
+        log_file.attrs["event_types"] = list(EVENT_TYPES)
+        for name, dtype in COLUMNS.items():
+            self.create_column(log_file, "events/" + name, dtype)
+        self.create_column(log_file, "metadata/trial", "int64")
+        self.create_column(log_file, "metadata/value", h5py.string_dtype())
+        self.create_column(log_file, "names/type", "uint8")
+        self.create_column(log_file, "names/code", "int32")
+        self.create_column(log_file, "names/name", h5py.string_dtype())
+        return log_file
+
+    def create_column(self, log_file: h5py.File, name: str, dtype: Any) -> None:
+        log_file.create_dataset(name, (0,), dtype, maxshape=(None,), chunks=(self.chunk_size,))
+
+    def start(self) -> None:
+        for column in (*self.columns.values(), *self.metadata.values(), *self.names.values()):
+            column.clear()
+        self.named.clear()
+        super(HDF5EventLogger, self).start()
+
+    def add_row(self, event_type: int, code: int, name: str, entry_time: float, metadata: Any = None) -> None:
+        self.columns["trial"].append(self.event_count)
+        self.columns["time"].append(entry_time)
+        self.columns["type"].append(event_type)
+        self.columns["code"].append(code)
+        if (event_type, code) not in self.named:
+            self.named.add((event_type, code))
+            self.names["type"].append(event_type)
+            self.names["code"].append(code)
+            self.names["name"].append(name)
+        if metadata is not None:
+            self.metadata["trial"].append(self.event_count)
+            self.metadata["value"].append(dictionary_to_save_string(metadata) if isinstance(metadata, dict)
+                                          else str(metadata))
+        self.buffered += 1
+
+    def log_events(self, events: list[Event]) -> None:
+        for e in events:
+            self.event_count += 1
+            if isinstance(e, InitialStateEvent):
+                self.add_row(ENTRY, e.initial_state.value, e.initial_state.name, e.entry_time, e.metadata)
+            elif isinstance(e, FinalStateEvent):
+                self.add_row(EXIT, e.final_state.value, e.final_state.name, e.entry_time, e.metadata)
+            elif isinstance(e, StateChangeEvent):
+                self.add_row(EXIT, e.initial_state.value, e.initial_state.name, e.entry_time, e.metadata)
+                self.event_count += 1
+                self.add_row(ENTRY, e.new_state.value, e.new_state.name, e.entry_time)
+            elif isinstance(e, InputEvent):
+                self.add_row(INPUT, e.input_event.value, e.input_event.name, e.entry_time, e.metadata)
+        super().log_events(events)
+
+    def flush(self, sync: bool = False) -> None:
+        if self.log_file is None or not self.log_file:  # h5py Files evaluate to False once closed
+            return
+        if self.buffered > 0:
+            for group, columns in (("events", self.columns), ("metadata", self.metadata), ("names", self.names)):
+                for name, values in columns.items():
+                    if len(values) > 0:
+                        # Grow the dataset and write the buffered values to the new rows
+                        dataset = self.log_file[group + "/" + name]
+                        dataset.resize((dataset.shape[0] + len(values),))
+                        dataset[-len(values):] = values
+                        values.clear()
+            self.buffered = 0
+        self.log_file.flush()
+        now = time.perf_counter()
+        self.last_flush = now
+        if sync or (self.fsync_interval > 0 and now - self.last_fsync >= self.fsync_interval):
+            os.fsync(self.log_file.id.get_vfd_handle())
+            self.last_fsync = now
@@ -17,6 +17,8 @@ class InitialStateEvent(Event):
         initial_state : Enum
             Enumerated variable representing the initial state
     """
+    __slots__ = ("initial_state",)
+
     def __init__(self, task: Task, initial_state: Enum, metadata: Any = None):
         super().__init__(task, metadata)
         self.initial_state = initial_state
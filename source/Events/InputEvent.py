@@ -17,6 +17,7 @@ class InputEvent(Event):
         input_event : Enum
             Enumerated variable representing the type of input
     """
+    __slots__ = ("input_event",)
 
     def __init__(self, task: Task, input_event: Enum, metadata: Any = None):
         super().__init__(task, metadata)
@@ -8,6 +8,8 @@ from typing import Any
 
 
 class OEEvent(Event):
+    __slots__ = ("event_type",)
+
     def __init__(self, task: Task, event_type: str, metadata: Any = None):
         super().__init__(task, metadata)
         self.event_type = event_type
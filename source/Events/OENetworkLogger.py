@@ -4,8 +4,10 @@ if TYPE_CHECKING:
     from Events.Event import Event
 
 import zmq
+from collections import deque
 from datetime import datetime
 import os
+import threading
 import time
 
 from Events.GUIEventLogger import GUIEventLogger
@@ -14,6 +16,8 @@ from Events.StateChangeEvent import StateChangeEvent
 from Events.InitialStateEvent import InitialStateEvent
 from Events.FinalStateEvent import FinalStateEvent
 from Events.OEEvent import OEEvent
+from Utilities.TimingHistogram import TimingHistogram
+from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import *
 from PyQt5.QtGui import *
 
@@ -22,15 +26,45 @@ from Workstation.IconButton import IconButton
 
 
 class OENetworkLogger(GUIEventLogger):
+    """
+    GUIEventLogger that controls acquisition and recording in Open Ephys and sends Events to it as network events.
 
-    def __init__(self, address: str, port: str, nbits: int = 8):
+    Parameters
+    ----------
+    address : str
+        The IP address of the computer running Open Ephys
+    port : str
+        The port of the Open Ephys network events plugin
+    nbits : int
+        The number of TTL lines used for event codes
+    pulse_width : float
+        The time in seconds the TTL lines of an event code are held on
+    timeout : float
+        The time in seconds to wait for Open Ephys to reply to each message before counting it as failed
+
+    Methods
+    -------
+    send_ttl_event_code(ec)
+        Queues an event code to be sent on the TTL lines
+    strobe_summary()
+        Returns a short text description of the event code latency
+    send_string(msg, control)
+        Queues a message to be sent to Open Ephys
+    """
+
+    def __init__(self, address: str, port: str, nbits: int = 8, pulse_width: float = 0.005, timeout: float = 1):
         super().__init__()
-        context = zmq.Context()
+        self.context = zmq.Context()
         self.event_count = 0
-        self.socket = context.socket(zmq.REQ)
-        self.socket.set(zmq.REQ_RELAXED, True)
-        self.socket.connect("tcp://" + address + ":" + str(port))
-        self.nbits = nbits
+        # Parameters may be provided as strings from a configuration
+        self.nbits = int(nbits)
+        # Messages are sent and their replies received by a separate thread so the GUI never waits for Open Ephys
+        self.connection = OEConnectionThread(self.context, "tcp://" + address + ":" + str(port), float(timeout))
+        self.connection.start()
+        # Event codes are sent from a separate thread and socket so the Task loop never waits for Open Ephys
+        self.strobe = TTLStrobeThread(self.context, "tcp://" + address + ":" + str(port), self.nbits,
+                                      float(pulse_width), float(timeout))
+        self.strobe.start()
 
         self.oe_group = QGroupBox('Open Ephys')
         oe_group_layout = QHBoxLayout(self.oe_group)
@@ -67,6 +101,8 @@ class OENetworkLogger(GUIEventLogger):
         app_layout.addWidget(self.app)
         oe_text_layout.addWidget(app_box)
         oe_rec_layout.addLayout(oe_text_layout)
+        self.status = QLabel("")
+        oe_rec_layout.addWidget(self.status)
         oe_group_layout.addLayout(oe_rec_layout)
 
         self.acq_button = IconButton('Workstation/icons/play.svg', 'Workstation/icons/play_hover.svg')
@@ -82,6 +118,10 @@ class OENetworkLogger(GUIEventLogger):
         self.acq = False
         self.rec = False
 
+        self.status_timer = QTimer(self.oe_group)
+        self.status_timer.timeout.connect(self.update_status)
+        self.status_timer.start(1000)
+
     def set_chamber(self, cw: ChamberWidget) -> None:
         super(OENetworkLogger, self).set_chamber(cw)
         desktop = os.path.join(os.path.join(os.path.expanduser('~')), 'Desktop')
@@ -136,47 +176,31 @@ class OENetworkLogger(GUIEventLogger):
             self.rec_dir.setText(file_name)
 
     def send_ttl_event_code(self, ec: int) -> None:
-        # Convert the code to binary
-        bc = [int(x) for x in bin(ec)[2:]]
-        bc.reverse()
-        # Activate the TTL channels according to the bit sequence
-        for i in range(len(bc)):
-            self.socket.send(
-                b"".join([b'TTL Channel=', str(i + 1).encode('ascii'), b' on=', str(bc[i]).encode('ascii')]))
-            self.receive()
-        # Deactivate remaining TTL channels
-        for i in range(self.nbits - len(bc)):
-            self.socket.send(b"".join([b'TTL Channel=', str(i + len(bc) + 1).encode('ascii'), b' on=0']))
-            self.receive()
-        # Wait and send TTL OFF on all channels
-        time.sleep(0.005)
-        for i in range(self.nbits):
-            self.socket.send(b"".join([b'TTL Channel=', str(i + 1).encode('ascii'), b' on=0']))
-            self.receive()
-
-    def send_string(self, msg: str) -> None:
-        self.socket.send(msg.encode("utf-8"))
-        self.receive()
-
-    def receive(self) -> None:
-        try:
-            self.socket.recv(flags=zmq.NOBLOCK)
-        except zmq.ZMQError:
-            pass
+        self.strobe.put(ec)
+
+    def strobe_summary(self) -> str:
+        return self.strobe.summary()
+
+    def send_string(self, msg: str, control: bool = False) -> None:
+        # Control messages are sent ahead of any queued Events
+        self.connection.put(msg, control)
+
+    def update_status(self) -> None:
+        self.status.setText(self.connection.summary() + "\n" + self.strobe_summary())
 
     def log_events(self, events: list[Event]) -> None:
         for e in events:
             if isinstance(e, OEEvent):
                 if e.event_type == 'startAcquisition':
-                    self.send_string("startAcquisition")
+                    self.send_string("startAcquisition", True)
                 elif e.event_type == 'stopAcquisition':
-                    self.send_string("stopAcquisition")
+                    self.send_string("stopAcquisition", True)
                 elif e.event_type == 'startRecord':
                     self.send_string("startRecord RecDir={} prependText={} appendText={}".format(self.rec_dir.text(),
                                                                                                  self.pre.text() + e.metadata.pre if e.metadata is not None and "pre" in e.metadata else self.pre.text(),
-                                                                                                 self.app.text()))
+                                                                                                 self.app.text()), True)
                 elif e.event_type == 'stopRecord':
-                    self.send_string("stopRecord")
+                    self.send_string("stopRecord", True)
             elif isinstance(e, InitialStateEvent):
                 self.event_count += 1
                 self.send_string("{},{},Entry,{},{},{}".format(self.event_count, e.entry_time,
@@ -202,7 +226,268 @@ class OENetworkLogger(GUIEventLogger):
                                                                str(e.metadata)))
 
     def close(self) -> None:
-        self.socket.close()
+        self.status_timer.stop()
+        self.strobe.stop()
+        self.connection.stop()
 
     def get_widget(self) -> QWidget:
         return self.oe_group
+
+
+class TTLStrobeThread(threading.Thread):
+    """
+        Thread that sends event codes on the TTL lines of Open Ephys. Only the lines that change are sent: the lines
+        set in the code are turned on and, after the pulse width, turned off again. Each message waits for its reply
+        so the time taken for Open Ephys to receive each code can be measured.
+
+        Parameters
+        ----------
+        context : Context
+            The ZMQ context for the socket
+        address : str
+            The address of the Open Ephys network events plugin
+        nbits : int
+            The number of TTL lines used for event codes
+        pulse_width : float
+            The time in seconds the TTL lines of an event code are held on
+        timeout : float
+            The time in seconds to wait for each reply before counting the message as failed
+
+        Attributes
+        ----------
+        latency : TimingHistogram
+            Time from when each code was queued until Open Ephys acknowledged every line turning on
+        sent : int
+            Number of event codes sent
+        failures : int
+            Number of messages that were not acknowledged before the timeout
+
+        Methods
+        -------
+        put(ec)
+            Queues an event code to be sent
+        stop()
+            Sends any remaining event codes and waits for the thread to exit
+        summary()
+            Returns a short text description of the latency statistics
+    """
+
+    def __init__(self, context: zmq.Context, address: str, nbits: int, pulse_width: float = 0.005,
+                 timeout: float = 0.5):
+        super(TTLStrobeThread, self).__init__(daemon=True)
+        self.context = context
+        self.address = address
+        self.nbits = nbits
+        self.pulse_width = pulse_width
+        self.timeout = timeout
+        self.codes = deque()
+        self.condition = threading.Condition()
+        self.running = True
+        self.latency = TimingHistogram()
+        self.sent = 0
+        self.failures = 0
+        self.high = set(range(nbits))  # The state of the lines is unknown so the first code clears all of them
+
+    def put(self, ec: int) -> None:
+        with self.condition:
+            self.codes.append((ec, time.perf_counter()))
+            self.condition.notify()
+
+    def run(self) -> None:
+        socket = self.context.socket(zmq.REQ)
+        socket.set(zmq.REQ_RELAXED, True)
+        socket.set(zmq.REQ_CORRELATE, True)  # Discard replies to messages that timed out
+        socket.set(zmq.RCVTIMEO, int(self.timeout * 1000))
+        socket.set(zmq.LINGER, 0)
+        socket.connect(self.address)
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: len(self.codes) > 0 or not self.running)
+                if len(self.codes) == 0:
+                    break
+                ec, queued = self.codes.popleft()
+            lines = {i for i in range(max(self.nbits, ec.bit_length())) if ec >> i & 1}
+            # Turn on the lines in the code and turn off any that were left on
+            for i in sorted(lines | self.high):
+                self.set_line(socket, i, i in lines)
+            on_time = time.perf_counter()
+            with self.condition:
+                self.latency.add(on_time - queued)
+                self.sent += 1
+            self.high = lines
+            time.sleep(max(self.pulse_width - (time.perf_counter() - on_time), 0))
+            for i in sorted(self.high):
+                self.set_line(socket, i, False)
+            self.high = set()
+        socket.close()
+
+    def set_line(self, socket: zmq.Socket, line: int, on: bool) -> None:
+        socket.send(b"".join([b'TTL Channel=', str(line + 1).encode('ascii'), b' on=', b'1' if on else b'0']))
+        try:
+            socket.recv()
+        except zmq.Again:
+            with self.condition:
+                self.failures += 1
+
+    def stop(self) -> None:
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        if self.is_alive():
+            self.join()
+
+    def summary(self) -> str:
+        with self.condition:
+            return "Event codes: sent {}, latency mean {:.2f} ms (p99 {:.2f} ms, max {:.2f} ms), failures {}".format(
+                self.sent, self.latency.mean() * 1000, self.latency.percentile(99) * 1000, self.latency.max * 1000,
+                self.failures)
+
+
+class OEConnectionThread(threading.Thread):
+    """
+        Thread that sends messages to the Open Ephys network events plugin and matches each reply to its message. Several
+        messages can await replies at once and control messages are sent before any other queued messages. Messages
+        that are not acknowledged before the timeout are recorded as failures.
+
+        Parameters
+        ----------
+        context : Context
+            The ZMQ context for the socket
+        address : str
+            The address of the Open Ephys network events plugin
+        timeout : float
+            The time in seconds to wait for each reply before counting the message as failed
+        max_size : int
+            The maximum number of messages that can be queued. Adding further messages waits until there is space.
+        max_in_flight : int
+            The maximum number of messages awaiting replies at once
+
+        Attributes
+        ----------
+        latency : TimingHistogram
+            Time from when each message was queued until it was acknowledged
+        round_trip : TimingHistogram
+            Time from when each message was sent until it was acknowledged
+        depth : int
+            Number of messages waiting to be sent
+        max_depth : int
+            Largest number of messages that have been waiting to be sent at once
+        acknowledged : int
+            Number of messages acknowledged by Open Ephys
+        failures : int
+            Number of messages that were not acknowledged before the timeout
+        failed : deque
+            The most recent messages that were not acknowledged
+
+        Methods
+        -------
+        put(msg, control)
+            Queues a message to be sent
+        stop()
+            Sends any remaining messages and waits for the thread to exit
+        summary()
+            Returns a short text description of the connection statistics
+    """
+
+    def __init__(self, context: zmq.Context, address: str, timeout: float = 1, max_size: int = 100000,
+                 max_in_flight: int = 16):
+        super(OEConnectionThread, self).__init__(daemon=True)
+        self.context = context
+        self.address = address
+        self.timeout = timeout
+        self.max_size = max_size
+        self.max_in_flight = max_in_flight
+        self.control = deque()
+        self.messages = deque()
+        self.in_flight = {}
+        self.condition = threading.Condition()
+        self.running = True
+        self.seq = 0
+        self.latency = TimingHistogram()
+        self.round_trip = TimingHistogram()
+        self.depth = 0
+        self.max_depth = 0
+        self.acknowledged = 0
+        self.failures = 0
+        self.failed = deque(maxlen=100)
+
+    def put(self, msg: str, control: bool = False) -> None:
+        with self.condition:
+            self.condition.wait_for(lambda: self.depth < self.max_size or not self.is_alive())
+            (self.control if control else self.messages).append((msg.encode("utf-8"), time.perf_counter()))
+            self.depth += 1
+            self.max_depth = max(self.max_depth, self.depth)
+            self.condition.notify_all()
+
+    def run(self) -> None:
+        # A DEALER socket allows several requests to the REP socket of Open Ephys to await replies at once
+        socket = self.context.socket(zmq.DEALER)
+        socket.set(zmq.LINGER, 0)
+        socket.connect(self.address)
+        stop_time = None
+        while True:
+            with self.condition:
+                if len(self.in_flight) == 0:
+                    self.condition.wait_for(lambda: self.depth > 0 or not self.running)
+                if not self.running and stop_time is None:
+                    stop_time = time.perf_counter()
+                if stop_time is not None and (self.depth + len(self.in_flight) == 0 or
+                                              time.perf_counter() - stop_time > self.timeout):
+                    break
+                # Send queued messages while there is room for more replies, control messages first
+                while self.depth > 0 and len(self.in_flight) < self.max_in_flight:
+                    queue = self.control if len(self.control) > 0 else self.messages
+                    msg, queued = queue[0]
+                    try:
+                        # The sequence number is returned by Open Ephys as the envelope of the reply
+                        socket.send_multipart([str(self.seq).encode("ascii"), b"", msg], flags=zmq.NOBLOCK)
+                    except zmq.Again:
+                        break  # Open Ephys is not connected yet
+                    queue.popleft()
+                    self.depth -= 1
+                    self.in_flight[self.seq] = (msg, queued, time.perf_counter())
+                    self.seq += 1
+                    self.condition.notify_all()
+            if socket.poll(1, zmq.POLLIN):
+                reply = socket.recv_multipart()
+                now = time.perf_counter()
+                with self.condition:
+                    sent = self.in_flight.pop(int(reply[0]), None)
+                    if sent is not None:  # Replies arriving after the timeout have already been counted as failures
+                        self.latency.add(now - sent[1])
+                        self.round_trip.add(now - sent[2])
+                        self.acknowledged += 1
+            now = time.perf_counter()
+            with self.condition:
+                for seq in [seq for seq, sent in self.in_flight.items() if now - sent[2] > self.timeout]:
+                    self.failed.append(self.in_flight.pop(seq)[0].decode("utf-8"))
+                    self.failures += 1
+        with self.condition:
+            # Anything left when the thread was stopped was never acknowledged
+            for msg, _ in (*self.control, *self.messages):
+                self.failed.append(msg.decode("utf-8"))
+            for msg, _, _ in self.in_flight.values():
+                self.failed.append(msg.decode("utf-8"))
+            self.failures += self.depth + len(self.in_flight)
+            self.control.clear()
+            self.messages.clear()
+            self.in_flight.clear()
+            self.depth = 0
+            self.condition.notify_all()
+        socket.close()
+
+    def stop(self) -> None:
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        if self.is_alive():
+            self.join()
+
+    def summary(self) -> str:
+        with self.condition:
+            return "Queued {} (max {}), awaiting {}, acknowledged {}, failed {}, latency mean {:.2f} ms " \
+                   "(p99 {:.2f} ms, max {:.2f} ms)".format(self.depth, self.max_depth, len(self.in_flight),
+                                                          self.acknowledged, self.failures,
+                                                          self.latency.mean() * 1000,
+                                                          self.latency.percentile(99) * 1000,
+                                                          self.latency.max * 1000)
@@ -3,56 +3,79 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from Events.Event import Event
 
-from PyQt5.QtWidgets import QWidget
+from collections import deque
+
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QWidget, QPlainTextEdit
 
 from Events.GUIEventLogger import GUIEventLogger
 from Events.InputEvent import InputEvent
 from Events.StateChangeEvent import StateChangeEvent
 from Events.InitialStateEvent import InitialStateEvent
 from Events.FinalStateEvent import FinalStateEvent
-from Workstation.ScrollLabel import ScrollLabel
 
 
 class TextEventLogger(GUIEventLogger):
+    """
+    GUIEventLogger that shows the most recent Events in a text box in the ChamberWidget. New lines are held until the
+    next update of the text box so the cost of logging does not grow with the length of the session.
+
+    Parameters
+    ----------
+    max_lines : int
+        The maximum number of lines kept in the text box
+    update_interval : int
+        The minimum time in milliseconds between updates of the text box
+    """
 
-    def __init__(self):
+    def __init__(self, max_lines: int = 1000, update_interval: int = 100):
         super().__init__()
-        self.event_log = ScrollLabel()
+        self.max_lines = int(max_lines)
+        self.pending = deque(maxlen=self.max_lines)  # Lines older than the text box can hold are discarded
+        self.event_log = QPlainTextEdit()
+        self.event_log.setReadOnly(True)
+        self.event_log.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.event_log.setMaximumBlockCount(self.max_lines)
         self.event_log.setMaximumHeight(100)
         self.event_log.setMinimumHeight(100)
-        self.event_log.verticalScrollBar().rangeChanged.connect(
-            lambda: self.event_log.verticalScrollBar().setValue(self.event_log.verticalScrollBar().maximum()))
+        self.update_timer = QTimer(self.event_log)
+        self.update_timer.setSingleShot(True)
+        self.update_timer.setInterval(int(update_interval))
+        self.update_timer.timeout.connect(self.update_text)
 
     def log_events(self, events: list[Event]):
-        cur_text = self.event_log.text()
-        if len(events) > 0 and self.event_count > 0:
-            cur_text += "\n"
-        for i in range(len(events)):
-            e = events[i]
+        for e in events:
             self.event_count += 1
             if isinstance(e, InitialStateEvent):
-                cur_text += "{},{},Entry,{},{},{}".format(self.event_count, e.entry_time,
-                                                          e.initial_state.value, e.initial_state.name, str(e.metadata))
+                self.pending.append("{},{},Entry,{},{},{}".format(self.event_count, e.entry_time, e.initial_state.value,
+                                                                  e.initial_state.name, str(e.metadata)))
             elif isinstance(e, FinalStateEvent):
-                cur_text += "{},{},Exit,{},{},{}".format(self.event_count, e.entry_time,
-                                                         e.final_state.value, e.final_state.name, str(e.metadata))
+                self.pending.append("{},{},Exit,{},{},{}".format(self.event_count, e.entry_time, e.final_state.value,
+                                                                 e.final_state.name, str(e.metadata)))
             elif isinstance(e, StateChangeEvent):
-                cur_text += "{},{},Exit,{},{},{}\n".format(self.event_count, e.entry_time,
-                                                           e.initial_state.value, e.initial_state.name, str(e.metadata))
+                self.pending.append("{},{},Exit,{},{},{}".format(self.event_count, e.entry_time,
+                                                                 e.initial_state.value, e.initial_state.name,
+                                                                 str(e.metadata)))
                 self.event_count += 1
-                cur_text += "{},{},Entry,{},{},{}".format(self.event_count, e.entry_time,
-                                                          e.new_state.value, e.new_state.name, str(None))
+                self.pending.append("{},{},Entry,{},{},{}".format(self.event_count, e.entry_time, e.new_state.value,
+                                                                  e.new_state.name, str(None)))
             elif isinstance(e, InputEvent):
-                cur_text += "{},{},Input,{},{},{}".format(self.event_count, e.entry_time,
-                                                          e.input_event.value, e.input_event.name, str(e.metadata))
-            if i < len(events) - 1:
-                cur_text += "\n"
-        if len(events) > 0:
-            self.event_log.setText(cur_text)
+                self.pending.append("{},{},Input,{},{},{}".format(self.event_count, e.entry_time, e.input_event.value,
+                                                                  e.input_event.name, str(e.metadata)))
+        if len(self.pending) > 0 and not self.update_timer.isActive():
+            self.update_timer.start()
+
+    def update_text(self) -> None:
+        # Append all pending lines at once and keep the newest line in view
+        if len(self.pending) > 0:
+            self.event_log.appendPlainText("\n".join(self.pending))
+            self.pending.clear()
+            self.event_log.verticalScrollBar().setValue(self.event_log.verticalScrollBar().maximum())
 
     def get_widget(self) -> QWidget:
         return self.event_log
 
     def start(self) -> None:
         super(TextEventLogger, self).start()
-        self.event_log.setText("")
+        self.pending.clear()
+        self.event_log.clear()
@@ -33,6 +33,7 @@ class DPALGUI(GUI):
             return [str(task.cur_trial+1)]
 
         self.touch_screen = TouchScreenElement(self.task_gui, 0, 0, self.SF * 500, self.SF * 375, pygame.Rect(0, 0, self.SF * 500, self.SF * 152), task.touch_screen)
+        self.touch_screen.preload([task.image_folder + image for image in task.images], task.img_dim)
         self.food_poke = NosePokeElement(self.task_gui, self.SF * 220, self.SF * 480, self.SF * 30, task.init_poke)
         self.feed_button = ButtonElement(self.task_gui, self.SF * 225, self.SF * 600, self.SF * 50, self.SF * 20, "FEED", task.food, int(self.SF * 12))
         self.feed_button.mouse_up = MethodType(feed_mouse_up, self.feed_button)
@@ -54,5 +55,9 @@ class DPALGUI(GUI):
         for touch in self.task.touch_screen.handled_touches:
             self.touch_screen.draw_plus_sign(touch, self.SF * 3, Colors.green)
 
+    def visual_state(self):
+        state = super().visual_state()
+        return None if state is None else (state, tuple(self.task.touch_screen.handled_touches))
+
     def get_elements(self) -> List[Element]:
         return [self.food_poke, self.food_light, self.touch_screen, self.feed_button, *self.info_boxes, self.tone, self.cage_light, self.fan]
@@ -30,6 +30,7 @@ class DPALInitTouchGUI(GUI):
             return [str(task.cur_trial+1)]
 
         self.touch_screen = TouchScreenElement(self.task_gui, 0, 0, self.SF * 500, self.SF * 375, pygame.Rect(0, 0, self.SF * 500, self.SF * 152), task.touch_screen)
+        self.touch_screen.preload([task.image_folder + task.blank], task.img_dim)
         self.feed_button = ButtonElement(self.task_gui, self.SF * 225, self.SF * 600, self.SF * 50, self.SF * 20, "FEED", task.food, int(self.SF * 12))
         self.feed_button.mouse_up = MethodType(feed_mouse_up, self.feed_button)
         pellets = InfoBoxElement(self.task_gui, self.SF * 225, self.SF * 555, self.SF * 50, self.SF * 15, "PELLETS", 'BOTTOM', ['0'], int(self.SF * 14), self.SF)
@@ -48,5 +49,9 @@ class DPALInitTouchGUI(GUI):
         for touch in self.task.touch_screen.handled_touches:
             self.touch_screen.draw_plus_sign(touch, self.SF * 3, Colors.green)
 
+    def visual_state(self):
+        state = super().visual_state()
+        return None if state is None else (state, tuple(self.task.touch_screen.handled_touches))
+
     def get_elements(self) -> List[Element]:
         return [self.touch_screen, self.feed_button, *self.info_boxes, self.tone, self.fan]
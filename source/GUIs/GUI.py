@@ -7,6 +7,7 @@ if TYPE_CHECKING:
     from Elements.Element import Element
 
 from abc import ABCMeta, abstractmethod
+from typing import Any
 
 from GUIs import Colors
 
@@ -18,6 +19,7 @@ class GUI:
         self.task_gui = task_gui
         self.SF = task_gui.get_width() / 500
         self.task = task
+        self.last_state = None
 
     def draw(self) -> None:
         self.task_gui.fill(Colors.darkgray)
@@ -28,6 +30,20 @@ class GUI:
     def get_elements(self) -> list[Element]:
         raise NotImplementedError
 
+    def visual_state(self) -> Any:
+        # GUIs that draw more than their Elements should extend the state with whatever else they draw
+        states = tuple(el.visual_state() for el in self.get_elements())
+        return None if None in states else states
+
+    def has_changed(self) -> bool:
+        """
+        Returns True if the GUI looks different than the last time this method was called and should be redrawn.
+        """
+        state = self.visual_state()
+        changed = state is None or state != self.last_state
+        self.last_state = state
+        return changed
+
     def handle_events(self, events: list[Event]) -> None:
         for event in events:
             for el in self.get_elements():
@@ -7,6 +7,7 @@ if TYPE_CHECKING:
     from Elements.Element import Element
 
 from abc import ABCMeta, abstractmethod
+from typing import Any
 
 from GUIs.GUI import GUI
 
@@ -26,6 +27,14 @@ class SequenceGUI(GUI):
     def get_elements(self) -> list[Element]:
         raise NotImplementedError
 
+    def visual_state(self) -> Any:
+        state = super(SequenceGUI, self).visual_state()
+        if self.sub_gui is None or state is None:
+            return state
+        sub_state = self.sub_gui.visual_state()
+        # Include the identity of the sub GUI so the GUI is redrawn when the sequence moves to the next Task
+        return None if sub_state is None else (id(self.sub_gui), state, sub_state)
+
     def handle_events(self, events: list[Event]) -> None:
         super(SequenceGUI, self).handle_events(events)
         self.sub_gui.handle_events(events)
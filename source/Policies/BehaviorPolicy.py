@@ -0,0 +1,70 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from Components.BinaryInput import BinaryInput
+    from Tasks.Task import Task
+
+import math
+import random
+from abc import ABCMeta, abstractmethod
+
+
+class BehaviorPolicy:
+    __metaclass__ = ABCMeta
+    """
+        Abstract class defining a model of subject behavior that drives the inputs of a simulated Task. The policy is
+        called once per task loop and toggles simulated input Components such as levers and nose pokes.
+
+        Attributes
+        ----------
+        random : Random
+            Random number generator for the policy. Seeded separately for each simulated subject.
+        last_time : float
+            The time the policy last acted
+
+        Methods
+        -------
+        seed(value)
+            Seeds the random number generator
+        start(task)
+            Called when the Task starts
+        act(task)
+            Called every task loop before the Task handles its inputs
+        step(task, dt)
+            Abstract method that updates the simulated inputs given the time in seconds since the previous step
+        occurs(rate, dt)
+            Returns True with the probability that a Poisson process with the given rate fires within dt seconds
+        respond(task, component, duration)
+            Activates the input component for duration seconds
+    """
+
+    def __init__(self):
+        self.random = random.Random()
+        self.last_time = None
+
+    def seed(self, value: int) -> None:
+        self.random.seed(value)
+
+    def start(self, task: Task) -> None:
+        pass
+
+    def act(self, task: Task) -> None:
+        if self.last_time is None:
+            self.last_time = task.clock.time()
+            self.start(task)
+        now = task.clock.time()
+        self.step(task, now - self.last_time)
+        self.last_time = now
+
+    @abstractmethod
+    def step(self, task: Task, dt: float) -> None:
+        raise NotImplementedError
+
+    def occurs(self, rate: float, dt: float) -> bool:
+        return self.random.random() < 1 - math.exp(-rate * dt)
+
+    # noinspection PyMethodMayBeStatic
+    def respond(self, task: Task, component: BinaryInput, duration: float) -> None:
+        if not component.read():  # Read the Source so repeated responses within a loop are ignored
+            component.toggle(True)
+            task.clock.call_later(duration, lambda: component.toggle(False))
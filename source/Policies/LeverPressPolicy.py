@@ -0,0 +1,31 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from Tasks.Task import Task
+
+from Policies.BehaviorPolicy import BehaviorPolicy
+
+
+class LeverPressPolicy(BehaviorPolicy):
+    """
+        Presses a lever as a Poisson process. Suitable for BarPress and PMA.
+
+        Parameters
+        ----------
+        rate : float
+            The average number of presses per second
+        press_duration : float
+            The time in seconds the lever is held down for each press
+        lever : str
+            The name of the lever Component in the Task
+    """
+
+    def __init__(self, rate: float = 0.1, press_duration: float = 0.2, lever: str = "food_lever"):
+        super(LeverPressPolicy, self).__init__()
+        self.rate = rate
+        self.press_duration = press_duration
+        self.lever = lever
+
+    def step(self, task: Task, dt: float) -> None:
+        if self.occurs(self.rate, dt):
+            self.respond(task, getattr(task, self.lever), self.press_duration)
@@ -0,0 +1,62 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from Tasks.Task import Task
+
+from Policies.BehaviorPolicy import BehaviorPolicy
+
+
+class NosePokePolicy(BehaviorPolicy):
+    """
+        Models a subject choosing between cued nose pokes. Suitable for FiveChoice. The subject enters the food trough
+        when its light is on and otherwise pokes at a fixed rate, choosing the most recently lit poke with a fixed
+        accuracy.
+
+        Parameters
+        ----------
+        poke_rate : float
+            The average number of nose pokes per second
+        accuracy : float
+            The probability a poke is made to the most recently lit nose poke rather than a random one
+        trough_rate : float
+            The average number of food trough entries per second while the trough light is on
+        poke_duration : float
+            The time in seconds each poke or trough entry lasts
+        pokes : str
+            The name of the list of nose poke Components in the Task
+        lights : str
+            The name of the list of nose poke light Components in the Task
+        trough : str
+            The name of the food trough Component in the Task
+        trough_light : str
+            The name of the food trough light Component in the Task
+    """
+
+    def __init__(self, poke_rate: float = 0.3, accuracy: float = 0.7, trough_rate: float = 0.5,
+                 poke_duration: float = 0.3, pokes: str = "nose_pokes", lights: str = "nose_poke_lights",
+                 trough: str = "food_trough", trough_light: str = "food_light"):
+        super(NosePokePolicy, self).__init__()
+        self.poke_rate = poke_rate
+        self.accuracy = accuracy
+        self.trough_rate = trough_rate
+        self.poke_duration = poke_duration
+        self.pokes = pokes
+        self.lights = lights
+        self.trough = trough
+        self.trough_light = trough_light
+        self.cue = None  # Index of the most recently lit nose poke
+
+    def step(self, task: Task, dt: float) -> None:
+        pokes = getattr(task, self.pokes)
+        for i, light in enumerate(getattr(task, self.lights)):
+            if light.get_state():
+                self.cue = i
+        if getattr(task, self.trough_light).get_state():
+            if self.occurs(self.trough_rate, dt):
+                self.respond(task, getattr(task, self.trough), self.poke_duration)
+        elif self.occurs(self.poke_rate, dt):
+            if self.cue is not None and self.random.random() < self.accuracy:
+                choice = self.cue
+            else:
+                choice = self.random.randrange(len(pokes))
+            self.respond(task, pokes[choice], self.poke_duration)
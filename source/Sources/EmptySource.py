@@ -1,3 +1,4 @@
+from Components.Component import Component
 from Sources.Source import Source
 
 
@@ -11,6 +12,8 @@ class EmptySource(Source):
             Links Component IDs to Component objects
         values : dict
             Links Component IDs to stored value for each Component
+        tasks : dict
+            Links Component IDs to the Task each Component belongs to
 
         Methods
         -------
@@ -21,17 +24,21 @@ class EmptySource(Source):
         read_component(component_id)
             Returns the stored value for the component with id component_id
         write_component(component_id, msg)
-            Changes the stored value of the component with id component_id to msg
+            Changes the stored value of the component with id component_id to msg and publishes it if it is an input
+        pushes_inputs()
+            Returns True
     """
 
     def __init__(self):
         self.components = {}
         self.values = {}
+        self.tasks = {}
         self.next_id = 0
 
-    def register_component(self, _, component):
+    def register_component(self, task, component):
         self.next_id += 1
-        self.components[component.id] = component.address
+        self.components[component.id] = component
+        self.tasks[component.id] = task
         self.values[component.id] = component.get_state()
 
     def read_component(self, component_id):
@@ -39,3 +46,10 @@ class EmptySource(Source):
 
     def write_component(self, component_id, msg):
         self.values[component_id] = msg
+        # Simulated inputs are delivered to the Task rather than waiting to be polled
+        if self.components[component_id].get_type() in (Component.Type.DIGITAL_INPUT, Component.Type.ANALOG_INPUT,
+                                                        Component.Type.INPUT):
+            self.publish_input(self.tasks[component_id], self.components[component_id], msg)
+
+    def pushes_inputs(self):
+        return True
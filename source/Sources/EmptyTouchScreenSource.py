@@ -16,6 +16,8 @@ class EmptyTouchScreenSource(Source):
             Returns the stored value for the component with id component_id
         write_component(component_id, msg)
             Changes the stored value of the component with id component_id to msg
+        pushes_inputs()
+            Returns True as touches are added directly to the TouchScreen
         """
 
     def __init__(self, display_size):
@@ -30,3 +32,6 @@ class EmptyTouchScreenSource(Source):
 
     def write_component(self, component_id, msg):
         pass
+
+    def pushes_inputs(self):
+        return True
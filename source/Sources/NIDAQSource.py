@@ -1,15 +1,26 @@
+import re
+import threading
+import time
+
 import nidaqmx
-from nidaqmx import system, stream_writers
-from nidaqmx.constants import (LineGrouping)
+from nidaqmx import system, stream_readers, stream_writers
+from nidaqmx.constants import (LineGrouping, AcquisitionType, RegenerationMode, TaskMode)
 import numpy as np
 
 from Components.Component import Component
 from Sources.Source import Source
+from Utilities.TimingHistogram import TimingHistogram
+
+
+# Addresses of single digital lines which can share a task with the other lines on their port
+LINE_ADDRESS = re.compile(r"^(.*port\d+)/line(\d+)$")
 
 
 class NIDAQSource(Source):
     """
-        Class defining a Source for interacting with National Instruments DAQs.
+        Class defining a Source for interacting with National Instruments DAQs. Digital lines on the same port share a
+        single input or output task. During a task loop each input port is read at most once and all writes to an output
+        port are combined into a single write when the loop ends.
 
         Attributes
         ----------
@@ -21,6 +32,17 @@ class NIDAQSource(Source):
             Links Component IDs to DAQ tasks
         streams : dict
             Links Component IDs to DAQ streams
+        port_lines : dict
+            Links each digital port and direction to the Component IDs and line numbers on it
+        port_tasks : dict
+            Links each digital port and direction to its DAQ task
+        port_masks : dict
+            Links each digital output port to the bitmask of lines that should be on
+        waveforms : dict
+            Links each analog output Component ID and parameter set number to the samples for every channel and the
+            total number of samples to generate
+        ao_latency : TimingHistogram
+            Time from each request to start an analog output waveform until the DAQ started generating it
 
         Methods
         -------
@@ -34,6 +56,12 @@ class NIDAQSource(Source):
             Requests the current value for the Component from the DAQ
         write_component(component_id, msg)
             Writes a value for the Component to the DAQ
+        start_loop()
+            Starts caching port reads and combining port writes for the calling thread
+        end_loop()
+            Writes any output ports changed during the loop
+        timing()
+            Returns the analog output start latency
     """
 
     def __init__(self, dev):
@@ -51,10 +79,29 @@ class NIDAQSource(Source):
         self.ao_task = None
         self.ao_stream = None
         self.ao_inds = {}
+        self.waveforms = {}
+        self.loaded = None  # The waveform currently in the buffer of the analog output task
+        self.reloads = 0
+        self.ao_latency = TimingHistogram()
+        self.port_lines = {}
+        self.port_tasks = {}
+        self.port_streams = {}
+        self.port_masks = {}
+        self.component_ports = {}
+        self.lock = threading.RLock()
+        self.loop = threading.local()  # Port values read and ports written during the current loop of each thread
 
     def register_component(self, _, component):
         if self.available:
-            if component.get_type() == Component.Type.DIGITAL_OUTPUT:
+            match = LINE_ADDRESS.match(component.address)
+            if match is not None and component.get_type() in (Component.Type.DIGITAL_OUTPUT,
+                                                               Component.Type.DIGITAL_INPUT):
+                key = (component.get_type(), match.group(1))
+                with self.lock:
+                    self.port_lines.setdefault(key, {})[component.id] = int(match.group(2))
+                    self.component_ports[component.id] = key
+                    self.open_port(key)
+            elif component.get_type() == Component.Type.DIGITAL_OUTPUT:
                 task = nidaqmx.Task()
                 task.do_channels.add_do_chan(self.dev + component.address, line_grouping=LineGrouping.CHAN_FOR_ALL_LINES)
                 task.start()
@@ -75,16 +122,107 @@ class NIDAQSource(Source):
             #     self.streams[component.id] = stream_writers.AnalogSingleChannelReader(task.in_stream)
         self.components[component.id] = component
 
+    def open_port(self, key):
+        # Replace the task for the port with one including every registered line
+        if key in self.port_tasks:
+            self.port_tasks.pop(key).close()
+            del self.port_streams[key]
+        if len(self.port_lines[key]) == 0:
+            del self.port_lines[key]
+            self.port_masks.pop(key, None)
+            return
+        direction, port = key
+        lines = sorted(set(self.port_lines[key].values()))
+        channel = ",".join("{}{}/line{}".format(self.dev, port, line) for line in lines)
+        task = nidaqmx.Task()
+        if direction == Component.Type.DIGITAL_OUTPUT:
+            task.do_channels.add_do_chan(channel, line_grouping=LineGrouping.CHAN_FOR_ALL_LINES)
+            self.port_streams[key] = stream_writers.DigitalSingleChannelWriter(task.out_stream)
+        else:
+            task.di_channels.add_di_chan(channel, line_grouping=LineGrouping.CHAN_FOR_ALL_LINES)
+            self.port_streams[key] = stream_readers.DigitalSingleChannelReader(task.in_stream)
+        task.start()
+        self.port_tasks[key] = task
+        if direction == Component.Type.DIGITAL_OUTPUT:
+            self.port_masks.setdefault(key, 0)
+            self.write_port(key)  # Restore the lines that were already on
+
+    def read_port(self, key):
+        # Data for every line is placed at the bit position of the line within the port
+        values = getattr(self.loop, "values", None)
+        if values is not None and key in values:
+            return values[key]
+        with self.lock:
+            value = self.port_streams[key].read_one_sample_port_uint32()
+        if values is not None:
+            values[key] = value
+        return value
+
+    def write_port(self, key):
+        with self.lock:
+            self.port_streams[key].write_one_sample_port_uint32(self.port_masks[key])
+
+    def start_loop(self):
+        self.loop.depth = getattr(self.loop, "depth", 0) + 1
+        if self.loop.depth == 1:
+            self.loop.values = {}
+            self.loop.written = set()
+
+    def end_loop(self):
+        self.loop.depth -= 1
+        if self.loop.depth == 0:
+            for key in self.loop.written:
+                self.write_port(key)
+            self.loop.values = None
+            self.loop.written = None
+
+    def load_waveform(self, key):
+        # Write the waveform to the buffer and commit the task so it can be started with minimal delay
+        data, samples = self.waveforms[key]
+        self.ao_task.stop()
+        self.ao_task.timing.cfg_samp_clk_timing(self.components[key[0]].sr, sample_mode=AcquisitionType.FINITE,
+                                                samps_per_chan=samples)
+        # Waveforms shorter than the number of samples are repeated by the DAQ
+        self.ao_task.out_stream.regen_mode = RegenerationMode.ALLOW_REGENERATION
+        self.ao_task.out_stream.output_buf_size = data.shape[1]
+        self.ao_stream.write_many_sample(data)
+        self.ao_task.control(TaskMode.TASK_COMMIT)
+        self.loaded = key
+
+    def start_waveform(self, key):
+        start = time.perf_counter()
+        self.ao_task.stop()  # Stopping a committed task returns it to the committed state
+        if self.loaded != key:
+            self.load_waveform(key)
+            self.reloads += 1
+        self.ao_task.start()
+        self.ao_latency.add(time.perf_counter() - start)
+
+    def timing(self):
+        return {"ao_start": self.ao_latency}
+
     def close_source(self):
         for c in self.tasks.values():
             c.close()
+        for c in self.port_tasks.values():
+            c.close()
 
     def close_component(self, component_id):
-        if self.components[component_id].get_type() == Component.Type.ANALOG_OUTPUT:
+        if component_id in self.component_ports:
+            key = self.component_ports.pop(component_id)
+            with self.lock:
+                line = self.port_lines[key].pop(component_id)
+                if key in self.port_masks:
+                    self.port_masks[key] &= ~(1 << line)
+                self.open_port(key)
+            del self.components[component_id]
+        elif self.components[component_id].get_type() == Component.Type.ANALOG_OUTPUT:
             if self.ao_task is not None:
                 self.ao_task.close()
                 self.ao_task = None
                 self.ao_stream = None
+                self.waveforms.clear()
+                self.loaded = None
         elif self.available:
             self.tasks[component_id].close()
             del self.tasks[component_id]
@@ -92,8 +230,11 @@ class NIDAQSource(Source):
 
     def read_component(self, component_id):
         if self.available:
+            if component_id in self.component_ports:
+                key = self.component_ports[component_id]
+                return bool(self.read_port(key) >> self.port_lines[key][component_id] & 1)
             # Do I need a stop here as well?
-            if self.components[component_id].get_type() == Component.Type.DIGITAL_INPUT:
+            elif self.components[component_id].get_type() == Component.Type.DIGITAL_INPUT:
                 return self.tasks[component_id].read()
             elif self.components[component_id].get_type() == Component.Type.ANALOG_INPUT:
                 return self.streams[component_id].read_one_sample(0)
@@ -102,15 +243,28 @@ class NIDAQSource(Source):
 
     def write_component(self, component_id, msg):
         if self.available:
-            if self.components[component_id].get_type() == Component.Type.DIGITAL_OUTPUT:
+            if component_id in self.component_ports:
+                key = self.component_ports[component_id]
+                bit = 1 << self.port_lines[key][component_id]
+                with self.lock:
+                    self.port_masks[key] = self.port_masks[key] | bit if msg else self.port_masks[key] & ~bit
+                written = getattr(self.loop, "written", None)
+                if written is not None:
+                    written.add(key)  # Written once the loop ends along with any other changes to the port
+                else:
+                    self.write_port(key)
+            elif self.components[component_id].get_type() == Component.Type.DIGITAL_OUTPUT:
                 self.tasks[component_id].write(msg)
             elif self.components[component_id].get_type() == Component.Type.ANALOG_OUTPUT:
-                output = np.zeros((len(self.ao_inds), msg.shape[1]))
-                output[self.ao_inds[component_id], :] = np.squeeze(msg)
-                if self.ao_task.is_task_done():
-                    self.ao_task.stop()
-                self.ao_task.timing.cfg_samp_clk_timing(self.components[component_id].sr,
-                                                        sample_mode=nidaqmx.constants.AcquisitionType.FINITE,
-                                                        samps_per_chan=msg.shape[1])
-                self.ao_stream.write_many_sample(np.squeeze(output))
-                self.ao_task.start()
+                key = (component_id, msg["pnum"])
+                if "waveform" in msg:
+                    # Prepare the samples for every channel of the task once for each parameter set
+                    output = np.zeros((len(self.ao_inds), msg["waveform"].shape[-1]))
+                    output[self.ao_inds[component_id], :] = np.squeeze(msg["waveform"])
+                    self.waveforms[key] = (output, msg["samples"])
+                    if self.loaded is None or self.ao_task.is_task_done():
+                        self.load_waveform(key)
+                    elif self.loaded == key:
+                        self.loaded = None  # The buffer holds an older version of the waveform
+                else:
+                    self.start_waveform(key)
@@ -1,39 +1,106 @@
+import threading
+
 import zmq
 import json
 from Sources.Source import Source
 
 
 class OESource(Source):
+    """
+        Class defining a Source for TTL events published by Open Ephys. A background thread receives every message,
+        decodes it once, and publishes TTL events to each Component registered on their channel along with the time they
+        were received.
+
+        Parameters
+        ----------
+        address : str
+            The IP address of the computer running Open Ephys
+        port : str
+            The port Open Ephys publishes events on
+        delay : int
+            The time in milliseconds the receiver waits for a message before checking if the Source has been closed
+
+        Attributes
+        ----------
+        channels : dict
+            Links each TTL channel to the Tasks and Components registered on it
+        received : int
+            Number of TTL events received
+        errors : int
+            Number of messages that could not be decoded
+
+        Methods
+        -------
+        register_component(task, component)
+            Registers the component on the channel given by its address
+        close_component(component_id)
+            Stops publishing events to the component
+        close_source()
+            Stops the receiver and closes the socket
+        read_component(component_id)
+            Returns an empty list as events are published to the Task as they arrive
+        write_component(component_id, msg)
+            No functionality
+        pushes_inputs()
+            Returns True
+    """
 
     def __init__(self, address, port, delay=0):
-        context = zmq.Context()
-        self.socket = context.socket(zmq.SUB)
-        self.socket.connect("tcp://" + address + ":" + str(port))
-        self.poller = zmq.Poller()
-        self.poller.register(self.socket, zmq.POLLIN)
-        self.delay = int(delay)
-        self.socket.setsockopt(zmq.SUBSCRIBE, b'ttl')
+        self.address = "tcp://" + address + ":" + str(port)
+        self.delay = int(delay) if int(delay) > 0 else 100
         self.components = {}
+        self.channels = {}
+        self.received = 0
+        self.errors = 0
+        self.running = True
+        self.receiver = threading.Thread(target=self.receive, daemon=True)
+        self.receiver.start()
 
-    def register_component(self, _, component):
+    def register_component(self, task, component):
         self.components[component.id] = component
+        channel = int(component.address) - 1
+        # Lists are replaced rather than modified so the receiver never sees a partial update
+        self.channels[channel] = [*self.channels.get(channel, []), (task, component)]
+
+    def close_component(self, component_id):
+        if component_id in self.components:
+            channel = int(self.components[component_id].address) - 1
+            self.channels[channel] = [(task, component) for task, component in self.channels[channel]
+                                      if component.id != component_id]
+            del self.components[component_id]
 
     def close_source(self):
-        self.socket.close()
+        self.running = False
+        self.receiver.join()
+
+    def receive(self):
+        context = zmq.Context.instance()
+        socket = context.socket(zmq.SUB)
+        socket.setsockopt(zmq.RCVHWM, 0)  # Never discard events that have not been received yet
+        socket.connect(self.address)
+        socket.setsockopt(zmq.SUBSCRIBE, b'ttl')
+        while self.running:
+            if socket.poll(self.delay, zmq.POLLIN):
+                msg = socket.recv_multipart()
+                if len(msg) == 2:
+                    envelope, jsonStr = msg
+                    try:
+                        jsonStr = json.loads(jsonStr.decode('utf-8'))
+                        event_type, targets = jsonStr['type'], self.channels.get(jsonStr['channel'], [])
+                    except (ValueError, KeyError, TypeError):  # Skip malformed messages without stopping the receiver
+                        self.errors += 1
+                        continue
+                    if event_type == 'ttl':
+                        self.received += 1
+                        for task, component in targets:
+                            self.publish_input(task, component, jsonStr)
+        socket.close()
 
     def read_component(self, component_id):
-        sockets = self.poller.poll(self.delay)
-        jsonStrs = []
-        for socket in sockets:
-            msg = socket[0].recv_multipart()
-            if len(msg) == 1:
-                envelope = msg
-            elif len(msg) == 2:
-                envelope, jsonStr = msg
-                jsonStr = json.loads(jsonStr.decode('utf-8'))
-                if jsonStr['type'] == 'ttl' and jsonStr['channel'] == int(self.components[component_id].address)-1:
-                    jsonStrs.append(jsonStr)
-        return jsonStrs
+        return []
 
     def write_component(self, component_id, msg):
         pass
+
+    def pushes_inputs(self):
+        return True
@@ -1,4 +1,4 @@
-import time
+import threading
 
 import serial
 
@@ -8,37 +8,91 @@ from Components.Component import Component
 
 
 class OSControllerSource(Source):
+    """
+        Class defining a Source for an operant box controller connected over serial. A background thread reads all
+        available bytes at once, splits them into lines, and toggles the stored value of the input named by each line,
+        publishing the new value to the Task with the time it arrived.
+
+        Parameters
+        ----------
+        com : str
+            The serial port of the controller
+
+        Attributes
+        ----------
+        components : dict
+            Links Component IDs to Component objects
+        values : dict
+            Links Component IDs to the current value of each Component
+        tasks : dict
+            Links Component IDs to the Task each Component belongs to
+        errors : int
+            Number of received lines that could not be decoded
+
+        Methods
+        -------
+        register_component(task, component)
+            Registers the component
+        close_source()
+            Stops the reader and closes the serial port
+        read_component(component_id)
+            Returns the stored value for the component with id component_id
+        write_component(component_id, msg)
+            Sends msg to the component with id component_id if it differs from the stored value
+        pushes_inputs()
+            Returns True
+    """
 
     def __init__(self, com):
-        self.com = serial.Serial(port=com, baudrate=115200, timeout=0, write_timeout=0, dsrdtr=True)
+        # The reader waits up to the timeout for new bytes so it does not spin while the controller is idle
+        self.com = serial.Serial(port=com, baudrate=115200, timeout=0.1, write_timeout=0, dsrdtr=True)
         self.com.dtr = True
         self.com.reset_input_buffer()
         self.com.reset_output_buffer()
         self.components = {}
         self.input_ids = {}
         self.values = {}
-        self.buffer = ""
+        self.tasks = {}
+        self.errors = 0
+        self.running = True
+        self.reader = threading.Thread(target=self.read_inputs, daemon=True)
+        self.reader.start()
 
-    def register_component(self, _, component):
+    def register_component(self, task, component):
         self.components[component.id] = component
+        self.tasks[component.id] = task
+        self.values[component.id] = False
         if component.get_type() == Component.Type.DIGITAL_INPUT:
             self.input_ids[component.address] = component.id
-        self.values[component.id] = False
 
     def close_source(self):
+        self.running = False
+        self.reader.join()
         self.com.__exit__()
 
+    def read_inputs(self):
+        buffer = bytearray()
+        while self.running:
+            # Read everything that has arrived or wait for the next byte
+            data = self.com.read(max(self.com.in_waiting, 1))
+            if len(data) == 0:
+                continue
+            buffer += data
+            # Each complete line names an input that has changed
+            *lines, remainder = buffer.split(b"\n")
+            buffer = bytearray(remainder)
+            for line in lines:
+                try:
+                    component_id = self.input_ids.get(line[1:].rstrip(b"\r").decode())
+                except UnicodeDecodeError:  # Skip corrupted lines without stopping the reader
+                    self.errors += 1
+                    continue
+                if component_id is not None:
+                    self.values[component_id] = not self.values[component_id]
+                    self.publish_input(self.tasks[component_id], self.components[component_id],
+                                       self.values[component_id])
+
     def read_component(self, component_id):
-        # Read from Serial until no characters are remaining
-        while self.com.in_waiting > 0:
-            character = self.com.read().decode()
-            # If the command is complete
-            if character == "\n":
-                # Update the stored value
-                self.values[self.input_ids[str(self.buffer[1:])]] = not self.values[self.input_ids[str(self.buffer[1:])]]
-                self.buffer = ""
-            else:  # Otherwise, add to the buffer
-                self.buffer += character
         return self.values[component_id]
 
     def write_component(self, component_id, msg):
@@ -46,3 +100,6 @@ class OSControllerSource(Source):
         if not msg == self.values[component_id]:
             self.values[component_id] = msg
             self.com.write(("O"+str(self.components[component_id].address)+"\n").encode())
+
+    def pushes_inputs(self):
+        return True
@@ -1,33 +1,170 @@
+import queue
+import threading
+
 import serial
 
 from Sources.Source import Source
 
 
 class SerialSource(Source):
+    """
+        Class defining a Source for devices connected over serial. Component addresses take the form PORT or
+        PORT#PREFIX. Components with the same port share one connection: messages written by a Component are preceded
+        by its prefix and received lines starting with a prefix are routed to that Component. Each port is handled by
+        its own SerialPort thread so a slow device never blocks the Task.
+
+        Attributes
+        ----------
+        ports : dict
+            Links each port name to its SerialPort
+        components : dict
+            Links Component IDs to Component objects
+
+        Methods
+        -------
+        register_component(task, component)
+            Registers the component and opens its port if it is not already open
+        close_component(component_id)
+            Removes the component and closes its port if no other components use it
+        close_source()
+            Closes all components
+        read_component(component_id)
+            Returns the most recent line received for the component
+        write_component(component_id, msg)
+            Queues msg to be written to the port of the component
+    """
 
     def __init__(self):
-        self.coms = {}
+        self.ports = {}
         self.components = {}
 
     def register_component(self, _, component):
-        self.coms[component.id] = serial.Serial(port=component.address, baudrate=component.baudrate, timeout=component.timeout, write_timeout=0)
+        port, _, prefix = component.address.partition("#")
+        if port not in self.ports:
+            self.ports[port] = SerialPort(port, component.baudrate)
+            self.ports[port].start()
+        self.ports[port].add_prefix(prefix)
         self.components[component.id] = component
 
     def close_component(self, component_id):
-        self.coms[component_id].__exit__()
-        del self.coms[component_id]
+        port, _, prefix = self.components[component_id].address.partition("#")
+        self.ports[port].remove_prefix(prefix)
+        if len(self.ports[port].values) == 0:
+            self.ports[port].stop()
+            del self.ports[port]
         del self.components[component_id]
 
     def close_source(self):
-        for component in self.components.values():
-            self.close_component(component)
+        for component_id in list(self.components):
+            self.close_component(component_id)
 
     def read_component(self, component_id):
-        return self.coms[component_id].readline()
+        port, _, prefix = self.components[component_id].address.partition("#")
+        return self.ports[port].values[prefix]
 
     def write_component(self, component_id, msg):
         if hasattr(self.components[component_id], "terminator"):
             term = self.components[component_id].terminator
         else:
             term = ""
-        self.coms[component_id].write(bytes(str(msg) + term, 'utf-8'))
+        port, _, prefix = self.components[component_id].address.partition("#")
+        self.ports[port].write(bytes(prefix + str(msg) + term, 'utf-8'))
+
+
+class SerialPort(threading.Thread):
+    """
+        Thread that owns a serial port. Received bytes are split into lines which replace the cached value for the
+        longest matching prefix. Messages are written by a separate thread as soon as they are queued so they never
+        wait for a read to time out.
+
+        Parameters
+        ----------
+        port : str
+            The name of the serial port
+        baudrate : int
+            The baud rate of the serial port
+        interval : float
+            The longest time in seconds the thread waits for new bytes before checking if the port has been stopped
+
+        Attributes
+        ----------
+        values : dict
+            Links each prefix to the most recent line received for it
+        counts : dict
+            Links each prefix to the number of Components using it
+
+        Methods
+        -------
+        add_prefix(prefix)
+            Starts caching lines for prefix
+        remove_prefix(prefix)
+            Stops caching lines for prefix once no Components use it
+        write(data)
+            Queues data to be written to the port
+        stop()
+            Writes any queued messages and closes the port
+    """
+
+    def __init__(self, port: str, baudrate: int, interval: float = 0.01):
+        super(SerialPort, self).__init__(daemon=True)
+        self.com = serial.Serial(port=port, baudrate=baudrate, timeout=interval, write_timeout=0)
+        self.values = {}
+        self.counts = {}
+        self.prefixes = []
+        self.writes = queue.Queue()
+        self.running = True
+        self.writer = threading.Thread(target=self.write_messages, daemon=True)
+
+    def start(self) -> None:
+        super(SerialPort, self).start()
+        self.writer.start()
+
+    def add_prefix(self, prefix: str) -> None:
+        self.counts[prefix] = self.counts.get(prefix, 0) + 1
+        if self.counts[prefix] == 1:
+            self.values[prefix] = b""
+            # Longer prefixes are checked first so they are not captured by prefixes they start with
+            self.prefixes = sorted(self.values, key=len, reverse=True)
+
+    def remove_prefix(self, prefix: str) -> None:
+        self.counts[prefix] -= 1
+        if self.counts[prefix] == 0:  # Keep caching lines while other Components share the prefix
+            del self.counts[prefix]
+            del self.values[prefix]
+            self.prefixes = sorted(self.values, key=len, reverse=True)
+
+    def write(self, data: bytes) -> None:
+        self.writes.put(data)
+
+    def write_messages(self) -> None:
+        while True:
+            data = self.writes.get()
+            if data is None:  # Every message queued before the port was stopped has been written
+                break
+            self.com.write(data)
+
+    def run(self) -> None:
+        buffer = bytearray()
+        while self.running:
+            # Read everything that has arrived or wait briefly for the next byte
+            data = self.com.read(max(self.com.in_waiting, 1))
+            if len(data) == 0:
+                continue
+            buffer += data
+            *lines, remainder = buffer.split(b"\n")
+            buffer = bytearray(remainder)
+            for line in lines:
+                for prefix in self.prefixes:
+                    if line.startswith(prefix.encode('utf-8')):
+                        if prefix in self.values:  # The prefix may have been removed since the loop started
+                            self.values[prefix] = bytes(line[len(prefix):]) + b"\n"
+                        break
+
+    def stop(self) -> None:
+        self.writes.put(None)
+        if self.writer.is_alive():
+            self.writer.join()
+        self.running = False
+        if self.is_alive():
+            self.join()
+        self.com.__exit__()
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from Components.Component import Component
     from Tasks.Task import Task
+    from Utilities.TimingHistogram import TimingHistogram
 
 from abc import ABCMeta, abstractmethod
 
@@ -23,6 +24,17 @@ class Source:
         Queries the current input to the component described by component_id
     write_component(component_id, msg)
         Sends data msg to the component described by component_id
+    pushes_inputs()
+        Returns True if the Source delivers inputs with publish_input rather than being polled with read_component
+    publish_input(task, component, value)
+        Queues a timestamped input change for component to be delivered at the start of the next task loop. Changes are
+        discarded while the task is not running so they are not replayed when it starts or resumes.
+    start_loop()
+        Called by each Task using the Source before every task loop
+    end_loop()
+        Called by each Task using the Source after every task loop so writes made during the loop can be combined
+    timing()
+        Returns the TimingHistograms measured by the Source to be reported with the loop timing of each Task using it
     """
 
     @abstractmethod
@@ -42,3 +54,22 @@ class Source:
     @abstractmethod
     def write_component(self, component_id: str, msg: Any) -> None:
         pass
+
+    # noinspection PyMethodMayBeStatic
+    def pushes_inputs(self) -> bool:
+        return False
+
+    def start_loop(self) -> None:
+        pass
+
+    def end_loop(self) -> None:
+        pass
+
+    def timing(self) -> dict[str, TimingHistogram]:
+        return {}
+
+    @staticmethod
+    def publish_input(task: Task, component: Component, value: Any) -> None:
+        if not task.started or task.paused:  # The queue is only emptied by the task loop
+            return
+        task.input_queue.append((component, value, task.clock.time()))
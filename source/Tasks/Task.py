@@ -1,5 +1,10 @@
 from __future__ import annotations
-import time
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from Events.Event import Event
+    from Workstation.Workstation import Workstation
+
+from collections import deque
 from abc import ABCMeta, abstractmethod
 import importlib
 from enum import Enum
@@ -12,7 +17,6 @@ from Events.InitialStateEvent import InitialStateEvent
 from Events.FinalStateEvent import FinalStateEvent
 from Sources.Source import Source
 from Utilities.AddressFile import AddressFile
-from Workstation.Workstation import Workstation
 
 
 class Task:
@@ -30,8 +34,18 @@ class Task:
             The time in seconds when the current state began
         cur_time : float
             The current time in seconds for the task loop
+        loop_period : float
+            The time in seconds between successive calls to the task loop
         events : List<Event>
-            List of events related to the current loop of the task
+            List of events related to the current loop of the task. Swapped with a second list whenever the events are
+            taken to be logged so new lists are not allocated every loop.
+        input_queue : deque
+            Timestamped input changes published by push-based Sources that have yet to be handled
+        clock : Clock
+            The source of time for the task and its components. Shared with the Workstation so sessions can be 
+            simulated faster than real time.
+        sources : list
+            The Sources used by the components of the task. Notified at the start and end of each task loop.
 
         Methods
         -------
@@ -65,6 +79,8 @@ class Task:
 
     def __init__(self, *args):
         self.events = []  # List of Events from the current task loop
+        self.logged_events = []  # List of Events most recently taken for logging, reused once they have been logged
+        self.input_queue = deque()  # Input changes published by Sources since the last task loop
         self.state = None  # The current task state
         self.entry_time = 0  # Time when the current state began
         self.start_time = 0  # Time the task started
@@ -73,6 +89,7 @@ class Task:
         self.started = False  # Boolean indicator if task has started
         self.time_into_trial = 0  # Tracks time into trial for pausing purposes
         self.time_paused = 0
+        self.loop_period = 0.001  # Time between task loops, can be overridden as a constant
 
         component_definition = self.get_components()
 
@@ -89,6 +106,7 @@ class Task:
             # Assign variables from base Task
             self.ws = args[0].ws
             self.metadata = args[0].metadata
+            self.clock = args[0].clock
             self.components = []
             for component in args[1]:
                 if component.id.split('-')[0] in component_definition:
@@ -109,6 +127,7 @@ class Task:
         else:  # If this is a standard Task
             self.ws = args[0]
             self.metadata = args[1]
+            self.clock = self.ws.clock
             sources = args[2]
             protocol = ""
             address_file = ""
@@ -181,6 +200,9 @@ class Task:
                 for cons in file_globals['protocol']:
                     if hasattr(self, cons):
                         setattr(self, cons, file_globals['protocol'][cons])
+            for component in self.components:  # Timed Components should follow the same clock as the task
+                component.clock = self.clock
+        self.sources = list(dict.fromkeys(component.source for component in self.components))
         self.init()
 
     def init(self) -> None:
@@ -201,8 +223,9 @@ class Task:
         for key, value in self.get_variables().items():
             setattr(self, key, value)
         self.start()
+        self.input_queue.clear()  # Discard changes published before the task started
         self.started = True
-        self.entry_time = self.start_time = self.cur_time = time.time()
+        self.entry_time = self.start_time = self.cur_time = self.clock.time()
         self.events.append(InitialStateEvent(self, self.state))
 
     def start(self) -> None:
@@ -220,8 +243,9 @@ class Task:
 
     def resume__(self) -> None:
         self.resume()
+        self.input_queue.clear()  # Discard changes published while the task was paused
         self.paused = False
-        time_temp = time.time()
+        time_temp = self.clock.time()
         self.time_paused += time_temp - self.cur_time
         self.cur_time = time_temp
         self.entry_time = self.cur_time - self.time_into_trial
@@ -239,8 +263,32 @@ class Task:
         pass
 
     def main_loop__(self) -> None:
-        self.cur_time = time.time()
-        self.main_loop()
+        self.cur_time = self.clock.time()
+        for source in self.sources:
+            source.start_loop()
+        try:
+            self.handle_inputs__()
+            self.main_loop()
+        finally:
+            for source in self.sources:
+                source.end_loop()
+
+    def take_events__(self) -> list[Event]:
+        """
+        Returns the Events since the last call and replaces them with the previously returned list once it is cleared.
+        The returned list is only valid until the next call.
+        """
+        events = self.events
+        self.logged_events.clear()
+        self.events = self.logged_events
+        self.logged_events = events
+        return events
+
+    def handle_inputs__(self) -> None:
+        # Deliver all input changes published since the last loop to their Components
+        while len(self.input_queue) > 0:
+            component, value, timestamp = self.input_queue.popleft()
+            component.receive(value, timestamp)
 
     def main_loop(self) -> None:
         pass
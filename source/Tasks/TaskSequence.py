@@ -1,3 +1,8 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from Workstation.Workstation import Workstation
+
 from abc import ABCMeta, abstractmethod
 from enum import Enum
 from typing import overload, Any, Type
@@ -5,9 +10,6 @@ from typing import overload, Any, Type
 from Components.Component import Component
 from Sources.Source import Source
 from Tasks.Task import Task
-import time
-
-from Workstation.Workstation import Workstation
 
 
 class TaskSequence(Task):
@@ -71,16 +73,22 @@ class TaskSequence(Task):
         self.start_sub()
 
     def log_sequence_events(self) -> None:
-        sub_events = self.cur_task.events
-        self.cur_task.events = []
+        sub_events = self.cur_task.take_events__()
         for event in sub_events:
             event.entry_time += self.sub_start_time - self.start_time
         self.events.extend(sub_events)
 
     def main_loop__(self) -> None:
-        self.cur_time = time.time()
-        self.cur_task.main_loop__()
-        self.main_loop()
+        self.cur_time = self.clock.time()
+        for source in self.sources:
+            source.start_loop()
+        try:
+            self.handle_inputs__()
+            self.cur_task.main_loop__()
+            self.main_loop()
+        finally:
+            for source in self.sources:
+                source.end_loop()
         self.log_sequence_events()
 
     def start_sub(self) -> None:
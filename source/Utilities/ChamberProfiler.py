@@ -0,0 +1,88 @@
+import cProfile
+import os
+import pstats
+import time
+from typing import Any, Callable
+
+
+class ChamberProfiler:
+    """
+        Profiles the Task loop, GUI, and EventLoggers of a single chamber for a fixed duration. cProfile only profiles the
+        thread that enables it so the logic loop and the GUI each have their own profile which are merged when saved.
+
+        Parameters
+        ----------
+        duration : float
+            The length of time in seconds to profile for
+        remote : bool
+            Boolean indicating the Task loop is profiled in another process which will send its statistics when done
+
+        Attributes
+        ----------
+        logic : Profile
+            Profile for the Task loop
+        gui : Profile
+            Profile for GUI drawing, GUI events, and EventLoggers
+        end_time : float
+            The time profiling should stop
+        remote_stats : dict
+            Statistics for the Task loop sent from another process
+
+        Methods
+        -------
+        run_logic(func, *args)
+            Calls func while profiling it with the logic profile
+        run_gui(func, *args)
+            Calls func while profiling it with the GUI profile
+        finished()
+            Returns True if the duration has elapsed and all statistics have been collected
+        save(path)
+            Writes the merged statistics to a file that can be loaded with pstats or snakeviz
+    """
+
+    def __init__(self, duration: float, remote: bool = False):
+        self.logic = cProfile.Profile()
+        self.gui = cProfile.Profile()
+        self.end_time = time.perf_counter() + duration
+        self.remote = remote
+        self.remote_stats = None
+
+    def run_logic(self, func: Callable, *args: Any) -> Any:
+        return self.logic.runcall(func, *args)
+
+    def run_gui(self, func: Callable, *args: Any) -> Any:
+        return self.gui.runcall(func, *args)
+
+    def finished(self) -> bool:
+        return time.perf_counter() > self.end_time and (not self.remote or self.remote_stats is not None)
+
+    def save(self, path: str) -> bool:
+        """
+        Writes the merged statistics to path. Returns False if nothing was profiled.
+        """
+        profiles = [self.logic, self.gui]
+        if self.remote_stats is not None:
+            profiles.append(RemoteStats(self.remote_stats))
+        for p in profiles:
+            p.create_stats()
+        profiles = [p for p in profiles if len(p.stats) > 0]
+        if len(profiles) == 0:
+            return False
+        folder = os.path.dirname(path)
+        if len(folder) > 0 and not os.path.exists(folder):
+            os.makedirs(folder)
+        stats = pstats.Stats(profiles[0])
+        if len(profiles) > 1:
+            stats.add(*profiles[1:])
+        stats.dump_stats(path)
+        return True
+
+
+class RemoteStats:
+    # Wraps statistics sent from another process so they can be loaded by pstats
+
+    def __init__(self, stats: dict):
+        self.stats = stats
+
+    def create_stats(self) -> None:
+        pass
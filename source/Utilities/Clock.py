@@ -0,0 +1,28 @@
+import threading
+import time
+from typing import Callable
+
+
+class Clock:
+    """
+        Source of time for Tasks and timed Components. The default Clock follows the system clock and runs timers on
+        background threads. A SimulatedClock can be substituted to run Tasks faster than real time.
+
+        Methods
+        -------
+        time()
+            Returns the current time in seconds
+        call_later(delay, callback)
+            Calls callback after delay seconds. Returns a timer with a cancel method.
+    """
+
+    # noinspection PyMethodMayBeStatic
+    def time(self) -> float:
+        return time.time()
+
+    # noinspection PyMethodMayBeStatic
+    def call_later(self, delay: float, callback: Callable[[], None]) -> threading.Timer:
+        timer = threading.Timer(delay, callback)
+        timer.daemon = True
+        timer.start()
+        return timer
@@ -0,0 +1,101 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from Sources.Source import Source
+
+import csv
+import os
+import time
+
+from Utilities.TimingHistogram import TimingHistogram
+
+
+class LoopTiming:
+    """
+        Collects timing statistics for the Task loop and GUI updates of a single chamber.
+
+        Attributes
+        ----------
+        histograms : dict
+            Links the name of each measured phase to its TimingHistogram. main_loop, period and jitter are recorded by
+            the logic loop while handle_events, log_events and draw are recorded by the Workstation. Histograms
+            measured by the Sources of the Task are included after these.
+        overruns : int
+            Number of iterations of the logic loop that took longer than the loop period
+        last_start : float
+            Start time of the previous iteration of the logic loop
+
+        Methods
+        -------
+        add(name, value)
+            Records a duration for the named phase
+        record_loop(start, end, loop_period)
+            Records the duration of an iteration of the logic loop and the time since the previous iteration
+        add_sources(sources)
+            Includes the histograms measured by each Source in the statistics
+        reset()
+            Removes all recorded statistics
+        summary()
+            Returns a short text description of the statistics
+        export(path)
+            Saves the statistics and histograms to a CSV file
+    """
+
+    MEASURES = ("main_loop", "period", "jitter", "handle_events", "log_events", "draw")
+
+    def __init__(self):
+        self.histograms = {name: TimingHistogram() for name in self.MEASURES}
+        self.overruns = 0
+        self.last_start = None
+
+    def add(self, name: str, value: float) -> None:
+        self.histograms[name].add(value)
+
+    def record_loop(self, start: float, end: float, loop_period: float) -> None:
+        self.histograms["main_loop"].add(end - start)
+        if end - start > loop_period:
+            self.overruns += 1
+        if self.last_start is not None:
+            period = start - self.last_start
+            self.histograms["period"].add(period)
+            self.histograms["jitter"].add(abs(period - loop_period))
+        self.last_start = start
+
+    def add_sources(self, sources: list[Source]) -> None:
+        for source in sources:
+            self.histograms.update(source.timing())
+
+    def reset(self) -> None:
+        for h in self.histograms.values():
+            h.reset()
+        self.overruns = 0
+        self.last_start = None
+
+    def summary(self) -> str:
+        lines = ["{:<14}{:>8}{:>8}{:>8}{:>8}".format("ms", "p50", "p95", "p99", "max")]
+        for name, h in self.histograms.items():
+            lines.append("{:<14}{:>8.3f}{:>8.3f}{:>8.3f}{:>8.3f}".format(name, h.percentile(50) * 1000,
+                                                                       h.percentile(95) * 1000,
+                                                                       h.percentile(99) * 1000, h.max * 1000))
+        lines.append("overruns: {}".format(self.overruns))
+        return "\n".join(lines)
+
+    def export(self, path: str) -> None:
+        folder = os.path.dirname(path)
+        if len(folder) > 0 and not os.path.exists(folder):
+            os.makedirs(folder)
+        with open(path, "w", newline='') as out:
+            w = csv.writer(out)
+            w.writerow(["Exported", time.strftime("%Y-%m-%d %H:%M:%S")])
+            w.writerow(["Overruns", self.overruns])
+            w.writerow([])
+            w.writerow(["Measure", "Count", "Mean (ms)", "P50 (ms)", "P95 (ms)", "P99 (ms)", "Max (ms)"])
+            for name, h in self.histograms.items():
+                w.writerow([name, h.count, h.mean() * 1000, h.percentile(50) * 1000, h.percentile(95) * 1000,
+                            h.percentile(99) * 1000, h.max * 1000])
+            w.writerow([])
+            # Every histogram shares the same bins
+            edges = next(iter(self.histograms.values())).edges
+            w.writerow(["Bin Upper Edge (ms)", *self.histograms.keys()])
+            for i, edge in enumerate(edges + [float("inf")]):
+                w.writerow([edge * 1000, *(h.counts[i] for h in self.histograms.values())])
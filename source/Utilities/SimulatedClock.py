@@ -0,0 +1,83 @@
+import heapq
+import itertools
+import time
+from typing import Callable
+
+from Utilities.Clock import Clock
+
+
+class SimulatedClock(Clock):
+    """
+        Clock that only advances when told to. Timers are run synchronously when the clock passes their deadline so
+        sessions can be simulated as fast as the Task logic allows.
+
+        Parameters
+        ----------
+        start : float
+            The initial time in seconds. Defaults to the current system time.
+        step : float
+            The amount of time the clock advances on each call to tick
+
+        Attributes
+        ----------
+        now : float
+            The current simulated time
+
+        Methods
+        -------
+        tick()
+            Advances the clock by step seconds
+        advance(dt)
+            Advances the clock by dt seconds running any timers that are due
+        next_deadline()
+            Returns the time of the next pending timer or None if there are no timers
+        advance_to_next_deadline()
+            Jumps straight to the next pending timer and runs it
+    """
+
+    def __init__(self, start: float = None, step: float = 0.001):
+        self.now = start if start is not None else time.time()
+        self.step = step
+        self.timers = []
+        self.counter = itertools.count()  # Keeps timers with the same deadline in the order they were added
+
+    def time(self) -> float:
+        return self.now
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> "SimulatedTimer":
+        timer = SimulatedTimer(self.now + delay, callback)
+        heapq.heappush(self.timers, (timer.deadline, next(self.counter), timer))
+        return timer
+
+    def tick(self) -> None:
+        self.advance(self.step)
+
+    def advance(self, dt: float) -> None:
+        end = self.now + dt
+        while len(self.timers) > 0 and self.timers[0][0] <= end:
+            deadline, _, timer = heapq.heappop(self.timers)
+            self.now = max(self.now, deadline)
+            if not timer.cancelled:
+                timer.callback()
+        self.now = end
+
+    def next_deadline(self) -> float:
+        while len(self.timers) > 0 and self.timers[0][2].cancelled:
+            heapq.heappop(self.timers)
+        return self.timers[0][0] if len(self.timers) > 0 else None
+
+    def advance_to_next_deadline(self) -> None:
+        deadline = self.next_deadline()
+        if deadline is not None:
+            self.advance(deadline - self.now)
+
+
+class SimulatedTimer:
+
+    def __init__(self, deadline: float, callback: Callable[[], None]):
+        self.deadline = deadline
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
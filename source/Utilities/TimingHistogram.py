@@ -0,0 +1,85 @@
+import bisect
+import math
+
+
+class TimingHistogram:
+    """
+        Fixed-size histogram of durations with logarithmically spaced bins. Recording a sample is constant time and
+        memory does not grow with the number of samples so histograms can be kept for entire sessions.
+
+        Parameters
+        ----------
+        min_value : float
+            Upper edge of the first bin in seconds
+        max_value : float
+            Upper edge of the last bin in seconds. Longer durations are placed in an overflow bin.
+        bins_per_decade : int
+            The number of bins for each factor of ten between min_value and max_value
+
+        Attributes
+        ----------
+        edges : list
+            Upper edge of each bin
+        counts : list
+            Number of samples in each bin with the final entry counting samples longer than max_value
+        count : int
+            Total number of samples
+        total : float
+            Sum of all samples
+        max : float
+            Longest sample
+
+        Methods
+        -------
+        add(value)
+            Records a new duration
+        percentile(p)
+            Returns the upper edge of the bin containing the p-th percentile
+        mean()
+            Returns the mean duration
+        merge(other)
+            Adds the samples from another histogram with the same bins
+        reset()
+            Removes all samples
+    """
+
+    def __init__(self, min_value: float = 1e-6, max_value: float = 100, bins_per_decade: int = 20):
+        n_bins = int(math.ceil(math.log10(max_value / min_value) * bins_per_decade)) + 1
+        self.edges = [min_value * 10 ** (i / bins_per_decade) for i in range(n_bins)]
+        self.counts = [0] * (n_bins + 1)
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def add(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.edges, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, p: float) -> float:
+        if self.count == 0:
+            return 0
+        target = math.ceil(self.count * p / 100)
+        cumulative = 0
+        for i, c in enumerate(self.counts):
+            cumulative += c
+            if cumulative >= target:
+                return min(self.edges[i], self.max) if i < len(self.edges) else self.max
+        return self.max
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count > 0 else 0
+
+    def merge(self, other: "TimingHistogram") -> None:
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def reset(self) -> None:
+        self.counts = [0] * len(self.counts)
+        self.count = 0
+        self.total = 0
+        self.max = 0
@@ -0,0 +1,45 @@
+import csv
+import re
+from typing import Any
+
+
+def read_configuration(file_path: str) -> dict[str, Any]:
+    """
+    Parses a chamber configuration file saved by ChamberWidget.save_configuration.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the configuration file
+
+    Returns
+    -------
+    dict
+        The chamber (one-indexed), subject, task, address_file, protocol, and prompt for the configuration along with
+        event_loggers, a list of the type name and parameters for each EventLogger
+    """
+    config = {"chamber": 0, "subject": "", "task": "", "address_file": "", "protocol": "", "prompt": "",
+              "event_loggers": []}
+    with open(file_path, newline='') as csvfile:  # Open the configuration file
+        config_reader = csv.reader(csvfile, delimiter=',', quotechar='|')
+        # Check for each relevant row in the configuration
+        for row in config_reader:
+            if row[0] == "Chamber":
+                config["chamber"] = int(row[1])
+            elif row[0] == "Subject":
+                config["subject"] = row[1]
+            elif row[0] == "Task":
+                config["task"] = row[1]
+            elif row[0] == "Address File":
+                config["address_file"] = row[1]
+            elif row[0] == "Protocol":
+                config["protocol"] = row[1]
+            elif row[0] == "Prompt":
+                config["prompt"] = row[1]
+            elif row[0] == "EventLoggers":
+                types = list(map(lambda x: x.split("))")[-1], row[1].split("((")))  # Get the type of each logger
+                params = list(map(lambda x: x.split("((")[-1], row[1].split("))")))  # Get the parameters for each logger
+                for i in range(len(types) - 1):
+                    param_vals = re.findall("\|\|(.+?)\|\|", params[i])  # Extract the parameters
+                    config["event_loggers"].append((types[i], param_vals))
+    return config
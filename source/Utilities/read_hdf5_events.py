@@ -0,0 +1,36 @@
+from typing import Any
+
+import h5py
+import numpy as np
+
+
+def read_hdf5_events(file_path: str) -> dict[str, Any]:
+    """
+    Loads a session saved by HDF5EventLogger. Each column is read directly into a NumPy array of its stored type
+    without any intermediate conversion.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the HDF5 file
+
+    Returns
+    -------
+    dict
+        The trial, time, type, and code arrays for every row along with event_types, the name of each value of the
+        type column, names, a dictionary mapping each (type, code) pair to the name of the state or input, and
+        metadata, a dictionary mapping trials to their metadata
+    """
+    with h5py.File(file_path, "r") as log_file:
+        session = {}
+        for name, dataset in log_file["events"].items():
+            session[name] = np.empty(dataset.shape, dataset.dtype)
+            if dataset.shape[0] > 0:
+                dataset.read_direct(session[name])
+        session["event_types"] = tuple(str(t) for t in log_file.attrs["event_types"])
+        names = log_file["names"]
+        session["names"] = dict(zip(zip(names["type"][()].tolist(), names["code"][()].tolist()),
+                                    names["name"].asstr()[()].tolist()))
+        metadata = log_file["metadata"]
+        session["metadata"] = dict(zip(metadata["trial"][()].tolist(), metadata["value"].asstr()[()].tolist()))
+    return session
@@ -3,14 +3,14 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from Workstation.WorkstationGUI import WorkstationGUI
 
-import csv
 import importlib
-import re
 
 from PyQt5.QtWidgets import *
 import pkgutil
 import os
 
+from Utilities.read_configuration import read_configuration
+
 
 class AddTaskDialog(QDialog):
     def __init__(self, wsg: WorkstationGUI):
@@ -55,40 +55,16 @@ class AddTaskDialog(QDialog):
 
     def accept(self) -> None:
         if self.configuration_path is not None:  # If a configuration file was provided
-            with open(self.configuration_path, newline='') as csvfile:  # Open the configuration file
-                config_reader = csv.reader(csvfile, delimiter=',', quotechar='|')
-                # Default task values
-                chamber = 0
-                task = subject = afp = pfp = ""
-                event_loggers = []
-                logger_params = []
-                # Check for each relevant row in the configuration
-                for row in config_reader:
-                    if row[0] == "Chamber":
-                        chamber = int(row[1])
-                    elif row[0] == "Subject":
-                        subject = row[1]
-                    elif row[0] == "Task":
-                        task = self.tasks.index(row[1])
-                    elif row[0] == "Address File":
-                        afp = row[1]
-                    elif row[0] == "Protocol":
-                        pfp = row[1]
-                    elif row[0] == "Prompt":
-                        prompt = row[1]
-                    elif row[0] == "EventLoggers":
-                        types = list(
-                            map(lambda x: x.split("))")[-1], row[1].split("((")))  # Get the type of each logger
-                        params = list(
-                            map(lambda x: x.split("((")[-1], row[1].split("))")))  # Get the parameters for each logger
-                        for i in range(len(types) - 1):
-                            logger_type = getattr(importlib.import_module("Events." + types[i]),
-                                                  types[i])  # Import the logger
-                            param_vals = re.findall("\|\|(.+?)\|\|", params[i])  # Extract the parameters
-                            event_loggers.append(logger_type(*param_vals))  # Instantiate the logger
-                            logger_params.append(param_vals)
-
-                self.wsg.add_task(chamber, task, subject, afp, pfp, prompt, (event_loggers, logger_params))
+            config = read_configuration(self.configuration_path)
+            event_loggers = []
+            logger_params = []
+            for logger_name, param_vals in config["event_loggers"]:
+                logger_type = getattr(importlib.import_module("Events." + logger_name), logger_name)  # Import the logger
+                event_loggers.append(logger_type(*param_vals))  # Instantiate the logger
+                logger_params.append(param_vals)
+            self.wsg.add_task(config["chamber"], self.tasks.index(config["task"]), config["subject"],
+                              config["address_file"], config["protocol"], config["prompt"],
+                              (event_loggers, logger_params))
         else:
             self.wsg.add_task(self.chamber.currentText(), self.task.currentIndex())
         super(AddTaskDialog, self).accept()
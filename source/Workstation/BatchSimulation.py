@@ -0,0 +1,144 @@
+import importlib
+import multiprocessing
+import os
+import runpy
+import time
+import traceback
+from pkgutil import iter_modules
+from typing import Any
+
+from Events.CSVEventLogger import CSVEventLogger
+from Utilities.AddressFile import AddressFile
+from Utilities.SimulatedClock import SimulatedClock
+from Workstation.HeadlessWorkstation import HeadlessWorkstation
+
+
+def simulated_sources(address_file: str) -> str:
+    """
+    Returns a source string that replaces every Source referenced by the AddressFile with an EmptySource.
+    """
+    names = ["es"]
+    if isinstance(address_file, str) and len(address_file) > 0:
+        file_globals = runpy.run_path(address_file, {"AddressFile": AddressFile})
+        for comps in file_globals['addresses'].addresses.values():
+            for comp in comps:
+                if comp is not None and comp.source_name not in names:
+                    names.append(comp.source_name)
+    return "{" + ", ".join('"{}": EmptySource()'.format(name) for name in names) + "}"
+
+
+def load_policy(policy_string: str) -> Any:
+    # Evaluate the policy expression with every BehaviorPolicy available by name
+    namespace = {}
+    for (_, module_name, _) in iter_modules(["Policies/"]):
+        module = importlib.import_module(f"Policies.{module_name}")
+        if hasattr(module, module_name):
+            namespace[module_name] = getattr(module, module_name)
+    return eval(policy_string, namespace)
+
+
+def simulate_session(session: dict[str, Any]) -> dict[str, Any]:
+    """
+    Runs a single simulated session and returns a summary of the result. Runs in a worker process of the pool.
+    """
+    result = {"subject": session["subject"], "protocol": session["protocol"], "seed": session["seed"], "error": None}
+    start = time.perf_counter()
+    clock = SimulatedClock(step=session["step"])
+    start_time = clock.time()
+    try:
+        ws = HeadlessWorkstation(simulated_sources(session["address_file"]), session["output_folder"], clock=clock)
+        ws.add_task(0, session["task"], session["address_file"], session["protocol"], [CSVEventLogger()],
+                    session["subject"])
+        if session["policy"] is not None:
+            policy = load_policy(session["policy"])
+            policy.seed(session["seed"])
+            ws.add_policy(0, policy)
+        ws.run(session["time_limit"], handle_signals=False)  # Leave signal handling to the pool
+        result["complete"] = ws.tasks[0].is_complete()
+    except Exception:
+        result["complete"] = False
+        result["error"] = traceback.format_exc()
+    result["simulated_time"] = clock.time() - start_time
+    result["wall_time"] = time.perf_counter() - start
+    return result
+
+
+class BatchSimulation:
+    """
+        Simulates sessions of a Task for a number of virtual subjects on each Protocol. Sessions run on SimulatedClocks
+        with every Source replaced by an EmptySource whose inputs are driven by a BehaviorPolicy. Sessions are spread
+        across a pool of processes and their Events are saved with CSVEventLoggers in the usual folder structure.
+
+        Parameters
+        ----------
+        task_name : str
+            The name of the Task class
+        address_file : str
+            The file path for the AddressFile
+        protocols : list
+            The file paths for the Protocols. The default values of the Task are used if none are provided.
+        subjects : int
+            The number of virtual subjects simulated on each Protocol
+        policy : str
+            Expression creating the BehaviorPolicy for each subject, for example "LeverPressPolicy(rate=0.2)"
+        step : float
+            The time in seconds the clock advances each task loop
+        output_folder : str
+            The folder data will be saved in. Defaults to Desktop/py-behav/.
+        time_limit : float
+            The simulated time in seconds after which incomplete sessions are stopped
+        seed : int
+            The seed of the first subject. Each subsequent subject uses the next seed.
+
+        Methods
+        -------
+        sessions()
+            Returns the description of every session that will be simulated
+        run(workers)
+            Simulates all sessions and returns their results
+    """
+
+    def __init__(self, task_name: str, address_file: str = "", protocols: list[str] = None, subjects: int = 1,
+                 policy: str = None, step: float = 0.01, output_folder: str = None, time_limit: float = 4 * 60 * 60,
+                 seed: int = 0):
+        self.task_name = task_name
+        self.address_file = address_file
+        self.protocols = protocols if protocols is not None and len(protocols) > 0 else [""]
+        self.subjects = subjects
+        self.policy = policy
+        self.step = step
+        if output_folder is None:
+            output_folder = "{}/py-behav/".format(os.path.join(os.path.expanduser('~'), 'Desktop'))
+        self.output_folder = output_folder
+        self.time_limit = time_limit
+        self.seed = seed
+
+    def sessions(self) -> list[dict[str, Any]]:
+        sessions = []
+        for protocol in self.protocols:
+            protocol_name = os.path.splitext(os.path.basename(protocol))[0] if len(protocol) > 0 else "default"
+            for i in range(self.subjects):
+                sessions.append({"task": self.task_name, "address_file": self.address_file, "protocol": protocol,
+                                 "subject": "sim-{}-{}".format(protocol_name, i), "policy": self.policy,
+                                 "seed": self.seed + len(sessions), "step": self.step,
+                                 "output_folder": self.output_folder, "time_limit": self.time_limit})
+        return sessions
+
+    def run(self, workers: int = None) -> list[dict[str, Any]]:
+        """
+        Simulates all sessions and returns a summary of each in the order they finished.
+
+        Parameters
+        ----------
+        workers : int
+            The number of processes to use. Defaults to the number of CPUs.
+        """
+        results = []
+        with multiprocessing.get_context("spawn").Pool(workers) as pool:
+            for result in pool.imap_unordered(simulate_session, self.sessions()):
+                results.append(result)
+                status = "error" if result["error"] is not None else "complete" if result["complete"] else "timed out"
+                print("{} ({}): {} after {:.0f} s simulated in {:.1f} s".format(result["subject"], result["protocol"],
+                                                                                status, result["simulated_time"],
+                                                                                result["wall_time"]))
+        return results
@@ -0,0 +1,209 @@
+import math
+import os
+import platform
+import tempfile
+import time
+from typing import Any
+
+import pygame
+
+from Events.CSVEventLogger import CSVEventLogger
+from Sources.EmptySource import EmptySource
+from Sources.EmptyTouchScreenSource import EmptyTouchScreenSource
+from Utilities.TimingHistogram import TimingHistogram
+from Workstation.Workstation import Workstation
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Components that cannot be represented by an EmptySource for each benchmarked Task
+ADDRESSES = {
+    "DPAL": [("touch_screen", "TouchScreen", "etss", 0)],
+    "ClosedLoop": [("stim", "ParametricStim", "es", 0), ("sham", "ParametricStim", "es", 1)]
+}
+
+
+class BenchmarkWorkstation(Workstation):
+    """
+        Workstation without the Qt interface that fills every chamber with a Task and measures how the cost of the
+        Workstation loop grows with the number of chambers. Set the SDL_VIDEODRIVER environment variable to dummy before
+        importing pygame to benchmark without a display.
+
+        Parameters
+        ----------
+        n_chamber : int
+            The number of chambers
+        w : int
+            The width in pixels of each chamber GUI
+        h : int
+            The height in pixels of each chamber GUI
+        dirty_rendering : bool
+            Boolean indicating only chambers whose GUIs have changed should be redrawn
+        log_events : bool
+            Boolean indicating Events should be saved with a CSVEventLogger
+        async_logging : bool
+            Boolean indicating Events should be saved from a LoggerThread
+
+        Attributes
+        ----------
+        loop_timing : TimingHistogram
+            Duration of each call to the Workstation loop
+        output_folder : TemporaryDirectory
+            Folder Events are saved in for the duration of the benchmark
+
+        Methods
+        -------
+        add_chambers(task_names)
+            Adds a Task to every chamber cycling through task_names
+        run(duration, warmup)
+            Repeatedly calls the Workstation loop for duration seconds and returns the measured statistics
+        close()
+            Stops all Tasks and removes them from the chambers
+    """
+
+    # noinspection PyMissingConstructor
+    def __init__(self, n_chamber: int, w: int = 300, h: int = 600, dirty_rendering: bool = False,
+                 log_events: bool = True, async_logging: bool = False):
+        self.init_chambers()
+        self.async_logging = async_logging
+        self.logging_queue_size = 100000
+        self.logging_overflow = "block"
+        self.process_mode = False
+        self.sources = {"es": EmptySource(), "etss": EmptyTouchScreenSource("(1024, 768)")}
+        self.n_chamber = n_chamber
+        self.fps = 0
+        self.dirty_rendering = dirty_rendering
+        self.log = log_events
+        self.output_folder = tempfile.TemporaryDirectory()
+        self.loop_timing = TimingHistogram()
+
+        # Arrange the chambers in a square grid
+        self.n_col = math.ceil(math.sqrt(n_chamber))
+        self.n_row = math.ceil(n_chamber / self.n_col)
+        self.w = w
+        self.h = h
+        pygame.init()
+        self.task_gui = pygame.display.set_mode((self.w * self.n_col, self.h * self.n_row), 0, 32)
+        self.wsg = BenchmarkGUI(self)
+
+    def address_file(self, task_name: str) -> str:
+        # Write an AddressFile for any Components of the Task that need a Source other than the default EmptySource
+        path = os.path.join(self.output_folder.name, "{}Addresses.py".format(task_name))
+        if task_name in ADDRESSES and not os.path.exists(path):
+            with open(path, "w") as address_file:
+                address_file.write("addresses = AddressFile()\n")
+                for cid, component_type, source_name, address in ADDRESSES[task_name]:
+                    address_file.write('addresses.add_component("{}", "{}", "{}", {})\n'.format(
+                        cid, component_type, source_name, address))
+        return path if task_name in ADDRESSES else ""
+
+    def add_chambers(self, task_names: list[str]) -> None:
+        for chamber in range(self.n_chamber):
+            task_name = task_names[chamber % len(task_names)]
+            loggers = []
+            if self.log:
+                logger = CSVEventLogger()
+                logger.output_folder = "{}/{}/".format(self.output_folder.name, chamber)
+                loggers.append(logger)
+            self.add_task(chamber, task_name, self.address_file(task_name), "", loggers)
+        for chamber in range(self.n_chamber):
+            self.start_task(chamber)
+
+    def run(self, duration: float, warmup: float = 1) -> dict[str, Any]:
+        """
+        Repeatedly calls the Workstation loop as fast as possible and returns loops per second, the time spent in
+        each phase of the loop, and memory use.
+
+        Parameters
+        ----------
+        duration : float
+            The time in seconds to measure for
+        warmup : float
+            The time in seconds to run before measuring so caches are filled
+        """
+        end = time.perf_counter() + warmup
+        while time.perf_counter() < end:
+            self.loop()
+        for runner in self.task_runners.values():
+            with runner.lock:
+                runner.timing.reset()
+        self.loop_timing.reset()
+        start = time.perf_counter()
+        end = start + duration
+        while time.perf_counter() < end:
+            loop_start = time.perf_counter()
+            self.loop()
+            self.loop_timing.add(time.perf_counter() - loop_start)
+        elapsed = time.perf_counter() - start
+
+        # Combine the statistics of every chamber
+        phases = {}
+        overruns = 0
+        for runner in self.task_runners.values():
+            with runner.lock:
+                for name, histogram in runner.timing.histograms.items():
+                    if name not in phases:
+                        phases[name] = TimingHistogram()
+                    phases[name].merge(histogram)
+                overruns += runner.timing.overruns
+        loops = self.loop_timing.count
+        return {
+            "chambers": self.n_chamber,
+            "tasks": sorted(set(type(task).__name__ for task in self.tasks.values())),
+            "duration": elapsed,
+            "loops": loops,
+            "loops_per_second": loops / elapsed,
+            "loop_ms": histogram_summary(self.loop_timing),
+            # Time spent in each GUI phase per Workstation loop summed across chambers
+            "phase_ms_per_loop": {name: phases[name].total / loops * 1000 if loops > 0 else 0
+                                  for name in ("handle_events", "draw", "log_events")},
+            "phase_ms": {name: histogram_summary(h) for name, h in phases.items()},
+            "task_loops_per_second": phases["main_loop"].count / elapsed / self.n_chamber,
+            "task_overruns": overruns,
+            "rss_mb": rss_mb()
+        }
+
+    def close(self) -> None:
+        for chamber in list(self.tasks):
+            if self.tasks[chamber].started:
+                self.stop_task(chamber)
+            self.remove_task(chamber)
+        self.output_folder.cleanup()
+
+
+class BenchmarkGUI:
+    # Stands in for the WorkstationGUI by restarting Tasks once they complete so the load stays constant
+
+    def __init__(self, ws: BenchmarkWorkstation):
+        self.chambers = {chamber: BenchmarkChamber(ws, chamber) for chamber in range(ws.n_chamber)}
+
+
+class BenchmarkChamber:
+
+    def __init__(self, ws: BenchmarkWorkstation, chamber: int):
+        self.ws = ws
+        self.chamber = chamber
+
+    def stop(self) -> None:
+        self.ws.stop_task(self.chamber)
+        self.ws.start_task(self.chamber)
+
+
+def histogram_summary(histogram: TimingHistogram) -> dict[str, float]:
+    return {"count": histogram.count, "mean": histogram.mean() * 1000, "p50": histogram.percentile(50) * 1000,
+            "p95": histogram.percentile(95) * 1000, "p99": histogram.percentile(99) * 1000,
+            "max": histogram.max * 1000}
+
+
+def rss_mb() -> float:
+    # Resident memory of the process if psutil is available
+    if psutil is None:
+        return None
+    return psutil.Process().memory_info().rss / 2 ** 20
+
+
+def system_info() -> dict[str, Any]:
+    return {"platform": platform.platform(), "processor": platform.processor(), "python": platform.python_version(),
+            "pygame": pygame.version.ver, "cpu_count": os.cpu_count()}
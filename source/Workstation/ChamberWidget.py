@@ -6,9 +6,12 @@ if TYPE_CHECKING:
 
 from PyQt5.QtWidgets import *
 from PyQt5.QtGui import *
+from PyQt5.QtCore import QTimer
 import pkgutil
 import os
 import csv
+import math
+import time
 from datetime import datetime
 
 from Workstation.IconButton import IconButton
@@ -25,6 +28,7 @@ class ChamberWidget(QGroupBox):
         self.fd = None
         self.ld = None
         self.pd = None
+        self.profile_msg = None  # Message shown when a profile is saved
         self.workstation = wsg.workstation
         self.wsg = wsg
         self.chamber = QVBoxLayout(self)
@@ -126,6 +130,22 @@ class ChamberWidget(QGroupBox):
         # Message to display before starting task
         self.prompt = prompt
 
+        # Widget showing timing statistics for the Task loop and GUI updates
+        timing_box = QGroupBox('Loop Timing')
+        timing_box.setCheckable(True)
+        timing_box.setChecked(False)
+        timing_box_layout = QVBoxLayout(self)
+        timing_box.setLayout(timing_box_layout)
+        self.timing_label = QLabel()
+        self.timing_label.setFont(QFont('Courier', 8))
+        self.timing_label.setVisible(False)
+        timing_box.toggled.connect(self.timing_label.setVisible)
+        timing_box_layout.addWidget(self.timing_label)
+        self.chamber.addWidget(timing_box)
+        self.timing_timer = QTimer(self)
+        self.timing_timer.timeout.connect(self.update_timing)
+        self.timing_timer.start(1000)
+
         # Widget corresponding to event loggers
         self.event_loggers = [TextEventLogger(), *event_loggers[0]]
         for el in self.event_loggers:
@@ -198,13 +218,13 @@ class ChamberWidget(QGroupBox):
             self.play_button.icon = 'Workstation/icons/pause.svg'
             self.play_button.hover_icon = 'Workstation/icons/pause_hover.svg'
             self.play_button.setIcon(QIcon(self.play_button.icon))
-            self.task.resume__()  # Resume the task
+            self.workstation.resume_task(int(self.chamber_id.text()) - 1)  # Resume the task
         else:  # The task is currently playing
             # Change the play to a pause button
             self.play_button.icon = 'Workstation/icons/play.svg'
             self.play_button.hover_icon = 'Workstation/icons/play_hover.svg'
             self.play_button.setIcon(QIcon(self.play_button.icon))
-            self.task.pause__()  # Pause the task
+            self.workstation.pause_task(int(self.chamber_id.text()) - 1)  # Pause the task
 
     def play_helper(self) -> None:
         # Change the play to a pause button
@@ -241,6 +261,20 @@ class ChamberWidget(QGroupBox):
         self.protocol_file_browse.setEnabled(True)
         self.output_file_path.setEnabled(True)
         self.workstation.stop_task(int(self.chamber_id.text()) - 1)  # Stop the task with the Workstation
+        # Save the timing statistics for the session alongside the event logs
+        self.workstation.task_runners[int(self.chamber_id.text()) - 1].timing.export(
+            "{}{}-timing.csv".format(self.output_file_path.text(), math.floor(time.time() * 1000)))
+
+    def update_timing(self) -> None:
+        """
+        Callback for refreshing the loop timing statistics shown in the GUI.
+        """
+        if self.timing_label.isVisible():
+            chamber = int(self.chamber_id.text()) - 1
+            lines = [self.workstation.task_runners[chamber].timing.summary()]
+            for thread in self.workstation.logger_threads.get(chamber, {}).values():  # Asynchronous logging queues
+                lines.append(thread.summary())
+            self.timing_label.setText("\n".join(lines))
 
     def subject_changed(self) -> None:
         """
@@ -272,15 +306,40 @@ class ChamberWidget(QGroupBox):
         ----------
         event
         """
+        menu = QMenu(self)
         if not self.task.started:  # If the task is not currently running
-            menu = QMenu(self)
             save_config = menu.addAction("Save Configuration")  # Saves the current configuration of the chamber
             save_config.triggered.connect(self.save_configuration)
             clear_chamber = menu.addAction("Clear Chamber")  # Alerts the Workstation to remove the Task
             clear_chamber.triggered.connect(lambda: self.wsg.remove_task(self.chamber_id.text()))
             edit_config = menu.addAction("Edit Configuration")  # Edits the Task configuration
             edit_config.triggered.connect(self.edit_configuration)
-            menu.popup(QCursor.pos())
+        if self.workstation.task_runners[int(self.chamber_id.text()) - 1].profiler is None:
+            profile = menu.addAction("Profile Chamber")  # Profiles the Task and GUI, can be used mid-session
+            profile.triggered.connect(self.profile)
+        else:
+            stop_profile = menu.addAction("Stop Profiling")  # Saves the profile before the duration has elapsed
+            stop_profile.triggered.connect(self.stop_profile)
+        menu.popup(QCursor.pos())
+
+    def profile(self) -> None:
+        duration, ok = QInputDialog.getInt(self, "Profile Chamber", "Duration (s)", 30, 1, 3600)
+        if ok:
+            self.workstation.start_profile(int(self.chamber_id.text()) - 1, duration, self.output_file_path.text())
+
+    def stop_profile(self) -> None:
+        """
+        Saves the profile for the chamber and tells the user where it was saved.
+        """
+        path = self.workstation.stop_profile(int(self.chamber_id.text()) - 1)
+        self.profile_msg = QMessageBox()
+        self.profile_msg.setIcon(QMessageBox.Information)
+        if path is not None:
+            self.profile_msg.setText("Profile saved to {}".format(path))
+        else:
+            self.profile_msg.setText("Nothing was profiled")
+        self.profile_msg.setWindowTitle("Profile Chamber {}".format(self.chamber_id.text()))
+        self.profile_msg.show()
 
     def save_configuration(self) -> None:
         desktop = os.path.join(os.path.join(os.path.expanduser('~')), 'Desktop')
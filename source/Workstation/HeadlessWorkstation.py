@@ -0,0 +1,255 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from Events.EventLogger import EventLogger
+    from Policies.BehaviorPolicy import BehaviorPolicy
+    from Tasks.Task import Task
+
+import importlib
+import math
+import os
+import signal
+import time
+from datetime import datetime
+from typing import Type
+
+from Events.FileEventLogger import FileEventLogger
+from Events.GUIEventLogger import GUIEventLogger
+from Utilities.Clock import Clock
+from Utilities.SimulatedClock import SimulatedClock
+from Utilities.read_configuration import read_configuration
+from Workstation.TaskProcess import SourceLoader
+from Workstation.TaskThread import TaskThread
+
+
+class HeadlessWorkstation:
+    """
+        Runs Tasks loaded from chamber configuration files without pygame or Qt. Each Task runs on its own TaskThread
+        while the HeadlessWorkstation logs Events and stops Tasks once they are complete. If a SimulatedClock is
+        provided, the Tasks are instead run in lockstep on the main thread with the clock advancing after each loop so
+        sessions complete as fast as the Task logic allows.
+
+        Parameters
+        ----------
+        source_string : str
+            The dictionary of Sources in the same format as the sources setting
+        output_folder : str
+            The folder data will be saved in. Defaults to Desktop/py-behav.
+        log_period : float
+            The time in seconds between checks for Events and completed Tasks
+        clock : Clock
+            The source of time for all Tasks. Defaults to the system clock.
+
+        Attributes
+        ----------
+        tasks : dict
+            Links chamber indices to their Tasks
+        event_loggers : dict
+            Links chamber indices to their EventLoggers
+        task_runners : dict
+            Links chamber indices to the TaskThread running their Task
+        sources : dict
+            Links Source names to Sources. Sources are only created when a Task requires them.
+        clock : Clock
+            The source of time for all Tasks
+        simulated : bool
+            Boolean indicating the Tasks are run with a SimulatedClock
+        policies : dict
+            Links chamber indices to the BehaviorPolicy driving the inputs of their simulated Task
+
+        Methods
+        -------
+        add_configuration(file_path)
+            Creates a Task from a chamber configuration file
+        add_task(chamber, task_name, address_file, protocol, task_event_loggers, subject)
+            Creates a Task and adds it to the chamber
+        add_policy(chamber, policy)
+            Simulates the behavior of the subject in the chamber with policy
+        run(time_limit)
+            Starts all Tasks and logs their Events until every Task is complete
+    """
+
+    def __init__(self, source_string: str, output_folder: str = None, log_period: float = 0.01, clock: Clock = None):
+        self.tasks = {}
+        self.event_loggers = {}
+        self.task_runners = {}
+        self.clock = clock if clock is not None else Clock()
+        self.simulated = isinstance(self.clock, SimulatedClock)
+        self.policies = {}
+        self.sources = SourceLoader(source_string)
+        if output_folder is None:
+            output_folder = "{}/py-behav/".format(os.path.join(os.path.expanduser('~'), 'Desktop'))
+        self.output_folder = output_folder
+        self.log_period = log_period
+        self.running = False
+
+    def add_configuration(self, file_path: str) -> None:
+        """
+        Creates a Task from a chamber configuration file saved by a ChamberWidget.
+
+        Parameters
+        ----------
+        file_path : str
+            The path to the configuration file
+        """
+        config = read_configuration(file_path)
+        event_loggers = []
+        for logger_name, param_vals in config["event_loggers"]:
+            logger_type = getattr(importlib.import_module("Events." + logger_name), logger_name)
+            if issubclass(logger_type, GUIEventLogger):  # EventLoggers with widgets cannot run without Qt
+                print("Chamber {}: skipping {} as it requires the GUI".format(config["chamber"], logger_name))
+                continue
+            event_loggers.append(logger_type(*param_vals))
+        self.add_task(config["chamber"] - 1, config["task"], config["address_file"], config["protocol"], event_loggers,
+                      config["subject"])
+
+    def add_task(self, chamber: int, task_name: str, address_file: str, protocol: str,
+                 task_event_loggers: list[EventLogger], subject: str = "default") -> None:
+        """
+        Creates a Task and adds it to the chamber.
+
+        Parameters
+        ----------
+        chamber : int
+            The index of the chamber where the task will be added
+        task_name : string
+            The name corresponding to the Task class
+        address_file : string
+            The file path for the Address File
+        protocol : string
+            The file path for the Protocol
+        task_event_loggers : list
+            The list of EventLoggers for the task
+        subject : string
+            The name of the subject
+        """
+        task = getattr(importlib.import_module("Tasks." + task_name), task_name)
+        metadata = {"chamber": chamber, "subject": subject}
+        self.tasks[chamber] = task(self, metadata, self.sources, address_file, protocol)  # Create the task
+        self.event_loggers[chamber] = task_event_loggers
+        for logger in task_event_loggers:
+            logger.set_task(self.tasks[chamber])
+            if isinstance(logger, FileEventLogger):  # Save data in the same folder structure as the Workstation GUI
+                logger.output_folder = self.get_output_folder(chamber)
+        self.task_runners[chamber] = TaskThread(self, chamber)
+        if not self.simulated:  # Simulated Tasks are stepped by the HeadlessWorkstation instead
+            self.task_runners[chamber].start()
+
+    def add_policy(self, chamber: int, policy: BehaviorPolicy) -> None:
+        """
+        Simulates the behavior of the subject in the chamber with policy. Only used with a SimulatedClock.
+
+        Parameters
+        ----------
+        chamber : int
+            The index of the chamber
+        policy : BehaviorPolicy
+            The policy that will drive the inputs of the Task
+        """
+        self.policies[chamber] = policy
+
+    def get_output_folder(self, chamber: int) -> str:
+        return "{}{}/Data/{}/{}/".format(self.output_folder, type(self.tasks[chamber]).__name__,
+                                         self.tasks[chamber].metadata["subject"], datetime.now().strftime("%m-%d-%Y"))
+
+    # noinspection PyMethodMayBeStatic
+    def switch_task(self, task_base: Task, task_name: Type[Task], protocol: str = None) -> Task:
+        """
+        Switch the active Task in a sequence.
+
+        Parameters
+        ----------
+        task_base : Task
+            The base Task of the sequence
+        task_name : Class
+            The next Task in the sequence
+        protocol : dict
+            Dictionary representing the protocol for the new Task
+        """
+        return task_name(task_base, task_base.components, protocol)
+
+    def start_task(self, chamber: int) -> None:
+        with self.task_runners[chamber].lock:
+            self.task_runners[chamber].start_task()  # Start the Task
+            for el in self.event_loggers[chamber]:  # Start all EventLoggers
+                el.start()
+        self.log_events(chamber)  # Log initial events
+
+    def stop_task(self, chamber: int) -> None:
+        with self.task_runners[chamber].lock:
+            self.task_runners[chamber].stop_task()  # Stop the task
+        self.log_events(chamber)  # Log remaining events
+        for el in self.event_loggers[chamber]:
+            el.flush()
+        self.task_runners[chamber].timing.export("{}{}-timing.csv".format(self.get_output_folder(chamber),
+                                                                          math.floor(time.time() * 1000)))
+
+    def log_events(self, chamber: int) -> None:
+        # Take the Events from the Task so the logic thread can continue while they are logged
+        with self.task_runners[chamber].lock:
+            events = self.tasks[chamber].take_events__()
+        start = time.perf_counter()
+        for el in self.event_loggers[chamber]:
+            el.log_events(events)
+        self.task_runners[chamber].timing.add("log_events", time.perf_counter() - start)
+
+    def run(self, time_limit: float = None, handle_signals: bool = True) -> None:
+        """
+        Starts all Tasks and logs their Events until every Task is complete or py-behav is interrupted.
+
+        Parameters
+        ----------
+        time_limit : float
+            If provided, the time in seconds on the clock after which any incomplete Tasks are stopped
+        handle_signals : bool
+            Indicates if SIGTERM and SIGINT should stop the Tasks. The previous handlers are restored once all Tasks
+            have stopped. Should be False when running inside a process pool which relies on its own handling.
+        """
+        if handle_signals:
+            handlers = {sig: signal.signal(sig, self.exit_handler) for sig in (signal.SIGTERM, signal.SIGINT)}
+        try:
+            self.running = True
+            for chamber in self.tasks:
+                self.start_task(chamber)
+            end_time = self.clock.time() + time_limit if time_limit is not None else None
+            while self.running and any(task.started for task in self.tasks.values()):
+                if end_time is not None and self.clock.time() > end_time:
+                    break
+                if self.simulated:  # Run each Task loop once then move the clock forward
+                    for chamber in self.tasks:
+                        if self.tasks[chamber].started:
+                            if chamber in self.policies:  # Simulate the subject before the Task handles its inputs
+                                self.policies[chamber].act(self.tasks[chamber])
+                            self.task_runners[chamber].step()
+                    self.clock.tick()
+                for chamber in self.tasks:
+                    if self.tasks[chamber].started:
+                        if self.task_runners[chamber].complete:  # Stop the Task if it is complete
+                            self.stop_task(chamber)
+                        else:
+                            self.log_events(chamber)
+                if not self.simulated:
+                    time.sleep(self.log_period)
+            self.close()
+        finally:
+            if handle_signals:
+                for sig, handler in handlers.items():
+                    signal.signal(sig, handler if handler is not None else signal.SIG_DFL)
+
+    def exit_handler(self, *_) -> None:
+        self.running = False
+
+    def close(self) -> None:
+        """
+        Stops all Tasks and closes all EventLoggers, Components, and Sources.
+        """
+        for chamber in self.tasks:
+            if self.tasks[chamber].started:
+                self.stop_task(chamber)
+            self.task_runners[chamber].stop()
+            for el in self.event_loggers[chamber]:
+                el.close()
+            for c in self.tasks[chamber].components:
+                c.close()
+        for src in list(self.sources.values()):
+            src.close_source()
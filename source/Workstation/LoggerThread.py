@@ -0,0 +1,119 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from Events.Event import Event
+    from Events.EventLogger import EventLogger
+
+import threading
+import traceback
+from collections import deque
+
+
+class LoggerThread(threading.Thread):
+    """
+        Thread that passes Events to a single EventLogger so slow disks or network connections do not delay the
+        Workstation loop. Events are held in a bounded queue until the EventLogger is ready for them.
+
+        Parameters
+        ----------
+        logger : EventLogger
+            The EventLogger Events are passed to
+        max_size : int
+            The maximum number of Events that can be waiting to be logged
+        overflow : str
+            What to do with new Events when the queue is full. "block" waits for space, "drop_newest" discards the new
+            Events, and "drop_oldest" discards the Events that have been waiting the longest.
+
+        Attributes
+        ----------
+        depth : int
+            Number of Events waiting to be logged
+        max_depth : int
+            Largest number of Events that have been waiting to be logged at once
+        dropped : int
+            Number of Events discarded because the queue was full
+        logged : int
+            Number of Events passed to the EventLogger
+
+        Methods
+        -------
+        put(events)
+            Queues a list of Events to be logged
+        drain()
+            Waits until all queued Events have been logged
+        stop()
+            Logs any remaining Events and waits for the thread to exit
+        summary()
+            Returns a short text description of the queue statistics
+    """
+
+    OVERFLOW_POLICIES = ("block", "drop_newest", "drop_oldest")
+
+    def __init__(self, logger: EventLogger, max_size: int = 100000, overflow: str = "block"):
+        super(LoggerThread, self).__init__(daemon=True)
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError("Unknown overflow policy {}".format(overflow))
+        self.logger = logger
+        self.max_size = max_size
+        self.overflow = overflow
+        self.batches = deque()
+        self.condition = threading.Condition()
+        self.busy = False
+        self.running = True
+        self.depth = 0
+        self.max_depth = 0
+        self.dropped = 0
+        self.logged = 0
+
+    def put(self, events: list[Event]) -> None:
+        if len(events) == 0:
+            return
+        with self.condition:
+            if self.depth + len(events) > self.max_size:
+                if self.overflow == "block":
+                    self.condition.wait_for(lambda: self.depth + len(events) <= self.max_size or self.depth == 0)
+                elif self.overflow == "drop_newest":
+                    self.dropped += len(events)
+                    return
+                else:
+                    while len(self.batches) > 0 and self.depth + len(events) > self.max_size:
+                        self.depth -= len(self.batches[0])
+                        self.dropped += len(self.batches.popleft())
+            # The list is copied as the Task reuses it once it has been logged
+            self.batches.append(list(events))
+            self.depth += len(events)
+            self.max_depth = max(self.max_depth, self.depth)
+            self.condition.notify_all()
+
+    def run(self) -> None:
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: len(self.batches) > 0 or not self.running)
+                if len(self.batches) == 0:
+                    return
+                events = self.batches.popleft()
+                self.busy = True
+            try:
+                self.logger.log_events(events)
+            except Exception:
+                traceback.print_exc()  # A failing EventLogger should not stop later Events from being logged
+            with self.condition:
+                self.busy = False
+                self.depth -= len(events)
+                self.logged += len(events)
+                self.condition.notify_all()
+
+    def drain(self) -> None:
+        with self.condition:
+            self.condition.wait_for(lambda: (len(self.batches) == 0 and not self.busy) or not self.is_alive())
+
+    def stop(self) -> None:
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        if self.is_alive():
+            self.join()
+
+    def summary(self) -> str:
+        return "{}: queued {} (max {}), logged {}, dropped {}".format(type(self.logger).__name__, self.depth,
+                                                                     self.max_depth, self.logged, self.dropped)
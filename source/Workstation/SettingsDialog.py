@@ -9,6 +9,9 @@ import pkgutil
 import importlib
 import inspect
 
+from Workstation.LoggerThread import LoggerThread
+from Workstation.TaskProcess import ProxySource
+
 
 class SettingsDialog(QDialog):
     def __init__(self, workstation: Workstation):
@@ -36,7 +39,8 @@ class SettingsDialog(QDialog):
         source_box_layout = QVBoxLayout(self)
         self.source_list = QListWidget()
         for sn in workstation.sources:
-            QListWidgetItem("{} ({})".format(sn, type(workstation.sources[sn]).__name__), self.source_list)
+            source_type = getattr(workstation.sources[sn], "source_type", type(workstation.sources[sn]).__name__)
+            QListWidgetItem("{} ({})".format(sn, source_type), self.source_list)
         self.source_list.itemClicked.connect(self.on_source_clicked)
         source_box_layout.addWidget(self.source_list)
         source_as_layout = QHBoxLayout(self)
@@ -55,12 +59,42 @@ class SettingsDialog(QDialog):
         source_box_layout.addLayout(source_as_layout)
         source_box.setLayout(source_box_layout)
         self.layout.addWidget(source_box)
+        self.process_mode = QCheckBox("Run each chamber in its own process (requires restart)")
+        self.process_mode.setChecked(bool(int(QSettings().value("process_mode", 0))))
+        self.layout.addWidget(self.process_mode)
+        self.dirty_rendering = QCheckBox("Only redraw chambers whose GUIs have changed")
+        self.dirty_rendering.setChecked(workstation.dirty_rendering)
+        self.layout.addWidget(self.dirty_rendering)
+        self.logging_box = QGroupBox('Log events on background threads')
+        self.logging_box.setCheckable(True)
+        self.logging_box.setChecked(workstation.async_logging)
+        logging_box_layout = QFormLayout(self)
+        self.logging_queue_size = QSpinBox()
+        self.logging_queue_size.setRange(1, 10000000)
+        self.logging_queue_size.setValue(workstation.logging_queue_size)
+        logging_box_layout.addRow("Queue size (events)", self.logging_queue_size)
+        self.logging_overflow = QComboBox()
+        self.logging_overflow.addItems(LoggerThread.OVERFLOW_POLICIES)
+        self.logging_overflow.setCurrentText(workstation.logging_overflow)
+        logging_box_layout.addRow("When full", self.logging_overflow)
+        self.logging_box.setLayout(logging_box_layout)
+        self.layout.addWidget(self.logging_box)
         self.layout.addWidget(self.control_buttons)
         self.setLayout(self.layout)
     
     def accept(self) -> None:
         settings = QSettings()
         settings.setValue("n_chamber", self.n_chamber.text())
+        settings.setValue("process_mode", int(self.process_mode.isChecked()))
+        settings.setValue("pygame/dirty_rendering", int(self.dirty_rendering.isChecked()))
+        self.workstation.dirty_rendering = self.dirty_rendering.isChecked()
+        # Logging changes apply to Tasks started afterwards
+        settings.setValue("logging/async", int(self.logging_box.isChecked()))
+        settings.setValue("logging/queue_size", self.logging_queue_size.value())
+        settings.setValue("logging/overflow", self.logging_overflow.currentText())
+        self.workstation.async_logging = self.logging_box.isChecked()
+        self.workstation.logging_queue_size = self.logging_queue_size.value()
+        self.workstation.logging_overflow = self.logging_overflow.currentText()
         self.workstation.n_chamber = int(self.n_chamber.text())
         self.workstation.compute_chambergui()
         super(SettingsDialog, self).accept()
@@ -144,7 +178,10 @@ class AddSourceDialog(QDialog):
         source_string = source_string[:-1] + ', "{}": {}({})'.format(self.name.text(), self.source.currentText(),
                                                                      ','.join(f'"{w}"' for w in self.params)) + "}"
         settings.setValue("sources", source_string)
-        self.sd.workstation.sources[self.name.text()] = source_type(*self.params)
+        if self.sd.workstation.process_mode:  # The Source will be created by the chamber processes that use it
+            self.sd.workstation.sources[self.name.text()] = ProxySource(self.name.text(), self.source.currentText())
+        else:
+            self.sd.workstation.sources[self.name.text()] = source_type(*self.params)
         QListWidgetItem("{} ({})".format(self.name.text(), self.source.currentText()), self.sd.source_list)
         super(AddSourceDialog, self).accept()
 
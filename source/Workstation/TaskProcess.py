@@ -0,0 +1,471 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any
+if TYPE_CHECKING:
+    from Tasks.Task import Task
+    from Workstation.Workstation import Workstation
+
+import ast
+import cProfile
+import importlib
+import multiprocessing
+import pickle
+import queue
+import struct
+import threading
+import time
+import traceback
+from enum import Enum
+from multiprocessing import shared_memory
+from pkgutil import iter_modules
+
+from Sources.Source import Source
+from Utilities.ChamberProfiler import ChamberProfiler
+from Utilities.Clock import Clock
+from Utilities.LoopTiming import LoopTiming
+from Utilities.timer_resolution import timer_resolution
+
+HEADER = struct.Struct("QQ")  # Snapshot sequence number and length at the start of the shared memory block
+SNAPSHOT_SIZE = 2 ** 20  # Size in bytes of the shared memory block for each chamber
+GUI_MEASURES = ("handle_events", "log_events", "draw")  # Timing measured by the Workstation rather than the chamber
+context = multiprocessing.get_context("spawn")  # Chamber processes should not inherit the state of pygame and Qt
+
+
+def source_expressions(source_string: str) -> dict[str, str]:
+    """
+    Splits the sources setting into the code for constructing each Source.
+
+    Parameters
+    ----------
+    source_string : str
+        The dictionary of Sources saved in the settings
+
+    Returns
+    -------
+    dict
+        Links Source names to the expression used to create the Source
+    """
+    tree = ast.parse(source_string, mode="eval")
+    return {ast.literal_eval(key): ast.get_source_segment(source_string, value)
+            for key, value in zip(tree.body.keys, tree.body.values)}
+
+
+def is_data(value: Any) -> bool:
+    """
+    Returns True if the value is plain data that can be copied from the chamber process to the GUI.
+    """
+    if value is None or isinstance(value, (bool, int, float, str, Enum)):
+        return True
+    elif isinstance(value, (list, tuple)):
+        return all(map(is_data, value))
+    elif isinstance(value, dict):
+        return all(is_data(k) and is_data(v) for k, v in value.items())
+    return type(value).__module__ == "numpy"
+
+
+def data_attributes(obj: Any, exclude: tuple[str, ...] = ()) -> dict[str, Any]:
+    return {k: v for k, v in vars(obj).items() if k not in exclude and is_data(v)}
+
+
+class SourceLoader(dict):
+    """
+        Dictionary of Sources that only constructs a Source the first time it is requested so a chamber process only
+        connects to the hardware its Task uses.
+    """
+
+    def __init__(self, source_string: str):
+        super(SourceLoader, self).__init__()
+        self.expressions = source_expressions(source_string)
+        self.namespace = {}
+        for (_, module_name, _) in iter_modules(["Sources/"]):
+            module = importlib.import_module(f"Sources.{module_name}")
+            if hasattr(module, module_name):
+                self.namespace[module_name] = getattr(module, module_name)
+
+    def __missing__(self, key: str) -> Source:
+        self[key] = eval(self.expressions[key], self.namespace)
+        return self[key]
+
+
+class ProxySource(Source):
+    """
+        Class defining a stand-in for a Source that lives in a chamber process. Components of the GUI's copy of the Task
+        are registered with a ProxySource so that writes from the GUI are forwarded to the chamber process.
+
+        Attributes
+        ----------
+        name : str
+            The name of the Source in the settings
+        source_type : str
+            The class name of the Source in the chamber process
+        process : TaskProcess
+            The chamber process writes are forwarded to
+        display_size : tuple
+            The size of the display for touchscreen Sources
+        next_id : int
+            The address given to the next Component without one in the AddressFile
+    """
+
+    def __init__(self, name: str, source_type: str, process: TaskProcess = None, display_size: tuple[int, int] = None):
+        self.name = name
+        self.source_type = source_type
+        self.process = process
+        self.display_size = display_size
+        self.components = {}
+        self.next_id = 0
+
+    def register_component(self, task, component):
+        self.next_id += 1
+        self.components[component.id] = component
+
+    def read_component(self, component_id):
+        return None
+
+    def write_component(self, component_id, msg):
+        if self.process is not None:
+            self.process.commands.put(("write", component_id, msg))
+
+
+class TaskProcess:
+    """
+        Runs the Task for a single chamber in its own process. The GUI interacts with a copy of the Task that is
+        updated from a snapshot the chamber process writes to shared memory.
+
+        Parameters
+        ----------
+        ws : Workstation
+            The Workstation the chamber belongs to
+        chamber : int
+            The index of the chamber
+        task_name : str
+            The name of the Task class
+        address_file : str
+            The file path for the Address File
+        protocol : str
+            The file path for the Protocol
+        source_string : str
+            The dictionary of Sources saved in the settings
+
+        Attributes
+        ----------
+        lock : RLock
+            Lock held while the GUI copy of the Task is being updated
+        complete : bool
+            Boolean indicating the Task has completed and is waiting to be stopped by the Workstation
+        commands : Queue
+            Commands sent to the chamber process
+        messages : Queue
+            Events and replies sent from the chamber process
+        display_sizes : dict
+            Links Source names to the display size reported by the chamber process
+        timing : LoopTiming
+            Timing statistics for the Task loop and GUI updates of the chamber
+        profiler : ChamberProfiler
+            Profiler for the chamber if one is currently running
+
+        Methods
+        -------
+        update()
+            Copies the latest snapshot and Events from the chamber process to the GUI copy of the Task
+        start_task(), pause_task(), resume_task(), stop_task()
+            Controls the Task in the chamber process
+        start_profile(duration)
+            Profiles the Task loop in the chamber process for duration seconds
+        stop_profile()
+            Ends profiling, waits for the statistics from the chamber process, and returns the ChamberProfiler
+        stop()
+            Ends the chamber process
+    """
+
+    def __init__(self, ws: Workstation, chamber: int, task_name: str, address_file: str, protocol: str, source_string: str):
+        self.ws = ws
+        self.chamber = chamber
+        self.lock = threading.RLock()
+        self.complete = False
+        self.sequence = 0
+        self.timing = LoopTiming()
+        self.profiler = None
+        self.commands = context.Queue()
+        self.messages = context.Queue()
+        self.shm = shared_memory.SharedMemory(create=True, size=SNAPSHOT_SIZE)
+        HEADER.pack_into(self.shm.buf, 0, 0, 0)
+        self.shm_lock = context.Lock()
+        self.process = context.Process(target=run_chamber, daemon=True,
+                                      args=(chamber, task_name, address_file, protocol, source_string, self.commands,
+                                            self.messages, self.shm.name, self.shm_lock, 1 / ws.fps))
+        self.process.start()
+        try:
+            self.display_sizes = self.wait_for("ready", 30)
+        except ChamberProcessError:  # Clean up here as the Workstation never receives a TaskProcess to stop
+            if self.process.is_alive():
+                self.process.terminate()
+            self.process.join()
+            self.shm.close()
+            self.shm.unlink()
+            raise
+
+    def wait_for(self, reply: str, timeout: float = 5) -> Any:
+        # Handle messages from the chamber process until the indicated reply arrives
+        end_time = time.perf_counter() + timeout
+        while True:
+            try:
+                msg = self.messages.get(timeout=max(end_time - time.perf_counter(), 0))
+            except queue.Empty:
+                raise ChamberProcessError("Chamber {} did not respond to {}".format(self.chamber + 1, reply))
+            if msg[0] == "error":
+                raise ChamberProcessError(msg[1])
+            elif msg[0] == reply:
+                return msg[1]
+            self.handle_message(msg)
+
+    def handle_message(self, msg: tuple) -> None:
+        if msg[0] == "events":
+            self.ws.tasks[self.chamber].events.extend(msg[1])
+        elif msg[0] == "profile" and self.profiler is not None:
+            self.profiler.remote_stats = msg[1]
+        elif msg[0] == "snapshot_memory":  # The chamber process moved its snapshots to a larger block
+            with self.shm_lock:
+                self.shm.close()
+                self.shm.unlink()
+                self.shm = shared_memory.SharedMemory(name=msg[1])
+
+    def command(self, *cmd: Any) -> None:
+        self.commands.put(cmd)
+        self.wait_for(cmd[0])
+        self.update()
+
+    def update(self) -> None:
+        with self.lock:
+            while True:
+                try:
+                    self.handle_message(self.messages.get_nowait())
+                except queue.Empty:
+                    break
+            with self.shm_lock:
+                sequence, length = HEADER.unpack_from(self.shm.buf, 0)
+                if sequence == self.sequence:
+                    return
+                data = bytes(self.shm.buf[HEADER.size:HEADER.size + length])
+            self.sequence = sequence
+            self.apply_snapshot(pickle.loads(data))
+
+    def apply_snapshot(self, snapshot: dict) -> None:
+        task = self.ws.tasks[self.chamber]
+        for key, value in snapshot["task"].items():
+            setattr(task, key, value)
+        for component in task.components:
+            for key, value in snapshot["components"][component.id].items():
+                setattr(component, key, value)
+        if snapshot["sub_task"] is not None:
+            module, name, attributes = snapshot["sub_task"]
+            # Create the matching sub Task and GUI if the sequence has moved on
+            if getattr(task, "cur_task", None) is None or type(task.cur_task).__name__ != name:
+                task.cur_task = self.ws.switch_task(task, getattr(importlib.import_module(module), name))
+            for key, value in attributes.items():
+                setattr(task.cur_task, key, value)
+        self.complete = snapshot["complete"]
+        # The logic loop and Sources are timed in the chamber process
+        self.timing.histograms.update(snapshot["timing"])
+        self.timing.overruns = snapshot["overruns"]
+
+    def start_task(self) -> None:
+        self.timing.reset()
+        self.command("start", self.ws.tasks[self.chamber].metadata)
+
+    def pause_task(self) -> None:
+        self.command("pause")
+
+    def resume_task(self) -> None:
+        self.command("resume")
+
+    def stop_task(self) -> None:
+        self.command("stop")
+
+    def start_profile(self, duration: float) -> None:
+        self.profiler = ChamberProfiler(duration, True)
+        self.commands.put(("profile", duration))
+
+    def stop_profile(self) -> ChamberProfiler:
+        with self.lock:
+            profiler = self.profiler
+            if profiler is not None and profiler.remote_stats is None and self.process.is_alive():
+                # Have the chamber process send its statistics now rather than when the duration elapses
+                self.commands.put(("stop_profile",))
+                try:
+                    profiler.remote_stats = self.wait_for("profile")
+                except ChamberProcessError:  # The profile is saved without the Task loop
+                    pass
+            self.profiler = None
+        return profiler
+
+    def stop(self) -> None:
+        if self.process.is_alive():
+            try:
+                self.command("exit")
+            except ChamberProcessError:
+                self.process.terminate()
+            self.process.join()
+        self.shm.close()
+        self.shm.unlink()
+
+
+def run_chamber(chamber: int, task_name: str, address_file: str, protocol: str, source_string: str,
+                commands: multiprocessing.Queue, messages: multiprocessing.Queue, shm_name: str, shm_lock: Any,
+                snapshot_period: float) -> None:
+    try:
+        runner = ChamberRunner(chamber, task_name, address_file, protocol, source_string, commands, messages, shm_name,
+                               shm_lock, snapshot_period)
+    except Exception:
+        messages.put(("error", traceback.format_exc()))
+        return
+    with timer_resolution():  # The chamber process never initialises pygame which would otherwise raise the resolution
+        runner.run()
+
+
+class ChamberRunner:
+    """
+        Runs a Task inside a chamber process. The ChamberRunner acts as the Workstation for the Task.
+    """
+
+    def __init__(self, chamber: int, task_name: str, address_file: str, protocol: str, source_string: str,
+                 commands: multiprocessing.Queue, messages: multiprocessing.Queue, shm_name: str, shm_lock: Any,
+                 snapshot_period: float):
+        self.commands = commands
+        self.messages = messages
+        self.chamber = chamber
+        self.shm = shared_memory.SharedMemory(name=shm_name)
+        self.shm_lock = shm_lock
+        self.snapshot_period = snapshot_period
+        self.sequence = 0
+        self.complete = False
+        self.running = True
+        self.timing = LoopTiming()
+        self.profile = None
+        self.profile_end = 0
+        self.clock = Clock()
+        self.sources = SourceLoader(source_string)
+        task_type = getattr(importlib.import_module("Tasks." + task_name), task_name)
+        self.task = task_type(self, {"chamber": chamber, "subject": "default"}, self.sources, address_file, protocol)
+        self.timing.add_sources(self.task.sources)
+        self.components = {component.id: component for component in self.task.components}
+        self.messages.put(("ready", {name: getattr(self.sources[name], "display_size", None) for name in self.sources}))
+
+    def run(self) -> None:
+        next_time = next_snapshot = time.perf_counter()
+        while self.running:
+            self.handle_commands()
+            if self.task.started and not self.task.paused and not self.complete:
+                start = time.perf_counter()
+                if self.profile is not None:
+                    self.profile.runcall(self.task.main_loop__)
+                else:
+                    self.task.main_loop__()
+                self.timing.record_loop(start, time.perf_counter(), self.task.loop_period)
+                if self.task.is_complete():
+                    self.complete = True
+                self.log_events(None)
+            if time.perf_counter() > self.profile_end:
+                self.send_profile()
+            if time.perf_counter() >= next_snapshot:
+                self.write_snapshot()
+                next_snapshot += self.snapshot_period
+            next_time += self.task.loop_period
+            delay = next_time - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_time = time.perf_counter()
+        for c in self.task.components:
+            c.close()
+        for src in list(self.sources.values()):
+            src.close_source()
+        self.shm.close()
+        self.messages.put(("exit", None))
+
+    def handle_commands(self) -> None:
+        while True:
+            try:
+                cmd = self.commands.get_nowait()
+            except queue.Empty:
+                return
+            if cmd[0] == "write":  # Forward a write from the GUI to the Component's Source
+                self.components[cmd[1]].write(cmd[2])
+                continue
+            elif cmd[0] == "profile":
+                self.profile = cProfile.Profile()
+                self.profile_end = time.perf_counter() + cmd[1]
+                continue
+            elif cmd[0] == "stop_profile":  # The profile may have already been sent if the duration elapsed
+                self.profile_end = 0
+                self.send_profile()
+                continue
+            elif cmd[0] == "start":
+                self.task.metadata.update(cmd[1])
+                self.complete = False
+                self.timing.reset()
+                self.task.start__()
+            elif cmd[0] == "pause":
+                self.task.pause__()
+            elif cmd[0] == "resume":
+                self.timing.last_start = None
+                self.task.resume__()
+            elif cmd[0] == "stop":
+                self.task.stop__()
+                self.complete = False
+            elif cmd[0] == "exit":
+                self.running = False
+                return
+            self.log_events(None)
+            self.write_snapshot()
+            self.messages.put((cmd[0], None))
+
+    def send_profile(self) -> None:
+        # Send the statistics for the Task loop to the GUI
+        if self.profile is not None:
+            self.profile.create_stats()
+            self.messages.put(("profile", self.profile.stats))
+            self.profile = None
+
+    def write_snapshot(self) -> None:
+        snapshot = {
+            "task": data_attributes(self.task, ("events", "logged_events", "metadata")),
+            "components": {cid: data_attributes(component, ("id", "address")) for cid, component in self.components.items()},
+            "sub_task": None,
+            "complete": self.complete,
+            "timing": {name: h for name, h in self.timing.histograms.items() if name not in GUI_MEASURES},
+            "overruns": self.timing.overruns
+        }
+        cur_task = getattr(self.task, "cur_task", None)
+        if cur_task is not None:
+            snapshot["sub_task"] = (type(cur_task).__module__, type(cur_task).__name__,
+                                    data_attributes(cur_task, ("events", "logged_events", "metadata")))
+        data = pickle.dumps(snapshot, pickle.HIGHEST_PROTOCOL)
+        if HEADER.size + len(data) > self.shm.size:
+            # Move to a block twice as large as needed and let the GUI attach to it. The GUI unlinks the old block.
+            print("Chamber {} snapshot of {} bytes exceeds the shared memory block, growing it".format(
+                self.chamber + 1, len(data)))
+            with self.shm_lock:
+                self.shm.close()
+                self.shm = shared_memory.SharedMemory(create=True, size=2 * (HEADER.size + len(data)))
+                HEADER.pack_into(self.shm.buf, 0, 0, 0)
+            resized = True
+        else:
+            resized = False
+        self.sequence += 1
+        with self.shm_lock:
+            HEADER.pack_into(self.shm.buf, 0, self.sequence, len(data))
+            self.shm.buf[HEADER.size:HEADER.size + len(data)] = data
+        if resized:  # Only tell the GUI once the new block holds a snapshot
+            self.messages.put(("snapshot_memory", self.shm.name))
+
+    def log_events(self, _) -> None:
+        events = self.task.take_events__()
+        if len(events) > 0:
+            self.messages.put(("events", list(events)))  # Copied as the queue sends the Events after the list is reused
+
+    # noinspection PyMethodMayBeStatic
+    def switch_task(self, task_base: Task, task_name: type[Task], protocol: str = None) -> Task:
+        return task_name(task_base, task_base.components, protocol)
+
+
+class ChamberProcessError(Exception):
+    pass
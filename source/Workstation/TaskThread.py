@@ -0,0 +1,133 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from Workstation.Workstation import Workstation
+
+import threading
+import time
+
+from Utilities.ChamberProfiler import ChamberProfiler
+from Utilities.LoopTiming import LoopTiming
+from Utilities.timer_resolution import timer_resolution
+
+
+class TaskThread(threading.Thread):
+    """
+        Thread that runs the logic loop of the Task in a single chamber at a fixed rate independent of the GUI.
+
+        Parameters
+        ----------
+        ws : Workstation
+            The Workstation the chamber belongs to
+        chamber : int
+            The index of the chamber whose Task this thread runs
+
+        Attributes
+        ----------
+        lock : RLock
+            Lock held while the Task is being updated. The GUI acquires it to read a consistent snapshot of the Task.
+        complete : bool
+            Boolean indicating the Task has completed and is waiting to be stopped by the Workstation
+        running : bool
+            Boolean indicating the thread should continue running
+        timing : LoopTiming
+            Timing statistics for the Task loop and GUI updates of the chamber
+        profiler : ChamberProfiler
+            Profiler for the chamber if one is currently running
+
+        Methods
+        -------
+        run()
+            Repeatedly calls main_loop__ on the Task every loop_period seconds
+        step()
+            Runs a single iteration of the Task loop
+        update()
+            Does nothing as the Task is shared directly with the GUI
+        start_task(), pause_task(), resume_task(), stop_task()
+            Controls the Task
+        start_profile(duration)
+            Profiles the Task loop for duration seconds
+        stop_profile()
+            Ends profiling and returns the ChamberProfiler
+        stop()
+            Signals the thread to exit and waits for it to finish
+    """
+
+    def __init__(self, ws: Workstation, chamber: int):
+        super(TaskThread, self).__init__(daemon=True)
+        self.ws = ws
+        self.chamber = chamber
+        self.lock = threading.RLock()
+        self.complete = False
+        self.running = True
+        self.timing = LoopTiming()
+        self.profiler = None
+
+    def run(self) -> None:
+        # pygame raises the timer resolution for the GUI Workstation but HeadlessWorkstation never initialises it
+        with timer_resolution():
+            next_time = time.perf_counter()
+            while self.running:
+                period = self.step()
+                next_time += period
+                delay = next_time - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                else:  # The loop overran its period so restart the schedule rather than trying to catch up
+                    next_time = time.perf_counter()
+
+    def step(self) -> float:
+        """
+        Runs a single iteration of the Task loop and returns the loop period of the Task.
+        """
+        with self.lock:
+            task = self.ws.tasks[self.chamber]
+            # Only run the Task if it has been started, is not paused, and has not yet been flagged as complete
+            if task.started and not task.paused and not self.complete:
+                start = time.perf_counter()
+                if self.profiler is not None:
+                    self.profiler.run_logic(task.main_loop__)
+                else:
+                    task.main_loop__()
+                self.timing.record_loop(start, time.perf_counter(), task.loop_period)
+                if task.is_complete():
+                    self.complete = True  # The Workstation will stop the Task from the GUI thread
+            return task.loop_period
+
+    def update(self) -> None:
+        pass
+
+    def start_task(self) -> None:
+        with self.lock:
+            self.complete = False
+            self.timing.add_sources(self.ws.tasks[self.chamber].sources)
+            self.timing.reset()
+            self.ws.tasks[self.chamber].start__()
+
+    def pause_task(self) -> None:
+        with self.lock:
+            self.ws.tasks[self.chamber].pause__()
+
+    def resume_task(self) -> None:
+        with self.lock:
+            self.timing.last_start = None  # Time spent paused should not count towards the loop period
+            self.ws.tasks[self.chamber].resume__()
+
+    def stop_task(self) -> None:
+        with self.lock:
+            self.ws.tasks[self.chamber].stop__()
+            self.complete = False
+
+    def start_profile(self, duration: float) -> None:
+        self.profiler = ChamberProfiler(duration)
+
+    def stop_profile(self) -> ChamberProfiler:
+        with self.lock:  # Wait for the Task loop to finish with the profiler
+            profiler = self.profiler
+            self.profiler = None
+        return profiler
+
+    def stop(self) -> None:
+        self.running = False
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join()
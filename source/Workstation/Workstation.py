@@ -11,15 +11,21 @@ import signal
 
 import math
 import atexit
-from typing import Type
+import time
+from typing import Type, Callable, Any
 
 from GUIs import Colors
 from Elements.LabelElement import LabelElement
+from Events.GUIEventLogger import GUIEventLogger
 import pygame
 
 from Sources.EmptySource import EmptySource
 from Sources.EmptyTouchScreenSource import EmptyTouchScreenSource
 from Workstation.WorkstationGUI import WorkstationGUI
+from Workstation.TaskThread import TaskThread
+from Workstation.LoggerThread import LoggerThread
+from Workstation.TaskProcess import TaskProcess, ProxySource, source_expressions
+from Utilities.Clock import Clock
 
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
@@ -32,8 +38,7 @@ from screeninfo import get_monitors
 class Workstation:
 
     def __init__(self):
-        self.tasks = {}
-        self.event_loggers = {}
+        self.init_chambers()
 
         # Core application details
         QCoreApplication.setOrganizationName("TNEL")
@@ -52,17 +57,45 @@ class Workstation:
                 if isclass(attribute):
                     # Add the class to this package's variables
                     globals()[attribute_name] = attribute
-        if settings.contains("sources"):
-            self.sources = eval(settings.value("sources"))
-        else:
-            self.sources = {"es": EmptySource(), "etss": EmptyTouchScreenSource("(1024, 768)")}
+        if not settings.contains("sources"):
             settings.setValue("sources", '{"es": EmptySource(), "etss": EmptyTouchScreenSource("(1024, 768)")}')
+        # Store whether each chamber should run in its own process
+        if settings.contains("process_mode"):
+            self.process_mode = bool(int(settings.value("process_mode")))
+        else:
+            self.process_mode = False
+            settings.setValue("process_mode", 0)
+        if self.process_mode:  # Sources are only connected to from the chamber processes
+            self.sources = {name: ProxySource(name, expression.split("(")[0])
+                            for name, expression in source_expressions(settings.value("sources")).items()}
+        else:
+            self.sources = eval(settings.value("sources"))
         # Store the number of available chambers
         if settings.contains("n_chamber"):
             self.n_chamber = int(settings.value("n_chamber"))
         else:
             self.n_chamber = 1
             settings.setValue("n_chamber", self.n_chamber)
+        # Store the maximum rate the GUI should be redrawn at
+        if settings.contains("pygame/fps"):
+            self.fps = int(settings.value("pygame/fps"))
+        else:
+            self.fps = 60
+            settings.setValue("pygame/fps", self.fps)
+        # Store whether only chambers whose GUIs have changed should be redrawn
+        if settings.contains("pygame/dirty_rendering"):
+            self.dirty_rendering = bool(int(settings.value("pygame/dirty_rendering")))
+        else:
+            self.dirty_rendering = False
+            settings.setValue("pygame/dirty_rendering", 0)
+        # Store whether EventLoggers without widgets should log on their own threads
+        if settings.contains("logging/async"):
+            self.async_logging = bool(int(settings.value("logging/async")))
+        else:
+            self.async_logging = False
+            settings.setValue("logging/async", 0)
+        self.logging_queue_size = int(settings.value("logging/queue_size", 100000))
+        self.logging_overflow = settings.value("logging/overflow", "block")
 
         # Store the position of the pygame window
         if settings.contains("pygame/offset"):
@@ -86,7 +119,6 @@ class Workstation:
         else:
             self.compute_chambergui()
 
-        self.guis = {}
         app = QApplication(sys.argv)
         self.wsg = WorkstationGUI(self)
         atexit.register(self.exit_handler)
@@ -94,6 +126,22 @@ class Workstation:
         signal.signal(signal.SIGINT, self.exit_handler)
         sys.exit(app.exec())
 
+    def init_chambers(self) -> None:
+        """
+        Creates the empty collections that hold the Tasks, EventLoggers, and GUIs of each chamber along with the Clock
+        shared by all Tasks. Called before any settings are loaded or chambers are added.
+        """
+        self.tasks = {}
+        self.event_loggers = {}
+        self.task_runners = {}
+        self.profile_paths = {}
+        self.logger_threads = {}
+        self.guis = {}
+        self.subject_labels = {}
+        self.full_redraw = True
+        self.drawn_subjects = {}
+        self.clock = Clock()  # Source of time for all Tasks
+
     def compute_chambergui(self) -> None:
         settings = QSettings()
         szo = pygame.display.get_desktop_sizes()
@@ -118,6 +166,7 @@ class Workstation:
         settings.setValue("pyqt/w", int(szo[0] / 6))
         settings.setValue("pyqt/h", int(szo[1] - 70))
         self.task_gui = pygame.display.set_mode((self.w * self.n_col, self.h * self.n_row), pygame.RESIZABLE, 32)
+        self.full_redraw = True
 
     def add_task(self, chamber: int, task_name: str, address_file: str, protocol: str, task_event_loggers: list[EventLogger]) -> None:
         """
@@ -140,7 +189,18 @@ class Workstation:
         task_module = importlib.import_module("Tasks." + task_name)
         task = getattr(task_module, task_name)
         metadata = {"chamber": chamber, "subject": "default"}
-        self.tasks[chamber] = task(self, metadata, self.sources, address_file, protocol)  # Create the task
+        if self.process_mode:
+            # Run the Task logic in its own process and create a copy of the Task for the GUI
+            runner = TaskProcess(self, chamber, task_name, address_file, protocol, QSettings().value("sources"))
+            sources = {name: ProxySource(name, src.source_type, runner, runner.display_sizes.get(name))
+                       for name, src in self.sources.items()}
+            self.tasks[chamber] = task(self, metadata, sources, address_file, protocol)
+        else:
+            # Run the Task logic on its own thread
+            runner = TaskThread(self, chamber)
+            self.tasks[chamber] = task(self, metadata, self.sources, address_file, protocol)  # Create the task
+            runner.start()
+        self.task_runners[chamber] = runner
         self.event_loggers[chamber] = task_event_loggers
         for logger in task_event_loggers:
             logger.set_task(self.tasks[chamber])
@@ -152,6 +212,8 @@ class Workstation:
         # Create the GUI
         self.guis[chamber] = gui(self.task_gui.subsurface(col * self.w, row * self.h, self.w, self.h),
                                  self.tasks[chamber])
+        self.subject_labels[chamber] = LabelElement(self.guis[chamber], 10, self.h - 30, self.w, 20,
+                                                    self.tasks[chamber].metadata["subject"], SF=1)
 
     def switch_task(self, task_base: Task, task_name: Type[Task], protocol: str = None) -> Task:
         """
@@ -188,6 +250,11 @@ class Workstation:
         chamber : int
             The chamber from which a Task should be removed
         """
+        if self.task_runners[chamber].profiler is not None:
+            self.stop_profile(chamber)
+        self.task_runners[chamber].stop()  # Stop running the Task logic
+        del self.task_runners[chamber]
+        self.stop_logger_threads(chamber)
         if del_loggers:
             for el in self.event_loggers[chamber]:  # Close all associated EventLoggers
                 el.close()
@@ -196,6 +263,8 @@ class Workstation:
         del self.tasks[chamber]
         del self.event_loggers[chamber]
         del self.guis[chamber]
+        del self.subject_labels[chamber]
+        self.full_redraw = True  # Clear the GUI of the removed Task
 
     def start_task(self, chamber: int) -> None:
         """
@@ -206,11 +275,39 @@ class Workstation:
         chamber : int
             The chamber corresponding to the Task that should be started
         """
-        self.tasks[chamber].start__()  # Start the Task
-        for el in self.event_loggers[chamber]:  # Start all EventLoggers and log initial events
-            el.start()
-            el.log_events(self.tasks[chamber].events)
-        self.tasks[chamber].events = []
+        with self.task_runners[chamber].lock:
+            self.task_runners[chamber].start_task()  # Start the Task
+            for el in self.event_loggers[chamber]:  # Start all EventLoggers
+                el.start()
+        if self.async_logging:
+            self.start_logger_threads(chamber)
+        self.log_events(chamber)  # Log initial events
+
+    def pause_task(self, chamber: int) -> None:
+        """
+        Pause the Task in the specified chamber.
+
+        Parameters
+        ----------
+        chamber : int
+            The chamber corresponding to the Task that should be paused
+        """
+        with self.task_runners[chamber].lock:
+            self.task_runners[chamber].pause_task()
+        self.log_events(chamber)
+        self.flush_loggers(chamber)  # Make sure everything up to the pause is on disk
+
+    def resume_task(self, chamber: int) -> None:
+        """
+        Resume the Task in the specified chamber.
+
+        Parameters
+        ----------
+        chamber : int
+            The chamber corresponding to the Task that should be resumed
+        """
+        with self.task_runners[chamber].lock:
+            self.task_runners[chamber].resume_task()
 
     def stop_task(self, chamber: int) -> None:
         """
@@ -221,37 +318,139 @@ class Workstation:
         chamber : int
             The chamber corresponding to the Task that should be stopped
         """
-        self.tasks[chamber].stop__()  # Stop the task
-        for el in self.event_loggers[chamber]:  # Log remaining events
-            el.log_events(self.tasks[chamber].events)
-        self.tasks[chamber].events = []
+        with self.task_runners[chamber].lock:
+            self.task_runners[chamber].stop_task()  # Stop the task
+        self.log_events(chamber)  # Log remaining events
+        self.stop_logger_threads(chamber)  # Wait for the remaining events to be written
+        self.flush_loggers(chamber)
 
     def loop(self) -> None:
         """
-        Master event loop for all Tasks. Handles Task logic, GUI updates, and Task Events.
+        Master GUI loop for all Tasks. Handles GUI updates and Task Events. Task logic is run separately by each
+        chamber's TaskThread or TaskProcess. If dirty rendering is enabled, only chambers whose GUIs have changed are
+        redrawn and updated on the display.
         """
-        self.task_gui.fill(Colors.black)
         events = pygame.event.get()  # Get mouse/keyboard events
-        for key in self.tasks:  # For each Task
-            if self.tasks[key].started and not self.tasks[key].paused:  # If the Task has been started and is not paused
-                self.tasks[key].main_loop__()  # Run the Task's logic loop
-                self.guis[key].handle_events(events)  # Handle mouse/keyboard events with the Task GUI
-                self.log_events(key)  # Log Events with all associated EventLoggers
-                if self.tasks[key].is_complete():  # Stop the Task if it is complete
-                    self.wsg.chambers[key].stop()
-            self.guis[key].draw()  # Update the GUI
-            # Draw GUI border and subject name
-            col = key % self.n_col
-            row = math.floor(key / self.n_col)
-            pygame.draw.rect(self.task_gui, Colors.white, pygame.Rect(col * self.w, row * self.h, self.w, self.h), 1)
-            LabelElement(self.guis[key], 10, self.h - 30, self.w, 20,
-                         self.tasks[key].metadata["subject"], SF=1).draw()
-        pygame.display.flip()  # Signal to pygame that the whole GUI has updated
+        if any(event.type in (pygame.VIDEORESIZE, pygame.VIDEOEXPOSE) for event in events):
+            self.full_redraw = True  # The window contents may have been lost
+        full_redraw = self.full_redraw or not self.dirty_rendering
+        self.full_redraw = False
+        if full_redraw:
+            self.task_gui.fill(Colors.black)
+        updated = []
+        for key in list(self.tasks):  # For each Task
+            self.task_runners[key].update()  # Copy the latest state of the Task if it runs in another process
+            if self.task_runners[key].profiler is not None and self.task_runners[key].profiler.finished():
+                self.wsg.chambers[key].stop_profile()
+            if self.task_runners[key].complete:  # Stop the Task if it is complete
+                self.wsg.chambers[key].stop()
+            timing = self.task_runners[key].timing
+            with self.task_runners[key].lock:  # Prevent the Task from updating while its GUI is handled
+                if self.tasks[key].started and not self.tasks[key].paused:  # If the Task has been started and is not paused
+                    start = time.perf_counter()
+                    self.run_profiled(key, self.guis[key].handle_events, events)  # Handle mouse/keyboard events with the Task GUI
+                    timing.add("handle_events", time.perf_counter() - start)
+                # Skip drawing if nothing in the GUI or the subject name has changed since the last frame
+                redraw = self.guis[key].has_changed() or self.drawn_subjects.get(key) != self.tasks[key].metadata["subject"]
+                if full_redraw or redraw:
+                    start = time.perf_counter()
+                    self.run_profiled(key, self.guis[key].draw)  # Update the GUI
+                    timing.add("draw", time.perf_counter() - start)
+            self.log_events(key)  # Log Events with all associated EventLoggers
+            if full_redraw or redraw:
+                # Draw GUI border and subject name
+                col = key % self.n_col
+                row = math.floor(key / self.n_col)
+                rect = pygame.Rect(col * self.w, row * self.h, self.w, self.h)
+                pygame.draw.rect(self.task_gui, Colors.white, rect, 1)
+                self.subject_labels[key].text = self.tasks[key].metadata["subject"]
+                self.subject_labels[key].draw()
+                self.drawn_subjects[key] = self.tasks[key].metadata["subject"]
+                updated.append(rect)
+        if full_redraw:
+            pygame.display.flip()  # Signal to pygame that the whole GUI has updated
+        elif len(updated) > 0:
+            pygame.display.update(updated)  # Only update the chambers that were redrawn
 
     def log_events(self, chamber: int) -> None:
+        # Take the Events from the Task so the logic thread can continue while they are logged
+        with self.task_runners[chamber].lock:
+            events = self.tasks[chamber].take_events__()
+        start = time.perf_counter()
+        threads = self.logger_threads.get(chamber, {})
         for el in self.event_loggers[chamber]:
-            el.log_events(self.tasks[chamber].events)
-        self.tasks[chamber].events = []
+            if el in threads:  # Queue the events for the EventLogger's own thread
+                threads[el].put(events)
+            else:
+                self.run_profiled(chamber, el.log_events, events)
+        self.task_runners[chamber].timing.add("log_events", time.perf_counter() - start)
+
+    def start_logger_threads(self, chamber: int) -> None:
+        """
+        Log events for the specified chamber with a LoggerThread for each EventLogger that does not have a widget.
+        EventLoggers with widgets are still called from the GUI thread.
+
+        Parameters
+        ----------
+        chamber : int
+            The chamber whose EventLoggers should log asynchronously
+        """
+        self.logger_threads[chamber] = {}
+        for el in self.event_loggers[chamber]:
+            if not isinstance(el, GUIEventLogger):
+                self.logger_threads[chamber][el] = LoggerThread(el, self.logging_queue_size, self.logging_overflow)
+                self.logger_threads[chamber][el].start()
+
+    def stop_logger_threads(self, chamber: int) -> None:
+        # Log all queued events and return to logging from the GUI thread
+        for thread in self.logger_threads.pop(chamber, {}).values():
+            thread.stop()
+
+    def flush_loggers(self, chamber: int) -> None:
+        # Write out any events the EventLoggers have buffered once the logger threads are idle
+        for thread in self.logger_threads.get(chamber, {}).values():
+            thread.drain()
+        for el in self.event_loggers[chamber]:
+            el.flush()
+
+    def start_profile(self, chamber: int, duration: float, output_folder: str) -> None:
+        """
+        Profile the Task loop, GUI, and EventLoggers in the specified chamber. Profiling can be started while the Task
+        is running.
+
+        Parameters
+        ----------
+        chamber : int
+            The chamber corresponding to the Task that should be profiled
+        duration : float
+            The length of time in seconds to profile for
+        output_folder : str
+            The folder the profile should be saved in
+        """
+        self.profile_paths[chamber] = "{}{}-profile.prof".format(output_folder, math.floor(time.time() * 1000))
+        self.task_runners[chamber].start_profile(duration)
+
+    def stop_profile(self, chamber: int) -> str:
+        """
+        Stop profiling the specified chamber and save the profile. Returns the path to the profile or None if nothing
+        was profiled.
+
+        Parameters
+        ----------
+        chamber : int
+            The chamber corresponding to the Task that is being profiled
+        """
+        profiler = self.task_runners[chamber].stop_profile()
+        if profiler is not None and profiler.save(self.profile_paths[chamber]):
+            return self.profile_paths[chamber]
+        return None
+
+    def run_profiled(self, chamber: int, func: Callable, *args: Any) -> Any:
+        # Call func from the GUI thread, profiling it if the chamber is being profiled
+        profiler = self.task_runners[chamber].profiler
+        if profiler is None:
+            return func(*args)
+        return profiler.run_gui(func, *args)
 
     def exit_handler(self, _):
         """
@@ -260,5 +459,6 @@ class Workstation:
         for key in self.tasks:  # Stop all Tasks
             if self.tasks[key].started:
                 self.stop_task(key)
+            self.task_runners[key].stop()
         for src in self.sources:  # Close all Sources
             self.sources[src].close_source()
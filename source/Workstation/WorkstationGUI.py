@@ -60,10 +60,10 @@ class WorkstationGUI(QWidget):
         self.chambers = {}
         self.chamber_container.addStretch(1)
 
-        # Callback to pygame (once every millisecond)
+        # Callback to pygame (capped at the configured frame rate, Task logic runs separately)
         self.timer = QTimer()
         self.timer.timeout.connect(self.workstation.loop)
-        self.timer.setInterval(1)
+        self.timer.setInterval(int(1000 / self.workstation.fps))
         self.timer.start()
 
         self.setLayout(self.chamber_container)
@@ -2,8 +2,9 @@ from Workstation.Workstation import Workstation
 import faulthandler
 import os
 
-faulthandler.enable()
-desktop = os.path.join(os.path.join(os.path.expanduser('~')), 'Desktop')
-if not os.path.exists("{}\\py-behav\\".format(desktop)):
-    os.mkdir("{}\\py-behav\\".format(desktop))
-ws = Workstation()
+if __name__ == "__main__":  # Chamber processes import this module when they are spawned
+    faulthandler.enable()
+    desktop = os.path.join(os.path.join(os.path.expanduser('~')), 'Desktop')
+    if not os.path.exists("{}\\py-behav\\".format(desktop)):
+        os.mkdir("{}\\py-behav\\".format(desktop))
+    ws = Workstation()
@@ -0,0 +1,45 @@
+import os
+os.environ["SDL_VIDEODRIVER"] = os.environ.get("SDL_VIDEODRIVER", "dummy")  # Must be set before pygame is imported
+from Workstation.BenchmarkWorkstation import BenchmarkWorkstation, system_info
+import argparse
+import json
+import time
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure how the cost of the Workstation loop grows with the number "
+                                                 "of chambers")
+    parser.add_argument("--chambers", type=int, nargs="+", default=[1, 4, 8, 16, 32, 64],
+                        help="Chamber counts to benchmark")
+    parser.add_argument("--tasks", nargs="+", default=["FiveChoice", "PMA", "DPAL", "ClosedLoop"],
+                        help="Tasks to benchmark. Each Task is benchmarked alone and all are benchmarked together.")
+    parser.add_argument("--duration", type=float, default=5, help="Seconds to measure each configuration for")
+    parser.add_argument("--warmup", type=float, default=1, help="Seconds to run each configuration before measuring")
+    parser.add_argument("--dirty-rendering", action="store_true", help="Only redraw chambers whose GUIs have changed")
+    parser.add_argument("--no-logging", action="store_true", help="Do not save Events")
+    parser.add_argument("--async-logging", action="store_true", help="Save Events from background threads")
+    parser.add_argument("--output", default="benchmark-{}.json".format(time.strftime("%Y%m%d-%H%M%S")),
+                        help="JSON file the results are saved to")
+    args = parser.parse_args()
+    configurations = [[task] for task in args.tasks]
+    if len(args.tasks) > 1:
+        configurations.append(args.tasks)
+    results = []
+    for task_names in configurations:
+        for n_chamber in args.chambers:
+            ws = BenchmarkWorkstation(n_chamber, dirty_rendering=args.dirty_rendering, log_events=not args.no_logging,
+                                      async_logging=args.async_logging)
+            try:
+                ws.add_chambers(task_names)
+                result = ws.run(args.duration, args.warmup)
+            finally:
+                ws.close()
+            results.append(result)
+            print("{:<40}{:>4} chambers: {:>9.1f} loops/s, {:>7.3f} ms/loop, {:>9.1f} task loops/s/chamber".format(
+                "+".join(task_names), n_chamber, result["loops_per_second"], result["loop_ms"]["mean"],
+                result["task_loops_per_second"]))
+    with open(args.output, "w") as out:
+        json.dump({"created": time.strftime("%Y-%m-%d %H:%M:%S"), "system": system_info(), "duration": args.duration,
+                   "dirty_rendering": args.dirty_rendering, "logging": not args.no_logging,
+                   "async_logging": args.async_logging, "results": results},
+                  out, indent=2)
+    print("Saved results to {}".format(args.output))
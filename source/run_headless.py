@@ -0,0 +1,28 @@
+from Utilities.SimulatedClock import SimulatedClock
+from Workstation.HeadlessWorkstation import HeadlessWorkstation
+import argparse
+import faulthandler
+
+if __name__ == "__main__":
+    faulthandler.enable()
+    parser = argparse.ArgumentParser(description="Run chamber configurations without the Workstation GUI")
+    parser.add_argument("configurations", nargs="+", help="Configuration files saved from ChamberWidgets")
+    parser.add_argument("--sources", help="Dictionary of Sources in the same format as the sources setting. "
+                                          "Defaults to the sources saved by the Workstation.")
+    parser.add_argument("--output", help="Folder data will be saved in. Defaults to Desktop/py-behav/.")
+    parser.add_argument("--simulate", type=float, metavar="STEP",
+                        help="Run the Tasks on a simulated clock that advances STEP seconds per Task loop rather than "
+                             "in real time")
+    args = parser.parse_args()
+    source_string = args.sources
+    if source_string is None:  # Use the Sources configured in the Workstation settings
+        from PyQt5.QtCore import QCoreApplication, QSettings
+        QCoreApplication.setOrganizationName("TNEL")
+        QCoreApplication.setOrganizationDomain("tnelab.org")
+        QCoreApplication.setApplicationName("Pybehav")
+        source_string = QSettings().value("sources", '{"es": EmptySource()}')
+    clock = SimulatedClock(step=args.simulate) if args.simulate is not None else None
+    ws = HeadlessWorkstation(source_string, args.output, clock=clock)
+    for configuration in args.configurations:
+        ws.add_configuration(configuration)
+    ws.run()
@@ -0,0 +1,29 @@
+from Workstation.BatchSimulation import BatchSimulation
+import argparse
+import faulthandler
+
+if __name__ == "__main__":
+    faulthandler.enable()
+    parser = argparse.ArgumentParser(description="Simulate sessions of a Task for virtual subjects")
+    parser.add_argument("task", help="The name of the Task class")
+    parser.add_argument("--address-file", default="", help="AddressFile for the Task. Every Source it references is "
+                                                           "replaced with an EmptySource.")
+    parser.add_argument("--protocols", nargs="*", default=[], help="Protocols to simulate. Defaults to the Task "
+                                                                    "defaults.")
+    parser.add_argument("--subjects", type=int, default=1, help="Number of virtual subjects per Protocol")
+    parser.add_argument("--policy", help='BehaviorPolicy driving the inputs, for example "LeverPressPolicy(rate=0.2)"')
+    parser.add_argument("--step", type=float, default=0.01, help="Simulated seconds per task loop")
+    parser.add_argument("--time-limit", type=float, default=4 * 60 * 60,
+                        help="Simulated seconds after which incomplete sessions are stopped")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the first virtual subject")
+    parser.add_argument("--workers", type=int, help="Number of processes. Defaults to the number of CPUs.")
+    parser.add_argument("--output", help="Folder data will be saved in. Defaults to Desktop/py-behav/.")
+    args = parser.parse_args()
+    simulation = BatchSimulation(args.task, args.address_file, args.protocols, args.subjects, args.policy, args.step,
+                                 args.output, args.time_limit, args.seed)
+    results = simulation.run(args.workers)
+    failed = [result for result in results if result["error"] is not None]
+    for result in failed:
+        print("\n{} ({}) failed:\n{}".format(result["subject"], result["protocol"], result["error"]))
+    print("{} of {} sessions completed, {} failed".format(sum(result["complete"] for result in results), len(results),
+                                                          len(failed)))
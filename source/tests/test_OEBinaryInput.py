@@ -0,0 +1,68 @@
+import unittest
+
+from Components.OEBinaryInput import OEBinaryInput
+from Sources.Source import Source
+
+
+class PushSource(Source):
+
+    def register_component(self, task, component):
+        pass
+
+    def close_source(self):
+        pass
+
+    def read_component(self, component_id):
+        return []
+
+    def write_component(self, component_id, msg):
+        pass
+
+    def pushes_inputs(self):
+        return True
+
+
+def ttl(state: bool) -> dict:
+    return {'type': 'ttl', 'channel': 0, 'data': state, 'metaData': {'Direction': '1' if state else '0'}}
+
+
+class TestOEBinaryInput(unittest.TestCase):
+
+    def setUp(self):
+        self.input = OEBinaryInput(PushSource(), "ttl", "1")
+
+    def test_events_are_handled_in_arrival_order(self):
+        for i, state in enumerate([True, False, True, False]):
+            self.input.receive(ttl(state), i)
+        changes = [self.input.check() for _ in range(5)]
+        self.assertEqual(changes, [OEBinaryInput.ENTERED, OEBinaryInput.EXIT, OEBinaryInput.ENTERED,
+                                   OEBinaryInput.EXIT, OEBinaryInput.NO_CHANGE])
+        self.assertFalse(self.input.get_state())
+        self.assertEqual(self.input.change_time, 3)
+
+    def test_input_is_not_stuck_after_a_burst(self):
+        for i, state in enumerate([True, False]):
+            self.input.receive(ttl(state), i)
+        self.assertEqual(self.input.check(), OEBinaryInput.ENTERED)
+        self.assertEqual(self.input.check(), OEBinaryInput.EXIT)
+        self.input.receive(ttl(True), 2)
+        self.assertEqual(self.input.check(), OEBinaryInput.ENTERED)
+        self.assertTrue(self.input.get_state())
+
+    def test_repeated_events_do_not_change_state(self):
+        for i, state in enumerate([True, True, False]):
+            self.input.receive(ttl(state), i)
+        changes = [self.input.check() for _ in range(3)]
+        self.assertEqual(changes, [OEBinaryInput.ENTERED, OEBinaryInput.NO_CHANGE, OEBinaryInput.EXIT])
+
+    def test_rising_and_falling_edges(self):
+        self.input.falling = True
+        self.input.receive({'type': 'ttl', 'channel': 0, 'data': True, 'metaData': {'Direction': '0'}}, 0)
+        self.input.receive(ttl(True), 1)
+        self.input.receive(ttl(False), 2)
+        changes = [self.input.check() for _ in range(3)]
+        self.assertEqual(changes, [OEBinaryInput.NO_CHANGE, OEBinaryInput.ENTERED, OEBinaryInput.EXIT])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+from collections import deque
+
+from Components.BinaryInput import BinaryInput
+from Sources.Source import Source
+from Tasks.Task import Task
+from Utilities.Clock import Clock
+
+
+class PushSource(Source):
+
+    def register_component(self, task, component):
+        pass
+
+    def close_source(self):
+        pass
+
+    def read_component(self, component_id):
+        return False
+
+    def write_component(self, component_id, msg):
+        pass
+
+    def pushes_inputs(self):
+        return True
+
+
+class IdleTask:
+    # Holds only the attributes of a Task used to publish and deliver inputs
+
+    def __init__(self):
+        self.started = False
+        self.paused = False
+        self.clock = Clock()
+        self.input_queue = deque()
+
+    handle_inputs__ = Task.handle_inputs__
+
+
+class TestPublishInput(unittest.TestCase):
+
+    def setUp(self):
+        self.source = PushSource()
+        self.task = IdleTask()
+        self.input = BinaryInput(self.source, "lever", "0")
+
+    def publish(self, *values):
+        for value in values:
+            self.source.publish_input(self.task, self.input, value)
+
+    def test_inputs_are_dropped_before_the_task_starts(self):
+        self.publish(True, False, True)
+        self.assertEqual(len(self.task.input_queue), 0)
+
+    def test_inputs_are_dropped_while_paused(self):
+        self.task.started = True
+        self.publish(True)
+        self.task.paused = True
+        self.publish(False, True, False)
+        self.task.paused = False
+        self.task.handle_inputs__()
+        self.assertEqual(self.input.check(), BinaryInput.ENTERED)
+        self.assertEqual(self.input.check(), BinaryInput.NO_CHANGE)
+
+    def test_inputs_are_delivered_while_running(self):
+        self.task.started = True
+        self.publish(True, False)
+        self.task.handle_inputs__()
+        self.assertEqual([self.input.check() for _ in range(3)],
+                         [BinaryInput.ENTERED, BinaryInput.EXIT, BinaryInput.NO_CHANGE])
+
+
+if __name__ == '__main__':
+    unittest.main()